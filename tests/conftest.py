@@ -1,9 +1,70 @@
 import pytest
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from turtle_invaders.app import App
 from turtle_invaders.spaceships import SpaceShip, Invader
 from turtle_invaders.bullet import Bullet
 from turtle_invaders.fortresses import Fortress
 from turtle_invaders.constants import ObjectDirection
+from turtle_invaders.world import World, BulletState, InvaderState, FortressState
+
+
+class FakeClock:
+    """Clock of tests, advanced by setting <time> or by sleep()."""
+
+    def __init__(self) -> None:
+        self.time = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.time += seconds
+
+
+class FakeCanvas:
+    def __init__(self) -> None:
+        self.moves = []
+
+    def move(self, tag: str, dx: float, dy: float) -> None:
+        self.moves.append((tag, dx, dy))
+
+
+class FakeScreen:
+    """Screen of tests which counts updates and keeps bound key callbacks."""
+
+    xscale = 1.0
+    yscale = 1.0
+
+    def __init__(self) -> None:
+        self.updates = 0
+        self.canvas = FakeCanvas()
+        self.pressed: dict[str | None, Callable[[], None]] = {}
+        self.released: dict[str, Callable[[], None]] = {}
+
+    def update(self) -> None:
+        self.updates += 1
+
+    def getcanvas(self) -> FakeCanvas:
+        return self.canvas
+
+    def onkeypress(self, fun, key=None) -> None:
+        self.pressed[key] = fun
+
+    def onkeyrelease(self, fun, key) -> None:
+        self.released[key] = fun
+
+
+@pytest.fixture
+def clock_fixture() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def screen_fixture() -> FakeScreen:
+    return FakeScreen()
 
 
 @pytest.fixture
@@ -17,8 +78,10 @@ def invader_fixture() -> Invader:
 
 
 @pytest.fixture
-def app_fixture() -> App:
-    return App()
+def app_fixture(tmp_path: Path) -> Iterator[App]:
+    app = App(data_dir=tmp_path)
+    yield app
+    app.scores.close()
 
 
 @pytest.fixture
@@ -29,3 +92,23 @@ def bullet_fixture() -> Bullet:
 @pytest.fixture
 def fortress_fixture() -> Fortress:
     return Fortress(0, 0)
+
+
+@pytest.fixture
+def world_fixture() -> World:
+    return World(seed=0)
+
+
+@pytest.fixture
+def bullet_state_fixture() -> BulletState:
+    return BulletState(0, 0, ObjectDirection.NORTH, "white")
+
+
+@pytest.fixture
+def invader_state_fixture() -> InvaderState:
+    return InvaderState(0, 0)
+
+
+@pytest.fixture
+def fortress_state_fixture() -> FortressState:
+    return FortressState(0, 0)
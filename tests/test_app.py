@@ -1,144 +1,33 @@
-import pytest
-from pytest import MonkeyPatch
-from tests.conftest import Bullet, Invader, App
-from time import perf_counter
+import json
+from pathlib import Path
+from tests.conftest import App
+from turtle_invaders.scores import RunStats
+from turtle_invaders.tools import TaskPriority
 
 
-def test_initialize_invaders(app_fixture: App) -> None:
-    app_fixture.initialize_invaders()
-    assert len(app_fixture.invaders) > 0
-
-
-def test_initialize_fortresses(app_fixture: App) -> None:
-    app_fixture.initialize_fortresses(300, amount=4)
-    assert len(app_fixture.fortresses) == 4
-
-
-def test_initialize_fortressesV2(app_fixture: App) -> None:
-    app_fixture.initialize_fortressesV2(300)
-    assert len(app_fixture.fortresses) == 4 * 2
-
-
-def test_mark_all_bullets_for_removal(app_fixture: App, bullet_fixture: Bullet) -> None:
-    app_fixture.bullets.append(bullet_fixture)
-    app_fixture.mark_all_bullets_for_removal()
-    assert app_fixture.tasks_main.qsize() == 1
-    assert bullet_fixture in app_fixture.garbage and len(app_fixture.garbage) == 1
-
-
-# test_move_invaders
-
-
-def test_move_bullets(app_fixture: App, bullet_fixture: Bullet) -> None: 
-    app_fixture.bullets = [bullet_fixture]
-    app_fixture.cooldown_bullet_last_move = perf_counter() - 30
-    app_fixture.move_bullets()
-    assert bullet_fixture.ycor() == 1
-
-
-def test_move_bullets_cooldown(app_fixture: App, bullet_fixture: Bullet) -> None:
-    app_fixture.bullets = [bullet_fixture]
-    app_fixture.cooldown_bullet_last_move = perf_counter() + 30
-    app_fixture.move_bullets()
-    assert bullet_fixture.ycor() == 0
-
-
-def test_handle_invaders_shooting(app_fixture: App) -> None:
-    app_fixture.cooldown_invaders_last_shoot = (
-        perf_counter() - app_fixture.cooldown_invaders_shoot
-    )
-    app_fixture.handle_invaders_shooting()
-    assert len(app_fixture.bullets) == 1
-
-
-def test_handle_invaders_shooting_on_cooldown(app_fixture: App) -> None:
-    app_fixture.cooldown_invaders_last_shoot = (
-        perf_counter() + app_fixture.cooldown_invaders_shoot * 1.2
-    )
-    app_fixture.handle_invaders_shooting()
-    assert len(app_fixture.bullets) == 0
+def test_world_is_rendered(app_fixture: App) -> None:
+    assert app_fixture.world.user in app_fixture.renderer.sprites
+    assert len(app_fixture.renderer.sprites) == 1 + sum(
+        len(column) for column in app_fixture.world.invaders
+    ) + len(app_fixture.world.fortresses)
 
 
 def test_handle_user_shooting(app_fixture: App) -> None:
     app_fixture.handle_user_shooting()
-    assert len(app_fixture.bullets) == 1
+    assert len(app_fixture.world.bullets) == 0
+    app_fixture.step()
+    assert len(app_fixture.world.bullets) == 1
+    assert list(app_fixture.world.bullets)[0] in app_fixture.renderer.sprites
 
 
-def test_handle_user_shooting_on_cooldown(app_fixture: App) -> None:
-    app_fixture.cooldown_user_last_shoot = (
-        perf_counter() + app_fixture.cooldown_user_shoot * 1.2
-    )
+def test_step(app_fixture: App) -> None:
     app_fixture.handle_user_shooting()
-    assert len(app_fixture.bullets) == 0
-
-
-# test_handle_bullets_collisions
-
-
-@pytest.mark.parametrize("lifes, expected", ((4, True), (0, False)))
-def test_check_lifes_left(app_fixture: App, lifes: int, expected: bool) -> None:
-    app_fixture.game_lifes.value = lifes
-    assert app_fixture.check_lifes_left() is expected
-
-
-@pytest.mark.parametrize("y_cor, expected", ((-20, False), (20, True)))
-def test_check_invaders_pass(
-    app_fixture: App, invader_fixture: Invader, y_cor: int, expected: bool
-) -> None:
-    app_fixture.invaders = [[invader_fixture]]
-    assert app_fixture.check_invaders_pass(y_cor) is expected
-
-
-def test_reduce_cooldown(app_fixture: App) -> None:
-    cooldown_bullet_movement_start = app_fixture.cooldown_bullet_movement
-    cooldown_invaders_movement_start = app_fixture.cooldown_invaders_movement
-    cooldown_user_shoot_start = app_fixture.cooldown_user_shoot
-    app_fixture.reduce_cooldown(
-        bullet_movement=0.001,
-        inverders_movement=-0.03,
-        user_shoot=0.009,
-    )
-    assert (
-        cooldown_bullet_movement_start - app_fixture.cooldown_bullet_movement
-        == pytest.approx(0.001)
-    )
-    assert (
-        cooldown_invaders_movement_start - app_fixture.cooldown_invaders_movement
-        == pytest.approx(0.03)
-    )
-    assert cooldown_user_shoot_start - app_fixture.cooldown_user_shoot == pytest.approx(
-        0.009
-    )
-    assert len(app_fixture.garbage) == 0
-
-
-def test_handle_level_up_permission_false(app_fixture: App) -> None:
-    game_level = app_fixture.game_level.value
-    app_fixture.handle_level_up()
-    assert app_fixture.game_level.value == game_level
-
-
-def test_handle_level_up_permission_true(app_fixture: App) -> None:
-    app_fixture.game_level_up = True
-    app_fixture.handle_level_up()
-    assert not app_fixture.game_level_up
-
-
-# test_show_game_over_label
-# unit test no needed
-
-
-def test_collect_garbage(
-    app_fixture: App, bullet_fixture: Bullet, invader_fixture: Invader, fortress_fixture
-) -> None:
-    app_fixture.bullets.append(bullet_fixture)
-    app_fixture.invaders = [[invader_fixture]]
-    app_fixture.fortresses = [fortress_fixture]
-    app_fixture.garbage.update({bullet_fixture, invader_fixture, fortress_fixture})
-    app_fixture.collect_garbage()
-    assert bullet_fixture not in app_fixture.bullets
-    assert invader_fixture not in app_fixture.invaders[0]
-    assert fortress_fixture not in app_fixture.fortresses
+    app_fixture.step()
+    (bullet,) = app_fixture.world.bullets
+    app_fixture.world.destroy(bullet)
+    app_fixture.step()
+    assert bullet not in list(app_fixture.world.bullets)
+    assert bullet not in app_fixture.renderer.sprites
 
 
 def test_stop(app_fixture: App) -> None:
@@ -157,25 +46,81 @@ def test_stop(app_fixture: App) -> None:
 
 
 # test_load_high_score
-def test_load_high_score(monkeypatch: MonkeyPatch, app_fixture: App) -> None:
-    def read_json_mock(*args) -> dict:
-        return {"result_1": 100, "result_2": 1000}
-
-    monkeypatch.setattr("turtle_invaders.app.read_json", read_json_mock)
+def test_load_high_score(app_fixture: App) -> None:
+    app_fixture.scores.add_run(RunStats(100, 1, 120, 100, 60.0))
+    app_fixture.scores.add_run(RunStats(1000, 9, 1500, 1000, 600.0))
     app_fixture.load_high_score()
     assert app_fixture.game_high_score.value == 1000
 
 
-def test_load_high_score_empty_dict(monkeypatch: MonkeyPatch, app_fixture: App) -> None:
-    def read_json_mock(*args) -> dict:
-        return {}
+def test_load_high_score_queues_rendering_task(app_fixture: App) -> None:
+    app_fixture.load_high_score()
+    assert app_fixture.tasks_main.depth(TaskPriority.RENDERING) == 1
+    assert app_fixture.tasks_main.depth(TaskPriority.BOOKKEEPING) == 0
+
 
-    monkeypatch.setattr("turtle_invaders.app.read_json", read_json_mock)
+def test_load_high_score_empty_database(app_fixture: App) -> None:
     app_fixture.load_high_score()
     assert app_fixture.game_high_score.value == 0
 
 
+def test_import_scores(app_fixture: App) -> None:
+    app_fixture.high_score_path.write_text('{"2024-01-01T00:00:00": 7}')
+    app_fixture.import_scores()
+    assert app_fixture.scores.high_score == 7
+
+
+def test_import_scores_from_journal(tmp_path: Path, app_fixture: App) -> None:
+    with open(tmp_path / "scores.jsonl", "w") as f:
+        for i in range(150):
+            date = f"2024-01-01T00:{i // 60:02}:{i % 60:02}"
+            f.write(json.dumps({"score": i, "id": i + 1, "date": date}) + "\n")
+    app_fixture.import_scores()
+    assert len(app_fixture.scores) == 150
+    assert app_fixture.scores.high_score == 149
+
+
+def test_import_scores_skips_filled_database(app_fixture: App) -> None:
+    app_fixture.scores.add_run(RunStats(100, 1, 120, 100, 60.0))
+    app_fixture.high_score_path.write_text("not read")
+    app_fixture.import_scores()
+    assert len(app_fixture.scores) == 1
+
+
+def test_save_high_score(app_fixture: App) -> None:
+    app_fixture.world.score = 42
+    app_fixture.world.shots = 50
+    app_fixture.world.publish()
+    app_fixture.save_high_score()
+    (run,) = app_fixture.scores.top()
+    assert run.score == 42
+    assert run.shots == 50
+
+
+def test_save_high_score_in_background(app_fixture: App) -> None:
+    app_fixture.world.score = 7
+    app_fixture.world.publish()
+    app_fixture.run_additional_loop()
+    app_fixture.run_in_background(app_fixture.save_high_score)
+    app_fixture.stop_worker()
+    assert app_fixture.worker is None
+    assert app_fixture.tasks.depth() == 0
+    assert app_fixture.scores.high_score == 7
+
+
+def test_run_in_background_without_worker(app_fixture: App) -> None:
+    calls = []
+    app_fixture.run_in_background(lambda: calls.append(1))
+    assert calls == [1]
+
+
 # test_show_count_down
 
-# test_save_high_score
-# not needed, because testded in test_utils.py
+
+def test_level_up_keeps_turtle_count(app_fixture: App) -> None:
+    screen = app_fixture.screen
+    turtles = len(screen.turtles())
+    for _ in range(3):
+        app_fixture.world.level_up = True
+        app_fixture.step()
+    assert len(screen.turtles()) == turtles
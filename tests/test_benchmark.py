@@ -0,0 +1,54 @@
+import json
+import pytest
+from turtle_invaders.benchmark import SCENARIOS, PhaseCosts, run_scenario, run_ticks
+from turtle_invaders.world import World
+
+
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_run_scenario(name: str) -> None:
+    result = run_scenario(SCENARIOS[name], ticks=200)
+    assert result["scenario"] == name
+    assert result["ticks"] == 200
+    assert result["ticks_per_second"] > 0
+    assert result["peak_memory_bytes"] > 0
+    assert result["games"] >= 1
+    assert result["final"]["lifes"] > 0
+    assert set(result["phases"]) == {name for name, _ in World(seed=0).phases(0)}
+    json.dumps(result)
+
+
+def test_late_level_setup() -> None:
+    world = SCENARIOS["late_level"].create_world(0)
+    assert world.level == 10
+
+
+def test_formation_near_floor_setup() -> None:
+    world = SCENARIOS["formation_near_floor"].create_world(0)
+    assert world.formation.bottom.y == -200
+
+
+def test_phase_costs_report() -> None:
+    costs = PhaseCosts()
+    costs.record("move_bullets", 0.003)
+    costs.record("move_bullets", 0.001)
+    costs.record("move_invaders", 0.004)
+    report = costs.report()
+    assert report["move_bullets"]["mean_us"] == pytest.approx(2000)
+    assert report["move_invaders"]["share"] == pytest.approx(0.5)
+
+
+def test_run_scenario_with_frame_step() -> None:
+    result = run_scenario(SCENARIOS["dense_bullets"], ticks=100, step=1 / 60)
+    assert result["step"] == pytest.approx(1 / 60)
+    assert result["ticks"] == 100
+
+
+def test_run_ticks_restarts_finished_game() -> None:
+    scenario = SCENARIOS["level_1"]
+    world = scenario.create_world(0)
+    world.lifes = 0
+    last, games = run_ticks(world, scenario, 10)
+    assert games == 2
+    assert last is not world
+    assert last.lifes == 3
+    assert last.tick == 10
@@ -1,5 +1,6 @@
 import pytest
-from turtle_invaders.bullet import Bullet
+from turtle_invaders.bullet import Bullet, BulletPool
+from turtle_invaders.constants import ObjectDirection
 
 
 def test_move(bullet_fixture: Bullet) -> None:
@@ -11,3 +12,29 @@ def test_move(bullet_fixture: Bullet) -> None:
 def test_destroy(bullet_fixture: Bullet) -> None:
     bullet_fixture.destroy()
     assert bullet_fixture.isvisible() is False
+
+
+@pytest.fixture
+def bullet_pool_fixture() -> BulletPool:
+    return BulletPool(capacity=1)
+
+
+def test_pool_reuses_released_bullet(bullet_pool_fixture: BulletPool) -> None:
+    bullet = bullet_pool_fixture.acquire(0, 0, ObjectDirection.NORTH, "green")
+    bullet_pool_fixture.release(bullet)
+    assert bullet.isvisible() is False
+    reused = bullet_pool_fixture.acquire(10, 20, ObjectDirection.SOUTH, "blue")
+    assert reused is bullet
+    assert reused.isvisible() is True
+    assert (reused.xcor(), reused.ycor()) == (10, 20)
+    assert reused.heading() == ObjectDirection.SOUTH
+    assert reused.color()[0] == "blue"
+    assert bullet_pool_fixture.created == 1
+
+
+def test_pool_capacity(bullet_pool_fixture: BulletPool) -> None:
+    first = bullet_pool_fixture.acquire(0, 0, ObjectDirection.NORTH, "green")
+    second = bullet_pool_fixture.acquire(0, 0, ObjectDirection.NORTH, "green")
+    assert bullet_pool_fixture.release(first) is True
+    assert bullet_pool_fixture.release(second) is False
+    assert len(bullet_pool_fixture) == 1
@@ -0,0 +1,118 @@
+from random import Random
+import pytest
+from turtle_invaders.collisions import (
+    SpatialHash,
+    overlapping_pairs,
+    time_of_impact,
+)
+from turtle_invaders.world import BulletState, InvaderState
+from turtle_invaders.constants import ObjectDirection
+
+
+@pytest.fixture
+def spatial_hash_fixture() -> SpatialHash:
+    return SpatialHash(cell_size=40)
+
+
+def test_spatial_hash_invalid_cell_size() -> None:
+    with pytest.raises(ValueError):
+        SpatialHash(cell_size=0)
+
+
+def test_spatial_hash_query_neighbours(spatial_hash_fixture: SpatialHash) -> None:
+    near = InvaderState(45, 0)
+    far = InvaderState(200, 0)
+    spatial_hash_fixture.insert(near)
+    spatial_hash_fixture.insert(far)
+    candidates = list(spatial_hash_fixture.query(30, 0, 3))
+    assert near in candidates
+    assert far not in candidates
+
+
+def test_spatial_hash_update(spatial_hash_fixture: SpatialHash) -> None:
+    bullet = BulletState(0, 0, ObjectDirection.NORTH, "green")
+    spatial_hash_fixture.insert(bullet)
+    bullet.y = 300
+    spatial_hash_fixture.update(bullet)
+    assert bullet not in spatial_hash_fixture.query(0, 0, 3)
+    assert bullet in spatial_hash_fixture.query(0, 300, 3)
+
+
+def test_spatial_hash_remove(spatial_hash_fixture: SpatialHash) -> None:
+    invader = InvaderState(0, 0)
+    spatial_hash_fixture.insert(invader)
+    spatial_hash_fixture.remove(invader)
+    spatial_hash_fixture.remove(invader)
+    assert invader not in spatial_hash_fixture
+    assert len(spatial_hash_fixture.cells) == 0
+
+
+def test_spatial_hash_update_ignores_unknown(spatial_hash_fixture: SpatialHash) -> None:
+    invader = InvaderState(0, 0)
+    spatial_hash_fixture.update(invader)
+    assert invader not in spatial_hash_fixture
+
+
+@pytest.mark.parametrize(
+    "x, y, dx, dy, expected",
+    (
+        (0, -20, 0, 40, 0.25),
+        (0, -20, 0, 5, None),
+        (0, 20, 0, 40, None),
+        (4, 0, 0, 0, 0.0),
+        (30, 0, 0, 0, None),
+        (20, -20, 0, 40, None),
+        (0, -20, 0, 10, 1.0),
+    ),
+)
+def test_time_of_impact(x, y, dx, dy, expected) -> None:
+    assert time_of_impact(x, y, dx, dy, 10) == expected
+
+
+def test_find_impacts() -> None:
+    pytest.importorskip("numpy")
+    from turtle_invaders.collisions import find_impacts, pack, pack_paths
+
+    fast = BulletState(0, 0, ObjectDirection.NORTH, "green")
+    fast.move(100)
+    slow = BulletState(100, 0, ObjectDirection.NORTH, "green")
+    slow.move(1)
+    invaders = [InvaderState(100, 50), InvaderState(0, 63), InvaderState(0, 2)]
+    paths = pack_paths([fast, slow])
+    assert paths.shape == (2, 5)
+    assert find_impacts(paths, pack(invaders)) == [(0.5, 0, 1), (0.0, 0, 2)]
+    assert find_impacts(paths, pack([])) == []
+    assert find_impacts(pack_paths([]), pack(invaders)) == []
+
+
+def test_overlapping_pairs() -> None:
+    north = [
+        BulletState(0, 0, ObjectDirection.NORTH, "green"),
+        BulletState(100, 0, ObjectDirection.NORTH, "green"),
+        BulletState(5, 50, ObjectDirection.NORTH, "green"),
+    ]
+    south = [
+        BulletState(104, 300, ObjectDirection.SOUTH, "blue"),
+        BulletState(50, 0, ObjectDirection.SOUTH, "blue"),
+        BulletState(-1, -100, ObjectDirection.SOUTH, "blue"),
+    ]
+    assert sorted(overlapping_pairs(north, south)) == [(0, 2), (1, 0), (2, 2)]
+    assert overlapping_pairs(north, []) == []
+
+
+def test_overlapping_pairs_match_brute_force() -> None:
+    random = Random(1)
+    groups = [
+        [
+            BulletState(random.uniform(-300, 300), 0, heading, "white")
+            for _ in range(60)
+        ]
+        for heading in (ObjectDirection.NORTH, ObjectDirection.SOUTH)
+    ]
+    expected = [
+        (i, j)
+        for i, a in enumerate(groups[0])
+        for j, b in enumerate(groups[1])
+        if abs(a.x - b.x) <= a.radius + b.radius
+    ]
+    assert sorted(overlapping_pairs(*groups)) == expected
@@ -0,0 +1,31 @@
+import pytest
+from tests.conftest import World
+from turtle_invaders.commands import CommandBuffer, MoveUser, Shoot
+
+
+def test_command_buffer_apply(world_fixture: World) -> None:
+    buffer = CommandBuffer()
+    buffer.push(MoveUser(0.5))
+    buffer.push(MoveUser(0.5))
+    buffer.push(Shoot())
+    assert len(buffer) == 3
+    assert buffer.apply(world_fixture) == 3
+    assert len(buffer) == 0
+    assert world_fixture.user.x == 1
+    (bullet,) = world_fixture.bullets
+    assert bullet.x == 1
+
+
+def test_commands_are_applied_in_step(world_fixture: World) -> None:
+    world_fixture.commands.push(MoveUser(-1))
+    assert world_fixture.user.x == 0
+    world_fixture.step()
+    assert world_fixture.user.x == -1
+    assert len(world_fixture.commands) == 0
+
+
+def test_moves_are_limited_to_user_speed(world_fixture: World) -> None:
+    world_fixture.commands.push(MoveUser(15))
+    world_fixture.commands.push(MoveUser(15))
+    world_fixture.step(0.01)
+    assert world_fixture.user.x == pytest.approx(3)
@@ -0,0 +1,107 @@
+import pytest
+from tests.conftest import FakeScreen, World
+from turtle_invaders.constants import SIMULATION_STEP
+from turtle_invaders.controls import Controls
+
+
+def run(controls: Controls, world: World, ticks: int) -> None:
+    for _ in range(ticks):
+        controls.sample(world, SIMULATION_STEP)
+        world.step(SIMULATION_STEP)
+
+
+def test_bind(screen_fixture: FakeScreen) -> None:
+    controls = Controls()
+    controls.bind(screen_fixture)
+    assert set(screen_fixture.pressed) == {"Left", "Right", "space"}
+    assert set(screen_fixture.released) == {"Left", "Right", "space"}
+    screen_fixture.pressed["Left"]()
+    assert controls.direction == -1
+    screen_fixture.released["Left"]()
+    assert controls.direction == 0
+
+
+def test_idle_pushes_nothing(world_fixture: World) -> None:
+    assert Controls().sample(world_fixture, SIMULATION_STEP) == 0
+    assert len(world_fixture.commands) == 0
+
+
+def test_held_key_moves_smoothly(world_fixture: World) -> None:
+    controls = Controls(speed=300, ramp=3 * SIMULATION_STEP)
+    controls.press_right()
+    run(controls, world_fixture, 3)
+    assert controls.velocity == pytest.approx(300)
+    run(controls, world_fixture, 30)
+    ramp = (100 + 200 + 300) * SIMULATION_STEP
+    assert world_fixture.user.x == pytest.approx(ramp + 30 * 300 * SIMULATION_STEP)
+    controls.release_right()
+    x = world_fixture.user.x
+    run(controls, world_fixture, 10)
+    assert world_fixture.user.x == x
+    assert controls.velocity == 0
+
+
+def test_opposite_keys_cancel(world_fixture: World) -> None:
+    controls = Controls()
+    controls.press_left()
+    controls.press_right()
+    run(controls, world_fixture, 10)
+    assert world_fixture.user.x == 0
+
+
+def test_reversal_restarts_ramp(world_fixture: World) -> None:
+    controls = Controls(speed=300, ramp=3 * SIMULATION_STEP)
+    controls.press_right()
+    run(controls, world_fixture, 5)
+    controls.release_right()
+    controls.press_left()
+    controls.sample(world_fixture, SIMULATION_STEP)
+    assert controls.velocity == pytest.approx(-100)
+
+
+def test_tap_fires_once(world_fixture: World) -> None:
+    controls = Controls()
+    controls.press_fire()
+    controls.release_fire()
+    run(controls, world_fixture, 100)
+    assert world_fixture.shots == 1
+
+
+def test_tap_during_cooldown_is_buffered(world_fixture: World) -> None:
+    controls = Controls(fire_buffer=0.15)
+    controls.press_fire()
+    controls.release_fire()
+    run(controls, world_fixture, 1)
+    run(controls, world_fixture, int(0.4 / SIMULATION_STEP))
+    controls.press_fire()
+    controls.release_fire()
+    run(controls, world_fixture, int(0.2 / SIMULATION_STEP))
+    assert world_fixture.shots == 2
+
+
+def test_buffered_fire_expires(world_fixture: World) -> None:
+    controls = Controls(fire_buffer=0.15)
+    controls.press_fire()
+    controls.release_fire()
+    run(controls, world_fixture, 1)
+    controls.press_fire()
+    controls.release_fire()
+    run(controls, world_fixture, int(1 / SIMULATION_STEP))
+    assert world_fixture.shots == 1
+
+
+def test_held_fire_honors_cooldown(world_fixture: World) -> None:
+    world_fixture.cooldown_user_shoot = 0.25
+    controls = Controls()
+    controls.press_fire()
+    run(controls, world_fixture, int(1 / SIMULATION_STEP))
+    assert world_fixture.shots == 4
+
+
+def test_hold(world_fixture: World) -> None:
+    controls = Controls()
+    controls.hold(-1, True)
+    assert (controls.direction, controls.fire) == (-1, True)
+    assert controls.sample(world_fixture, SIMULATION_STEP) == 2
+    controls.hold(0, False)
+    assert (controls.direction, controls.fire) == (0, False)
@@ -0,0 +1,70 @@
+from random import Random
+import pytest
+from turtle_invaders.constants import InvadersMovementDirection
+from turtle_invaders.formation import Formation
+from turtle_invaders.world import InvaderState
+
+
+@pytest.fixture
+def formation_fixture() -> Formation:
+    return Formation([[InvaderState(x, y) for y in (40, 0)] for x in (-40, 0, 40)])
+
+
+def test_move(formation_fixture: Formation) -> None:
+    formation_fixture.move(15, -30)
+    invader = formation_fixture.columns[0][0]
+    assert (invader.x, invader.y) == (-25, 10)
+
+
+def test_edge(formation_fixture: Formation) -> None:
+    assert formation_fixture.edge(InvadersMovementDirection.RIGHT).x == 40
+    assert formation_fixture.edge(InvadersMovementDirection.LEFT).x == -40
+
+
+def test_remove_updates_lowest(formation_fixture: Formation) -> None:
+    lowest = formation_fixture.columns[1][1]
+    formation_fixture.remove(lowest)
+    assert formation_fixture.columns[1][1] is None
+    assert formation_fixture.lowest[1] == 0
+    assert formation_fixture.bottom.y == 0
+
+
+def test_remove_updates_edges(formation_fixture: Formation) -> None:
+    for invader in list(formation_fixture.columns[2]):
+        formation_fixture.remove(invader)
+    assert formation_fixture.edge(InvadersMovementDirection.RIGHT).x == 0
+
+
+def test_removed_invader_keeps_position(formation_fixture: Formation) -> None:
+    formation_fixture.move(15, 0)
+    invader = formation_fixture.columns[0][0]
+    formation_fixture.remove(invader)
+    formation_fixture.move(15, 0)
+    assert (invader.x, invader.y) == (-25, 40)
+
+
+def test_bottom_after_all_lowest_removed(formation_fixture: Formation) -> None:
+    for column in formation_fixture.columns:
+        formation_fixture.remove(column[1])
+    assert formation_fixture.bottom.y == 40
+
+
+def test_shooter_is_lowest_of_non_empty_column(formation_fixture: Formation) -> None:
+    for invader in list(formation_fixture.columns[0]) + [
+        formation_fixture.columns[1][1]
+    ]:
+        formation_fixture.remove(invader)
+    random = Random(0)
+    shooters = {formation_fixture.shooter(random) for _ in range(50)}
+    assert shooters == {
+        formation_fixture.columns[1][0],
+        formation_fixture.columns[2][1],
+    }
+
+
+def test_empty_formation() -> None:
+    formation = Formation([[None]])
+    assert formation.empty
+    assert formation.edge(InvadersMovementDirection.RIGHT) is None
+    assert formation.shooter(Random(0)) is None
+    assert formation.bottom is None
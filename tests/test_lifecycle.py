@@ -0,0 +1,38 @@
+import pytest
+from turtle_invaders.lifecycle import Reaper
+from turtle_invaders.spaceships import Invader
+
+
+@pytest.fixture
+def reaper_fixture() -> Reaper:
+    return Reaper()
+
+
+def test_reap(reaper_fixture: Reaper, invader_fixture: Invader) -> None:
+    screen = invader_fixture.getscreen()
+    reaper_fixture.reap(invader_fixture)
+    assert invader_fixture not in screen.turtles()
+    assert reaper_fixture.stats(screen)["reaped"] == 1
+
+
+def test_reap_twice(reaper_fixture: Reaper, invader_fixture: Invader) -> None:
+    reaper_fixture.reap(invader_fixture)
+    reaper_fixture.reap(invader_fixture)
+    assert reaper_fixture.reaped == 1
+
+
+def test_detach(reaper_fixture: Reaper, invader_fixture: Invader) -> None:
+    screen = invader_fixture.getscreen()
+    reaper_fixture.detach(invader_fixture)
+    assert invader_fixture not in screen.turtles()
+    assert reaper_fixture.stats(screen)["detached"] == 1
+    reaper_fixture.reap(invader_fixture)
+    assert reaper_fixture.stats(screen)["detached"] == 0
+    assert reaper_fixture.reaped == 1
+
+
+def test_stats_hidden(reaper_fixture: Reaper, invader_fixture: Invader) -> None:
+    screen = invader_fixture.getscreen()
+    hidden = reaper_fixture.stats(screen)["hidden"]
+    invader_fixture.destroy()
+    assert reaper_fixture.stats(screen)["hidden"] == hidden + 1
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+import pytest
+from tests.conftest import FakeClock
+from turtle_invaders.profiler import FrameProfiler, RollingHistogram
+from turtle_invaders.world import World
+
+
+def test_rolling_histogram_percentiles() -> None:
+    histogram = RollingHistogram(size=100)
+    for value in range(1, 101):
+        histogram.record(value / 1000)
+    assert histogram.percentile(50) == pytest.approx(0.050)
+    assert histogram.percentile(99) == pytest.approx(0.099)
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["p95_ms"] == pytest.approx(95)
+    assert summary["max_ms"] == pytest.approx(100)
+
+
+def test_rolling_histogram_keeps_last_samples() -> None:
+    histogram = RollingHistogram(size=3)
+    for value in (10, 20, 30, 1, 2):
+        histogram.record(value)
+    assert sorted(histogram.samples) == [1, 2, 30]
+    assert histogram.count == 5
+
+
+def test_rolling_histogram_empty() -> None:
+    assert RollingHistogram().percentile(50) == 0.0
+    assert RollingHistogram().summary() == {"count": 0}
+    with pytest.raises(ValueError):
+        RollingHistogram(0)
+
+
+def test_frame_profiler_laps(clock_fixture: FakeClock) -> None:
+    profiler = FrameProfiler(clock=clock_fixture)
+    profiler.start_frame()
+    clock_fixture.time = 0.004
+    profiler.lap("simulation")
+    clock_fixture.time = 0.005
+    profiler.lap("present")
+    report = profiler.report()
+    assert report["simulation"]["p50_ms"] == pytest.approx(4)
+    assert report["present"]["p50_ms"] == pytest.approx(1)
+
+
+def test_frame_profiler_disabled() -> None:
+    profiler = FrameProfiler(enabled=False)
+    profiler.start_frame()
+    profiler.lap("simulation")
+    profiler.record("tasks", 0.1)
+    assert profiler.report() == {}
+
+
+def test_frame_profiler_times_world_phases(tmp_path: Path) -> None:
+    profiler = FrameProfiler()
+    world = World(seed=0)
+    for _ in range(10):
+        world.step(timer=profiler)
+    report = profiler.report()
+    assert {name for name, _ in world.phases(0)} == set(report)
+    assert all(summary["count"] == 10 for summary in report.values())
+    path = tmp_path / "profile.json"
+    profiler.dump(path)
+    assert json.loads(path.read_text()) == report
@@ -0,0 +1,79 @@
+import pytest
+from tests.conftest import FakeClock, FakeScreen
+from turtle_invaders.formation import Formation
+from turtle_invaders.renderer import FORMATION_TAG, TurtleRenderer
+from turtle_invaders.world import WorldEvent
+
+
+@pytest.fixture
+def renderer_fixture(
+    screen_fixture: FakeScreen, clock_fixture: FakeClock
+) -> TurtleRenderer:
+    return TurtleRenderer(
+        screen=screen_fixture, refresh_rate=10, clock=clock_fixture  # type: ignore
+    )
+
+
+def test_present_skips_clean_frame(
+    renderer_fixture: TurtleRenderer, screen_fixture: FakeScreen
+) -> None:
+    assert renderer_fixture.present() is False
+    assert screen_fixture.updates == 0
+
+
+def test_present_dirty_frame(
+    renderer_fixture: TurtleRenderer, screen_fixture: FakeScreen
+) -> None:
+    renderer_fixture.mark_dirty("label")
+    assert renderer_fixture.present() is True
+    assert screen_fixture.updates == 1
+    assert renderer_fixture.dirty == set()
+    assert renderer_fixture.present() is False
+
+
+def test_present_refresh_rate(
+    renderer_fixture: TurtleRenderer,
+    screen_fixture: FakeScreen,
+    clock_fixture: FakeClock,
+) -> None:
+    renderer_fixture.mark_dirty("label")
+    renderer_fixture.present()
+    renderer_fixture.mark_dirty("label")
+    clock_fixture.time = 0.05
+    assert renderer_fixture.present() is False
+    assert renderer_fixture.present(force=True) is True
+    renderer_fixture.mark_dirty("label")
+    clock_fixture.time = 0.15
+    assert renderer_fixture.present() is True
+    assert screen_fixture.updates == 3
+
+
+def test_move_of_unknown_subject_is_clean(renderer_fixture: TurtleRenderer) -> None:
+    renderer_fixture.notify(WorldEvent.MOVE, object())
+    renderer_fixture.notify(WorldEvent.DESTROY, object())
+    renderer_fixture.notify(WorldEvent.SCORE, object())
+    assert renderer_fixture.dirty == set()
+
+
+def test_formation_step_is_one_canvas_move(
+    renderer_fixture: TurtleRenderer, screen_fixture: FakeScreen
+) -> None:
+    formation = Formation([])
+    renderer_fixture.formation = formation
+    formation.move(15, 0)
+    renderer_fixture.notify(WorldEvent.FORMATION, formation)
+    formation.move(0, -30)
+    renderer_fixture.notify(WorldEvent.FORMATION, formation)
+    assert screen_fixture.canvas.moves == [
+        (FORMATION_TAG, 15, 0),
+        (FORMATION_TAG, 0, 30),
+    ]
+    assert formation in renderer_fixture.dirty
+
+
+def test_other_formation_is_ignored(
+    renderer_fixture: TurtleRenderer, screen_fixture: FakeScreen
+) -> None:
+    renderer_fixture.formation = Formation([])
+    renderer_fixture.notify(WorldEvent.FORMATION, Formation([]))
+    assert screen_fixture.canvas.moves == []
@@ -0,0 +1,108 @@
+from pathlib import Path
+import pytest
+from turtle_invaders.commands import MoveUser, Shoot
+from turtle_invaders.replay import (
+    HEADER,
+    MAGIC,
+    RECORD,
+    Recorder,
+    RecordKind,
+    Replay,
+    ReplayDivergenceError,
+    ReplayError,
+    state_hash,
+)
+from turtle_invaders.world import World
+
+
+def record_game(path: Path, ticks: int = 3000) -> World:
+    world = World(seed=7)
+    recorder = Recorder(path, 7)
+    recorder.attach(world)
+    for tick in range(ticks):
+        if tick % 150 == 0:
+            world.commands.push(Shoot())
+        if tick % 400 == 0:
+            world.commands.push(MoveUser(15 if tick % 800 else -15))
+        world.step()
+        recorder.observe(world)
+    recorder.close(world)
+    return world
+
+
+@pytest.fixture
+def recording_fixture(tmp_path: Path) -> tuple[Path, World]:
+    path = tmp_path / "game.rec"
+    return path, record_game(path)
+
+
+def test_replay_reproduces_game(recording_fixture: tuple[Path, World]) -> None:
+    path, world = recording_fixture
+    replay = Replay(path)
+    assert replay.run() == 3000
+    assert replay.world.tick == world.tick
+    assert replay.world.score == world.score
+    assert state_hash(replay.world) == state_hash(world)
+
+
+def test_replay_seek(recording_fixture: tuple[Path, World]) -> None:
+    path, _ = recording_fixture
+    replay = Replay(path, keyframe_interval=500)
+    replay.run()
+    assert set(replay.keyframes) == {0, 500, 1000, 1500, 2000, 2500, 3000}
+    world = replay.seek(1234)
+    assert world.tick == 1234
+    assert state_hash(world) == replay.hashes[1234]
+
+
+def test_replay_detects_divergence(recording_fixture: tuple[Path, World]) -> None:
+    path, _ = recording_fixture
+    with open(path, "ab") as file:
+        file.write(RECORD.pack(3001, RecordKind.HASH, 0))
+        file.write(RECORD.pack(3001, RecordKind.END, 0))
+    with pytest.raises(ReplayDivergenceError) as error:
+        Replay(path).run()
+    assert error.value.tick == 3001
+
+
+def test_replay_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "game.rec"
+    path.write_bytes(b"not a recording at all")
+    with pytest.raises(ReplayError):
+        Replay(path)
+
+
+@pytest.mark.parametrize("version", (1, 2))
+def test_replay_refuses_older_versions(tmp_path: Path, version: int) -> None:
+    path = tmp_path / "game.rec"
+    path.write_bytes(
+        HEADER.pack(MAGIC, version, 7, 0.005)
+        + RECORD.pack(5, RecordKind.HASH, 12345)
+        + RECORD.pack(10, RecordKind.END, 0)
+    )
+    with pytest.raises(ReplayError, match="former rules"):
+        Replay(path)
+
+
+def test_replay_whole_number_float_moves(tmp_path: Path) -> None:
+    path = tmp_path / "game.rec"
+    world = World(seed=3)
+    recorder = Recorder(path, 3)
+    recorder.attach(world)
+    for tick in range(10):
+        world.commands.push(MoveUser(2.0 if tick % 2 else 2))
+        world.step()
+        recorder.observe(world)
+    recorder.close(world)
+    replay = Replay(path)
+    assert replay.run() == 10
+    assert state_hash(replay.world) == state_hash(world)
+
+
+def test_state_hash_ignores_number_types() -> None:
+    first, second = World(seed=1), World(seed=1)
+    first.move_user(1)
+    second.move_user(1.0)
+    assert state_hash(first) == state_hash(second)
+    second.move_user(0.5)
+    assert state_hash(first) != state_hash(second)
@@ -1,8 +1,11 @@
 import pytest
+from tests.conftest import FakeClock
 from turtle_invaders.scoreboard import (
     Score,
     LifeScore,
     Level,
+    PerformanceOverlay,
+    sparkline,
 )
 
 
@@ -37,3 +40,51 @@ def test_level_increase(level_fixture: Level) -> None:
     initial_value = level_fixture.value
     level_fixture.increase(1)
     assert level_fixture.value == initial_value + 1
+
+
+def test_score_refresh_in_place(score_fixture: Score) -> None:
+    item = score_fixture.item
+    score_fixture.increase(1)
+    score_fixture.update()
+    assert score_fixture.stale is True
+    assert score_fixture.refresh() is True
+    assert score_fixture.stale is False
+    assert score_fixture.item == item
+    assert score_fixture.items == [item]
+    assert score_fixture.text == "SCORE: <0001>"
+
+
+def test_score_refresh_unchanged(score_fixture: Score) -> None:
+    score_fixture.update()
+    assert score_fixture.refresh() is False
+
+
+def test_sparkline() -> None:
+    assert sparkline([0, 1, 2, 4]) == "▁▃▅█"
+    assert sparkline([0, 0]) == "▁▁"
+    assert sparkline([]) == ""
+
+
+@pytest.fixture
+def overlay_fixture(clock_fixture: FakeClock) -> PerformanceOverlay:
+    return PerformanceOverlay(interval=0.5, clock=clock_fixture)
+
+
+def test_overlay_hidden_by_default(overlay_fixture: PerformanceOverlay) -> None:
+    assert overlay_fixture.render() == ""
+
+
+def test_overlay_sample_rate(
+    overlay_fixture: PerformanceOverlay, clock_fixture: FakeClock
+) -> None:
+    overlay_fixture.toggle()
+    for frame in range(1, 31):
+        clock_fixture.time = frame / 60
+        due = overlay_fixture.sample(0.004, 3)
+        assert due is (frame == 30)
+    assert overlay_fixture.fps == pytest.approx(60)
+    assert overlay_fixture.tps == pytest.approx(180)
+    overlay_fixture.show_counts({"bullets": 4})
+    assert overlay_fixture.refresh() is True
+    assert "FPS  60.0" in overlay_fixture.text
+    assert "bullets" in overlay_fixture.text
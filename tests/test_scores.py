@@ -0,0 +1,117 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pytest
+from turtle_invaders.scores import (
+    RunRecord,
+    RunStats,
+    ScoreDatabase,
+    ScoreEntry,
+    ScoreJournal,
+)
+
+
+@pytest.fixture
+def journal_path_fixture(tmp_path: Path) -> Path:
+    return tmp_path / "scores.jsonl"
+
+
+def write_journal(path: Path, *scores: int) -> list[ScoreEntry]:
+    entries = [
+        ScoreEntry(score, i, f"2026-01-01T10:{i // 60:02}:{i % 60:02}")
+        for i, score in enumerate(scores, 1)
+    ]
+    path.write_text("".join(json.dumps(entry._asdict()) + "\n" for entry in entries))
+    return entries
+
+
+def test_read_journal(journal_path_fixture: Path) -> None:
+    entries = write_journal(journal_path_fixture, 10, 30, 5)
+    journal = ScoreJournal(journal_path_fixture)
+    assert journal.high_score == 30
+    assert journal.entries == entries
+
+
+def test_read_every_entry(journal_path_fixture: Path) -> None:
+    write_journal(journal_path_fixture, *range(250))
+    assert len(ScoreJournal(journal_path_fixture)) == 250
+
+
+def test_torn_line_is_skipped(journal_path_fixture: Path) -> None:
+    write_journal(journal_path_fixture, 10)
+    with open(journal_path_fixture, "a") as f:
+        f.write('{"score": 99, "id"')
+    journal = ScoreJournal(journal_path_fixture)
+    assert journal.high_score == 10
+    assert len(journal) == 1
+
+
+def test_empty_journal(journal_path_fixture: Path) -> None:
+    journal = ScoreJournal(journal_path_fixture)
+    assert journal.high_score == 0
+    assert len(journal) == 0
+
+
+@pytest.fixture
+def database_fixture(tmp_path: Path) -> ScoreDatabase:
+    database = ScoreDatabase(tmp_path / "scores.sqlite3")
+    yield database
+    database.close()
+
+
+def test_database_add_run(database_fixture: ScoreDatabase) -> None:
+    assert database_fixture.high_score == 0
+    run_id = database_fixture.add_run(
+        RunStats(12, 2, 30, 12, 95.5, seed=7), "2026-03-01T12:00:00"
+    )
+    (record,) = database_fixture.top()
+    assert record == RunRecord(run_id, "2026-03-01T12:00:00", 12, 2, 30, 12, 95.5, 7)
+    assert database_fixture.high_score == 12
+
+
+def test_database_queries(database_fixture: ScoreDatabase) -> None:
+    runs = (
+        (RunStats(10, 1, 20, 10, 60), "2026-03-01T10:00:00"),
+        (RunStats(30, 3, 40, 30, 90), "2026-03-01T11:00:00"),
+        (RunStats(20, 1, 25, 20, 70), "2026-03-02T10:00:00"),
+        (RunStats(5, 3, 15, 5, 30), "2026-03-02T11:00:00"),
+    )
+    for run, finished in runs:
+        database_fixture.add_run(run, finished)
+    assert [run.score for run in database_fixture.top(3)] == [30, 20, 10]
+    assert [run.score for run in database_fixture.top_of_day("2026-03-02")] == [20, 5]
+    assert [run.score for run in database_fixture.top_of_level(1)] == [20, 10]
+    assert len(database_fixture) == 4
+
+
+def test_database_uses_indices(database_fixture: ScoreDatabase) -> None:
+    plan = database_fixture.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT score FROM runs WHERE day = ? ORDER BY score DESC",
+        ("2026-03-01",),
+    ).fetchall()
+    assert "runs_by_day" in str(plan)
+
+
+def test_database_import_scores_once(database_fixture: ScoreDatabase) -> None:
+    scores = [("2024-01-01T00:00:00", 7), ("2024-01-02T00:00:00", 3)]
+    assert database_fixture.import_scores(scores) == 2
+    assert database_fixture.import_scores(scores) == 0
+    assert database_fixture.high_score == 7
+
+
+def add_runs(path: Path, score: int) -> None:
+    database = ScoreDatabase(path)
+    for _ in range(20):
+        database.add_run(RunStats(score, 1, 1, 1, 1.0))
+    database.close()
+
+
+def test_database_concurrent_processes(tmp_path: Path) -> None:
+    path = tmp_path / "scores.sqlite3"
+    ScoreDatabase(path).close()
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(add_runs, [path] * 4, range(4)))
+    database = ScoreDatabase(path)
+    assert len(database) == 80
+    assert database.high_score == 3
+    database.close()
@@ -0,0 +1,43 @@
+import pytest
+from turtle_invaders.slots import Handle, SlotArray, StaleHandleError
+
+
+@pytest.fixture
+def slots_fixture() -> SlotArray[str]:
+    slots = SlotArray()
+    for item in ("a", "b", "c"):
+        slots.insert(item)
+    return slots
+
+
+def test_insert_and_get(slots_fixture: SlotArray[str]) -> None:
+    handle = slots_fixture.insert("d")
+    assert slots_fixture.get(handle) == "d"
+    assert len(slots_fixture) == 4
+
+
+def test_remove_swaps_last_item(slots_fixture: SlotArray[str]) -> None:
+    assert slots_fixture.remove(Handle(0, 0)) == "a"
+    assert list(slots_fixture) == ["c", "b"]
+    assert slots_fixture.get(Handle(2, 0)) == "c"
+
+
+def test_stale_handle(slots_fixture: SlotArray[str]) -> None:
+    slots_fixture.remove(Handle(1, 0))
+    handle = slots_fixture.insert("d")
+    assert handle == Handle(1, 1)
+    assert Handle(1, 0) not in slots_fixture
+    with pytest.raises(StaleHandleError):
+        slots_fixture.get(Handle(1, 0))
+    with pytest.raises(StaleHandleError):
+        slots_fixture.remove(Handle(1, 0))
+
+
+def test_unknown_handle(slots_fixture: SlotArray[str]) -> None:
+    assert Handle(10, 0) not in slots_fixture
+
+
+def test_clear(slots_fixture: SlotArray[str]) -> None:
+    slots_fixture.clear()
+    assert len(slots_fixture) == 0
+    assert len(slots_fixture.free) == 3
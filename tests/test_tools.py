@@ -1,53 +1,61 @@
 import json
 from pathlib import Path
 from queue import Queue
-from time import perf_counter, sleep
-import threading
 from typing import Protocol
 import pytest
 import tempfile
 import datetime as dt
+from tests.conftest import FakeClock
 from turtle_invaders.app import (
-    run_in_loop,
+    FixedTimestep,
     perform_task_from,
-    write_json,
     read_json,
+)
+from turtle_invaders.tools import (
+    TaskPriority,
+    TaskQueue,
+    TaskWorker,
     add_score,
+    drain_tasks_from,
+    write_json,
 )
 
 
-class AppProtocol(Protocol):
-    run: bool = True
-
-
 class FileProcotol(Protocol):
     name: str
 
 
-@pytest.fixture
-def app_fixture() -> AppProtocol:
-    return AppProtocol  # type: ignore
+def test_fixed_timestep_advance(clock_fixture: FakeClock) -> None:
+    timestep = FixedTimestep(0.005, 60, clock=clock_fixture)
+    clock_fixture.time = 0.012
+    assert timestep.advance() == 2
+    clock_fixture.time = 0.015
+    assert timestep.advance() == 1
+    assert timestep.accumulator == pytest.approx(0)
+
+
+def test_fixed_timestep_max_steps(clock_fixture: FakeClock) -> None:
+    timestep = FixedTimestep(0.005, 60, max_steps=10, clock=clock_fixture)
+    clock_fixture.time = 1
+    assert timestep.advance() == 10
+    assert timestep.accumulator == 0
 
 
-def test_run_in_loop(app_fixture: AppProtocol) -> None:
-    counter = 0
-    test_start = perf_counter()
-    start_time = perf_counter()
+def test_fixed_timestep_wait(clock_fixture: FakeClock) -> None:
+    timestep = FixedTimestep(
+        0.005, 50, clock=clock_fixture, sleep_fn=clock_fixture.sleep
+    )
+    clock_fixture.time = 0.005
+    timestep.wait()
+    assert clock_fixture.sleeps == [pytest.approx(0.015)]
+    clock_fixture.time = 0.1
+    timestep.wait()
+    assert len(clock_fixture.sleeps) == 1
 
-    def increase_counter() -> None:
-        nonlocal counter, start_time
-        if perf_counter() - start_time > 1:
-            counter += 1
-            start_time = perf_counter()
 
-    thread = threading.Thread(target=run_in_loop, args=(increase_counter, app_fixture))
-    thread.start()
-    while True:
-        if perf_counter() - test_start >= 5:
-            app_fixture.run = False
-            break
-        sleep(0.1)
-    assert counter in (4, 5, 6)
+def test_fixed_timestep_invalid() -> None:
+    with pytest.raises(ValueError):
+        FixedTimestep(0, 60)
 
 
 def test_perform_task_from() -> None:
@@ -64,6 +72,79 @@ def test_perform_task_from() -> None:
     assert test_queue.qsize() == 0
 
 
+def test_task_queue_priority() -> None:
+    calls = []
+    test_queue = TaskQueue()
+    test_queue.put(lambda: calls.append("save"), priority=TaskPriority.BOOKKEEPING)
+    test_queue.put(lambda: calls.append("first"))
+    test_queue.put(lambda: calls.append("second"))
+    assert test_queue.depth() == 3
+    assert test_queue.depth(TaskPriority.BOOKKEEPING) == 1
+    assert drain_tasks_from(test_queue) == 3
+    assert calls == ["first", "second", "save"]
+    assert test_queue.depth() == 0
+
+
+def test_drain_tasks_from_budget(clock_fixture: FakeClock) -> None:
+    test_queue = TaskQueue()
+
+    def slow_task() -> None:
+        clock_fixture.time += 0.003
+
+    for _ in range(5):
+        test_queue.put(slow_task)
+    assert drain_tasks_from(test_queue, 0.005, clock_fixture) == 2
+    assert test_queue.depth() == 3
+    assert drain_tasks_from(test_queue, None, clock_fixture) == 3
+
+
+def test_task_worker() -> None:
+    calls = []
+    test_queue = TaskQueue()
+    worker = TaskWorker(test_queue)
+    worker.start()
+    test_queue.put(lambda: calls.append(1))
+    test_queue.join()
+    assert calls == [1]
+    test_queue.put(lambda: calls.append(2), priority=TaskPriority.BOOKKEEPING)
+    worker.stop(timeout=1)
+    assert not worker.is_alive()
+    assert calls == [1, 2]
+
+
+def test_task_worker_timer() -> None:
+    class Timer:
+        def __init__(self) -> None:
+            self.records = []
+
+        def record(self, phase: str, seconds: float) -> None:
+            self.records.append((phase, seconds))
+
+    timer = Timer()
+    test_queue = TaskQueue()
+    worker = TaskWorker(test_queue, timer=timer)
+    worker.start()
+    test_queue.put(lambda: None)
+    worker.stop(timeout=1)
+    assert [phase for phase, _ in timer.records] == ["tasks"]
+
+
+def test_task_worker_survives_failing_task() -> None:
+    calls = []
+    test_queue = TaskQueue()
+    worker = TaskWorker(test_queue)
+    worker.start()
+    test_queue.put(lambda: 1 / 0)
+    test_queue.put(lambda: calls.append(1))
+    worker.stop(timeout=1)
+    assert not worker.is_alive()
+    assert calls == [1]
+
+
+def test_drain_tasks_from_empty() -> None:
+    assert drain_tasks_from(Queue(), 0.005) == 0
+
+
 @pytest.fixture
 def json_file_fixture() -> FileProcotol:
     with tempfile.NamedTemporaryFile(suffix=".json", delete_on_close=False) as file:
@@ -0,0 +1,113 @@
+import json
+import pytest
+from turtle_invaders.tournament import (
+    BOTS,
+    Match,
+    MatchResult,
+    Tournament,
+    aggregate,
+    grid,
+    play,
+    sweep,
+)
+from turtle_invaders.world import Difficulty, World
+
+
+def test_default_difficulty_matches_world_defaults() -> None:
+    world = World(seed=0)
+    assert world.cooldown_invaders_shoot == 2
+    assert world.cooldown_invaders_movement == 2
+    assert len(world.fortresses) == 2 * 4
+    assert len(list(world.formation)) == 6 * 11
+
+
+def test_world_uses_difficulty() -> None:
+    world = World(seed=0, difficulty=Difficulty(invader_rows=2, fortresses=2))
+    assert len(world.fortresses) == 2 * 2
+    assert len(list(world.formation)) == 2 * 11
+    world.level_up = True
+    world.handle_level_up()
+    world.collect_garbage()
+    assert len(list(world.formation)) == 2 * 11
+
+
+@pytest.mark.parametrize("bot", list(BOTS))
+def test_play_is_deterministic(bot: str) -> None:
+    match = Match(bot, Difficulty(), 3, 2000)
+    result = play(match)
+    assert result.ticks <= 2000
+    assert result.shots > 0
+    assert result == play(match)
+
+
+def test_play_stops_at_game_over() -> None:
+    difficulty = Difficulty(cooldown_invaders_movement=0.01)
+    result = play(Match("camper", difficulty, 0, 10**6))
+    assert result.game_over
+    assert result.ticks < 10**6
+
+
+def test_grid() -> None:
+    difficulties = grid(invader_rows=[2, 3], fortresses=[1, 2, 4])
+    assert len(difficulties) == 6
+    assert Difficulty(invader_rows=3, fortresses=1) in difficulties
+    assert grid() == [Difficulty()]
+    with pytest.raises(ValueError):
+        grid(lasers=[1])
+
+
+def test_match_key() -> None:
+    match = Match("camper", Difficulty(), 0, 100)
+    assert match.key() == Match("camper", Difficulty(), 0, 100).key()
+    assert match.key() != match._replace(seed=1).key()
+    assert match.key() != match._replace(difficulty=Difficulty(fortresses=3)).key()
+
+
+def test_tournament_caches_results(tmp_path) -> None:
+    difficulty = Difficulty(invader_rows=1)
+    matches = [Match("camper", difficulty, seed, 300) for seed in (0, 1)]
+    tournament = Tournament(tmp_path, workers=2)
+    results = tournament.run(matches)
+    assert tournament.played == 2
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    again = Tournament(tmp_path, workers=2)
+    assert again.run(matches) == results
+    assert again.played == 0
+    assert again.cached == 2
+
+    more = matches + [matches[0]._replace(seed=2)]
+    assert again.run(more)[:2] == results
+    assert again.played == 1
+
+
+def test_tournament_ignores_broken_cache_entry(tmp_path) -> None:
+    match = Match("camper", Difficulty(), 0, 100)
+    tournament = Tournament(tmp_path, workers=1)
+    tournament.cache_path(match).write_text("{")
+    assert tournament.load(match) is None
+
+
+def test_aggregate() -> None:
+    results = [
+        MatchResult(10.0, 1, 100, 10, 5, 2000, True),
+        MatchResult(20.0, 2, 300, 20, 5, 4000, True),
+        MatchResult(30.0, 3, 200, 0, 0, 6000, False),
+    ]
+    summary = aggregate(results)
+    assert summary["matches"] == 3
+    assert summary["game_over"] == 2
+    assert summary["survival_time"]["mean"] == pytest.approx(20)
+    assert summary["score"]["median"] == 200
+    assert summary["level"]["p90"] == 3
+    assert summary["accuracy"]["mean"] == pytest.approx(0.375)
+
+
+def test_sweep(tmp_path) -> None:
+    difficulties = grid(invader_rows=[1, 2])
+    results = sweep(
+        difficulties, ["camper", "tracker"], range(2), 200, Tournament(tmp_path)
+    )
+    assert len(results) == 4
+    assert {result["matches"] for result in results} == {2}
+    json.dumps(results)
@@ -0,0 +1,106 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from turtle_invaders.constants import SIMULATION_STEP  # noqa: E402
+from turtle_invaders.vecenv import ACTIONS, VecEnv  # noqa: E402
+from turtle_invaders.world import Difficulty  # noqa: E402
+
+
+def test_reset_shapes() -> None:
+    env = VecEnv(3, max_bullets=8)
+    observations = env.reset(seed=0)
+    assert observations.user.shape == (3, 2)
+    assert observations.invaders.shape == (3, 11, 6)
+    assert observations.invaders.all()
+    assert observations.bullets.shape == (3, 8, 3)
+    assert (observations.fortresses == 10).all()
+    assert (observations.lifes == 3).all()
+
+
+def test_step_before_reset() -> None:
+    with pytest.raises(RuntimeError):
+        VecEnv(1).step(np.zeros(1, dtype=int))
+
+
+def test_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        VecEnv(0)
+    with pytest.raises(ValueError):
+        VecEnv(1, frame_skip=0)
+
+
+def test_observations_match_worlds() -> None:
+    env = VecEnv(4)
+    env.reset(seed=1)
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        observations, _, _, _ = env.step(rng.integers(0, len(ACTIONS), env.n))
+    for row, world in enumerate(env.worlds):
+        assert tuple(observations.user[row]) == (world.user.x, world.user.y)
+        occupied = {invader.slot for invader in world.formation}
+        assert {tuple(slot) for slot in np.argwhere(observations.invaders[row])} == (
+            occupied
+        )
+        lifes = {fortress.handle.index: fortress.lifes for fortress in world.fortresses}
+        for index, value in enumerate(observations.fortresses[row]):
+            assert value == lifes.get(index, 0)
+        assert observations.bullet_count[row] == len(world.bullets)
+
+
+def test_rewards_sum_to_score() -> None:
+    env = VecEnv(2)
+    env.reset(seed=2)
+    total = np.zeros(2)
+    for _ in range(400):
+        _, rewards, dones, _ = env.step(np.full(2, 3))
+        assert not dones.any()
+        total += rewards
+    assert list(total) == [world.score for world in env.worlds]
+    assert total.sum() > 0
+
+
+def test_lockstep_is_deterministic() -> None:
+    first, second = VecEnv(2), VecEnv(2)
+    first.reset(seed=5)
+    second.reset(seed=5)
+    for action in [0, 1, 2, 3, 4, 5] * 20:
+        a = first.step(np.full(2, action))[0]
+        b = second.step(np.full(2, action))[0]
+        for x, y in zip(a, b):
+            assert np.array_equal(x, y)
+
+
+def test_done_environments_are_reset() -> None:
+    env = VecEnv(2, frame_skip=10, max_ticks=100)
+    env.reset(seed=0)
+    for _ in range(9):
+        _, _, dones, _ = env.step(np.zeros(2, dtype=int))
+        assert not dones.any()
+    observations, _, dones, infos = env.step(np.zeros(2, dtype=int))
+    assert dones.all()
+    assert infos[0] == {"score": 0, "level": 0, "ticks": 100, "truncated": True}
+    assert [world.tick for world in env.worlds] == [0, 0]
+    assert observations.invaders.all()
+
+
+def test_game_over_is_done() -> None:
+    env = VecEnv(1, Difficulty(cooldown_invaders_movement=0.01), frame_skip=50)
+    env.reset(seed=0)
+    for _ in range(1000):
+        _, _, dones, infos = env.step(np.zeros(1, dtype=int))
+        if dones[0]:
+            break
+    assert dones[0]
+    assert not infos[0]["truncated"]
+
+
+def test_user_moves_at_most_at_user_speed() -> None:
+    env = VecEnv(1, difficulty=Difficulty(user_speed=120))
+    observations = env.reset(seed=3)
+    right = ACTIONS.index((1, False))
+    for _ in range(20):
+        x = float(observations.user[0, 0])
+        observations, _, _, _ = env.step(np.array([right]))
+        travel = observations.user[0, 0] - x
+        assert 0 < travel <= 120 * SIMULATION_STEP * env.frame_skip + 1e-4
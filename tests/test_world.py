@@ -0,0 +1,442 @@
+import pytest
+from tests.conftest import World, BulletState, InvaderState, FortressState
+from turtle_invaders.constants import (
+    SIMULATION_STEP,
+    InvadersMovementDirection,
+    ObjectDirection,
+)
+from turtle_invaders.world import WorldEvent
+
+
+class RecordingObserver:
+    def __init__(self) -> None:
+        self.events = []
+
+    def notify(self, event: WorldEvent, subject: object) -> None:
+        self.events.append((event, subject))
+
+
+def test_initialize_invaders(world_fixture: World) -> None:
+    world_fixture.initialize_invaders()
+    assert len(world_fixture.invaders) > 0
+
+
+def test_initialize_invaders_destroys_old_grid(world_fixture: World) -> None:
+    old_invader = world_fixture.invaders[0][0]
+    world_fixture.initialize_invaders()
+    assert old_invader.alive is False
+
+
+def test_initialize_fortresses(world_fixture: World) -> None:
+    world_fixture.initialize_fortresses(300, amount=4)
+    assert len(world_fixture.fortresses) == 4
+
+
+def test_initialize_fortressesV2(world_fixture: World) -> None:
+    world_fixture.initialize_fortressesV2(300)
+    assert len(world_fixture.fortresses) == 4 * 2
+
+
+def test_attach_replays_state(world_fixture: World) -> None:
+    observer = RecordingObserver()
+    world_fixture.attach(observer)
+    spawned = [
+        subject for event, subject in observer.events if event is WorldEvent.SPAWN
+    ]
+    assert world_fixture.user in spawned
+    assert len(spawned) == 1 + 66 + len(world_fixture.fortresses)
+
+
+def test_mark_all_bullets_for_removal(
+    world_fixture: World, bullet_state_fixture: BulletState
+) -> None:
+    world_fixture.add_bullet(bullet_state_fixture)
+    world_fixture.mark_all_bullets_for_removal()
+    assert bullet_state_fixture.alive is False
+    assert world_fixture.garbage == [bullet_state_fixture]
+
+
+def test_move_user(world_fixture: World) -> None:
+    world_fixture.move_user(1)
+    assert world_fixture.user.x == 1
+
+
+def test_move_user_screen_limit(world_fixture: World) -> None:
+    world_fixture.user.x = 280
+    world_fixture.user_travel = 15
+    world_fixture.move_user(15)
+    assert world_fixture.user.x == 280
+    assert world_fixture.user_travel == 15
+
+
+def test_move_user_speed_limit(world_fixture: World) -> None:
+    world_fixture.step(0.01)
+    world_fixture.move_user(15)
+    world_fixture.move_user(-15)
+    assert world_fixture.user.x == pytest.approx(3)
+    assert world_fixture.user_travel == pytest.approx(0)
+    world_fixture.step(0.01)
+    world_fixture.move_user(-15)
+    assert world_fixture.user.x == pytest.approx(0)
+
+
+def test_move_invaders(world_fixture: World) -> None:
+    x = world_fixture.invaders[0][0].x
+    world_fixture.advance(world_fixture.cooldown_invaders_movement)
+    world_fixture.move_invaders()
+    assert world_fixture.invaders[0][0].x == x + 15
+
+
+def test_move_invaders_change_direction(world_fixture: World) -> None:
+    world_fixture.invaders = [[InvaderState(280, 0)]]
+    world_fixture.advance(world_fixture.cooldown_invaders_movement)
+    world_fixture.move_invaders()
+    assert world_fixture.invaders[0][0].y == -30
+    assert world_fixture.invaders_movement_direction == InvadersMovementDirection.LEFT
+
+
+def test_replacing_invaders_destroys_former_grid(world_fixture: World) -> None:
+    former = list(world_fixture.formation)
+    invader = InvaderState(0, 0)
+    world_fixture.invaders = [[invader]]
+    assert all(not item.alive for item in former)
+    assert invader in world_fixture.index
+    assert len(world_fixture.index) == 1 + len(world_fixture.fortresses)
+    ghost = former[-1]
+    world_fixture.add_bullet(BulletState(ghost.x, ghost.y, ObjectDirection.NORTH, "g"))
+    world_fixture.handle_bullets_collisions()
+    assert world_fixture.score == 0
+
+
+def test_move_invaders_level_up(world_fixture: World) -> None:
+    world_fixture.invaders = [[None]]
+    world_fixture.advance(world_fixture.cooldown_invaders_movement)
+    world_fixture.move_invaders()
+    assert world_fixture.level_up is True
+
+
+def test_move_bullets(world_fixture: World, bullet_state_fixture: BulletState) -> None:
+    world_fixture.add_bullet(bullet_state_fixture)
+    world_fixture.move_bullets(world_fixture.cooldown_bullet_movement)
+    assert bullet_state_fixture.y == pytest.approx(1)
+
+
+def test_move_bullets_partial_step(
+    world_fixture: World, bullet_state_fixture: BulletState
+) -> None:
+    world_fixture.add_bullet(bullet_state_fixture)
+    world_fixture.move_bullets(world_fixture.cooldown_bullet_movement / 2)
+    assert bullet_state_fixture.y == pytest.approx(0.5)
+
+
+def test_handle_invaders_shooting(world_fixture: World) -> None:
+    world_fixture.advance(world_fixture.cooldown_invaders_shoot)
+    world_fixture.handle_invaders_shooting()
+    assert len(world_fixture.bullets) == 1
+    assert list(world_fixture.bullets)[0].heading == ObjectDirection.SOUTH
+
+
+def test_handle_invaders_shooting_on_cooldown(world_fixture: World) -> None:
+    world_fixture.cooldown_invaders_last_shoot = (
+        world_fixture.time + world_fixture.cooldown_invaders_shoot * 1.2
+    )
+    world_fixture.handle_invaders_shooting()
+    assert len(world_fixture.bullets) == 0
+
+
+def test_handle_user_shooting(world_fixture: World) -> None:
+    world_fixture.handle_user_shooting()
+    assert len(world_fixture.bullets) == 1
+    assert list(world_fixture.bullets)[0].heading == ObjectDirection.NORTH
+
+
+def test_handle_user_shooting_on_cooldown(world_fixture: World) -> None:
+    world_fixture.cooldown_user_last_shoot = (
+        world_fixture.time + world_fixture.cooldown_user_shoot * 1.2
+    )
+    world_fixture.handle_user_shooting()
+    assert len(world_fixture.bullets) == 0
+
+
+def test_bullet_hits_invader(world_fixture: World) -> None:
+    invader = world_fixture.invaders[0][-1]
+    bullet = BulletState(invader.x, invader.y, ObjectDirection.NORTH, "green")
+    world_fixture.add_bullet(bullet)
+    world_fixture.handle_bullets_collisions()
+    assert invader.alive is False and bullet.alive is False
+    assert world_fixture.score == 1
+
+
+def test_bullet_hits_fortress(
+    world_fixture: World, fortress_state_fixture: FortressState
+) -> None:
+    bullet = BulletState(0, 0, ObjectDirection.SOUTH, "blue")
+    world_fixture.add_fortress(fortress_state_fixture)
+    world_fixture.add_bullet(bullet)
+    world_fixture.handle_bullets_collisions()
+    assert fortress_state_fixture.lifes == 9
+    assert bullet.alive is False
+
+
+def test_bullet_destroys_fortress(
+    world_fixture: World, fortress_state_fixture: FortressState
+) -> None:
+    fortress_state_fixture.lifes = 1
+    world_fixture.add_fortress(fortress_state_fixture)
+    world_fixture.add_bullet(BulletState(0, 0, ObjectDirection.SOUTH, "blue"))
+    world_fixture.handle_bullets_collisions()
+    assert fortress_state_fixture.alive is False
+
+
+def test_bullet_hits_user(world_fixture: World) -> None:
+    user = world_fixture.user
+    world_fixture.add_bullet(BulletState(user.x, user.y, ObjectDirection.SOUTH, "blue"))
+    world_fixture.add_bullet(BulletState(100, 100, ObjectDirection.NORTH, "green"))
+    world_fixture.handle_bullets_collisions()
+    assert world_fixture.lifes == 2
+    assert all(not bullet.alive for bullet in world_fixture.bullets)
+
+
+def test_own_bullet_does_not_hit_user(world_fixture: World) -> None:
+    user = world_fixture.user
+    world_fixture.add_bullet(BulletState(user.x, user.y, user.heading, "green"))
+    world_fixture.handle_bullets_collisions()
+    assert world_fixture.lifes == 3
+
+
+@pytest.mark.parametrize("bullets_destroy_bullets", (True, False))
+def test_bullets_destroy_bullets(
+    world_fixture: World, bullets_destroy_bullets: bool
+) -> None:
+    world_fixture.add_bullet(BulletState(0, 0, ObjectDirection.NORTH, "green"))
+    world_fixture.add_bullet(BulletState(0, 2, ObjectDirection.SOUTH, "blue"))
+    world_fixture.handle_bullets_collisions(bullets_destroy_bullets)
+    assert all(
+        bullet.alive is not bullets_destroy_bullets for bullet in world_fixture.bullets
+    )
+
+
+def test_bullet_leaves_screen(world_fixture: World) -> None:
+    bullet = BulletState(0, 401, ObjectDirection.NORTH, "green")
+    world_fixture.add_bullet(bullet)
+    world_fixture.handle_bullets_collisions()
+    assert bullet.alive is False
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_fast_bullet_does_not_tunnel(vectorized: bool) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
+    world = World(seed=0, vectorized=vectorized)
+    invader = world.invaders[0][-1]
+    bullet = BulletState(invader.x, invader.y - 50, ObjectDirection.NORTH, "green")
+    world.add_bullet(bullet)
+    world.cooldown_bullet_movement = 0.001
+    world.move_bullets(0.1)
+    assert bullet.y == pytest.approx(invader.y + 50)
+    world.handle_bullets_collisions()
+    assert invader.alive is False and bullet.alive is False
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_fast_bullets_destroy_bullets(vectorized: bool) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
+    world = World(seed=0, vectorized=vectorized)
+    up = BulletState(0, 0, ObjectDirection.NORTH, "green")
+    down = BulletState(0, 40, ObjectDirection.SOUTH, "blue")
+    world.add_bullet(up)
+    world.add_bullet(down)
+    world.cooldown_bullet_movement = 0.001
+    world.move_bullets(0.04)
+    assert up.y > down.y
+    world.handle_bullets_collisions(bullets_destroy_bullets=True)
+    assert up.alive is False and down.alive is False
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_earliest_contact_wins(vectorized: bool) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
+    world = World(seed=0, vectorized=vectorized)
+    invader = world.invaders[0][-1]
+    late = BulletState(invader.x, invader.y - 60, ObjectDirection.NORTH, "green")
+    early = BulletState(invader.x, invader.y - 20, ObjectDirection.NORTH, "green")
+    world.add_bullet(late)
+    world.add_bullet(early)
+    world.cooldown_bullet_movement = 0.001
+    world.move_bullets(0.05)
+    world.handle_bullets_collisions()
+    assert invader.alive is False
+    assert early.alive is False
+    assert late.alive is True
+    assert world.score == 1
+
+
+def test_vectorized_collisions_match_loop_with_large_steps() -> None:
+    pytest.importorskip("numpy")
+    worlds = [World(seed=3), World(seed=3, vectorized=True)]
+    for world in worlds:
+        world.cooldown_invaders_shoot = 0.1
+        world.cooldown_bullet_movement = 0.001
+        for step in range(600):
+            if step % 20 == 0:
+                world.move_user(15 if step % 300 < 150 else -15)
+                world.handle_user_shooting(time_interval=0.05)
+            world.step(1 / 60)
+    loop, vectorized = worlds
+    assert loop.score > 0
+    assert (loop.score, loop.lifes, loop.level) == (
+        vectorized.score,
+        vectorized.lifes,
+        vectorized.level,
+    )
+    assert [(b.x, b.y) for b in loop.bullets] == [
+        (b.x, b.y) for b in vectorized.bullets
+    ]
+
+
+def test_bullets_destroy_bullets_by_default(world_fixture: World) -> None:
+    assert world_fixture.bullets_destroy_bullets is True
+    up = BulletState(0, 0, ObjectDirection.NORTH, "green")
+    down = BulletState(0, 20, ObjectDirection.SOUTH, "blue")
+    world_fixture.add_bullet(up)
+    world_fixture.add_bullet(down)
+    for _ in range(10):
+        world_fixture.step()
+    assert up.alive is False and down.alive is False
+
+
+def test_bullets_in_other_columns_pass(world_fixture: World) -> None:
+    up = BulletState(0, 0, ObjectDirection.NORTH, "green")
+    down = BulletState(7, 2, ObjectDirection.SOUTH, "blue")
+    world_fixture.add_bullet(up)
+    world_fixture.add_bullet(down)
+    world_fixture.handle_bullets_collisions()
+    assert up.alive is True and down.alive is True
+
+
+@pytest.mark.parametrize("lifes, expected", ((4, True), (0, False)))
+def test_check_lifes_left(world_fixture: World, lifes: int, expected: bool) -> None:
+    world_fixture.lifes = lifes
+    assert world_fixture.check_lifes_left() is expected
+
+
+@pytest.mark.parametrize("y_cor, expected", ((-20, False), (20, True)))
+def test_check_invaders_pass(
+    world_fixture: World,
+    invader_state_fixture: InvaderState,
+    y_cor: int,
+    expected: bool,
+) -> None:
+    world_fixture.invaders = [[invader_state_fixture]]
+    assert world_fixture.check_invaders_pass(y_cor) is expected
+
+
+def test_reduce_cooldown(world_fixture: World) -> None:
+    cooldown_bullet_movement_start = world_fixture.cooldown_bullet_movement
+    cooldown_invaders_movement_start = world_fixture.cooldown_invaders_movement
+    cooldown_user_shoot_start = world_fixture.cooldown_user_shoot
+    world_fixture.reduce_cooldown(
+        bullet_movement=0.001,
+        inverders_movement=-0.03,
+        user_shoot=0.009,
+    )
+    assert (
+        cooldown_bullet_movement_start - world_fixture.cooldown_bullet_movement
+        == pytest.approx(0.001)
+    )
+    assert (
+        cooldown_invaders_movement_start - world_fixture.cooldown_invaders_movement
+        == pytest.approx(0.03)
+    )
+    assert (
+        cooldown_user_shoot_start - world_fixture.cooldown_user_shoot
+        == pytest.approx(0.009)
+    )
+    assert len(world_fixture.garbage) == 0
+
+
+def test_handle_level_up_permission_false(world_fixture: World) -> None:
+    game_level = world_fixture.level
+    world_fixture.handle_level_up()
+    assert world_fixture.level == game_level
+
+
+def test_handle_level_up_permission_true(world_fixture: World) -> None:
+    world_fixture.level_up = True
+    world_fixture.handle_level_up()
+    assert not world_fixture.level_up
+    assert world_fixture.level == 1
+
+
+def test_collect_garbage(
+    world_fixture: World,
+    bullet_state_fixture: BulletState,
+    invader_state_fixture: InvaderState,
+    fortress_state_fixture: FortressState,
+) -> None:
+    world_fixture.add_bullet(bullet_state_fixture)
+    world_fixture.invaders = [[invader_state_fixture]]
+    world_fixture.add_fortress(fortress_state_fixture)
+    world_fixture.garbage.extend(
+        [bullet_state_fixture, invader_state_fixture, fortress_state_fixture]
+    )
+    world_fixture.collect_garbage()
+    assert bullet_state_fixture not in list(world_fixture.bullets)
+    assert invader_state_fixture not in world_fixture.invaders[0]
+    assert fortress_state_fixture not in list(world_fixture.fortresses)
+
+
+def test_step_headless(world_fixture: World) -> None:
+    for _ in range(3_000):
+        world_fixture.step()
+    assert world_fixture.time == pytest.approx(3_000 * SIMULATION_STEP)
+    assert len(world_fixture.bullets) > 0
+
+
+def test_vectorized_collisions_match_loop() -> None:
+    pytest.importorskip("numpy")
+    worlds = [World(seed=7), World(seed=7, vectorized=True)]
+    for world in worlds:
+        world.cooldown_invaders_shoot = 0.1
+        for step in range(5_000):
+            if step % 100 == 0:
+                world.move_user(15 if step % 3000 < 1500 else -15)
+                world.handle_user_shooting(time_interval=0.05)
+            world.step()
+    loop, vectorized = worlds
+    assert loop.score > 0
+    assert (loop.score, loop.lifes, loop.level) == (
+        vectorized.score,
+        vectorized.lifes,
+        vectorized.level,
+    )
+    assert [(b.x, b.y) for b in loop.bullets] == [
+        (b.x, b.y) for b in vectorized.bullets
+    ]
+
+
+def test_publish_snapshot(world_fixture: World) -> None:
+    snapshot = world_fixture.snapshot
+    world_fixture.score = 5
+    world_fixture.move_user(1)
+    assert snapshot.score == 0
+    assert snapshot.user == (0, -330)
+    assert len(snapshot.invaders) == len(list(world_fixture.formation))
+    assert len(snapshot.fortresses) == len(world_fixture.fortresses)
+    published = world_fixture.publish()
+    assert published is world_fixture.snapshot
+    assert published.score == 5
+    assert published.user == (1, -330)
+    with pytest.raises(AttributeError):
+        published.score = 0  # type: ignore
+
+
+def test_handle_user_shooting_honors_reduced_cooldown(world_fixture: World) -> None:
+    world_fixture.cooldown_user_shoot = 0.1
+    world_fixture.handle_user_shooting()
+    world_fixture.time += 0.2
+    world_fixture.handle_user_shooting()
+    assert world_fixture.shots == 2
+    assert not world_fixture.can_user_shoot
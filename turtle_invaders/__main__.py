@@ -1,4 +1,6 @@
+import argparse
 import logging
+from pathlib import Path
 from turtle_invaders.app import App
 
 logging.basicConfig(format="[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
@@ -7,7 +9,14 @@ logger.setLevel(logging.INFO)
 
 
 def main():
-    app = App()
+    parser = argparse.ArgumentParser(description="Play turtle invaders.")
+    parser.add_argument("--seed", type=int, help="seed of the random generator")
+    parser.add_argument("--record", type=Path, help="record the game to a file")
+    parser.add_argument(
+        "--profile", action="store_true", help="time phases of every frame"
+    )
+    args = parser.parse_args()
+    app = App(seed=args.seed, record=args.record, profile=args.profile)
     app.start()
 
 
@@ -1,19 +1,19 @@
 from __future__ import annotations
-from contextlib import suppress
+from collections.abc import Callable
 from pathlib import Path
 import turtle as t
 import logging
+import secrets
 from time import perf_counter, sleep
-from random import randint
-from queue import Queue
-import threading
 
 from turtle_invaders.tools import (
-    add_score,
+    FixedTimestep,
+    TaskPriority,
+    TaskQueue,
+    TaskWorker,
+    drain_tasks_from,
     perform_task_from,
     read_json,
-    run_in_loop,
-    write_json,
 )
 from turtle_invaders.scoreboard import (
     CountDownLabel,
@@ -22,22 +22,36 @@ from turtle_invaders.scoreboard import (
     HighScore,
     LifeScore,
     Level,
+    PerformanceOverlay,
+)
+from turtle_invaders.profiler import FrameProfiler
+from turtle_invaders.replay import Recorder
+from turtle_invaders.scores import RunStats, ScoreDatabase, ScoreJournal
+from turtle_invaders.renderer import TurtleRenderer
+from turtle_invaders.world import World, WorldSnapshot
+from turtle_invaders.controls import Controls
+from turtle_invaders.constants import (
+    FRAME_RATE,
+    SIMULATION_STEP,
+    TASK_BUDGET,
+    Screen,
 )
-from turtle_invaders.spaceships import SpaceShip, Invader
-from turtle_invaders.fortresses import Fortress
-from turtle_invaders.types_ import numeric
-from turtle_invaders.constants import Screen, InvadersMovementDirection
 
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-rlock = threading.RLock()
 
 
 class App:
     run: bool = True
 
-    def __init__(self):
+    def __init__(
+        self,
+        seed: int | None = None,
+        record: str | Path | None = None,
+        profile: bool = False,
+        data_dir: str | Path | None = None,
+    ):
         self.screen = t.Screen()
         self.screen.setup(width=Screen.WIDTH, height=Screen.HEIGHT)
         self.screen.title("Turtle invaders")
@@ -48,406 +62,87 @@ class App:
         self.game_high_score = HighScore()
         self.game_lifes = LifeScore()
         self.game_level = Level()
-        self.game_level_up = False
-        self.user = SpaceShip()
-        self.invaders: list[list[Invader]]
-        self.invaders_movement_direction = InvadersMovementDirection.RIGHT
-        self.initialize_invaders()
-        self.bullets = []
-        self.garbage = set()
-        self.tasks = Queue()
-        self.tasks_main = Queue()
-        self.fortresses: list[Fortress]
-        self.cooldown_user_shoot = 0.5
-        self.cooldown_user_last_shoot = perf_counter() - 30
-        self.cooldown_invaders_shoot = 2
-        self.cooldown_invaders_last_shoot = perf_counter()
-        self.cooldown_invaders_movement = 2
-        self.cooldown_invaders_last_move = perf_counter()
-        self.cooldown_bullet_movement = 0.005
-        self.cooldown_bullet_last_move = perf_counter()
-        self.initialize_fortressesV2(-290)
-        self.screen.onkey(
-            lambda: (
-                self.user.teleport(self.user.xcor() - 15)
-                if self.user.xcor() - 15 > Screen.LEFT_LIMIT_FOR_OBJECTS
-                else ...
-            ),
-            "Left",
-        )
-        self.screen.onkey(
-            lambda: (
-                self.user.teleport(self.user.xcor() + 15)
-                if self.user.xcor() + 15 < Screen.RIGHT_LIMIT_FOR_OBJECTS
-                else ...
-            ),
-            "Right",
+        self.overlay = PerformanceOverlay()
+        self.tasks = TaskQueue()
+        self.tasks_main = TaskQueue()
+        self.worker: TaskWorker | None = None
+        self.profiler = FrameProfiler(enabled=profile)
+        if record is not None and seed is None:
+            seed = secrets.randbits(63)
+        self.world = World(seed=seed)
+        self.recorder: Recorder | None = None
+        if record is not None:
+            self.recorder = Recorder(record, seed, SIMULATION_STEP)
+            self.recorder.attach(self.world)
+        self.renderer = TurtleRenderer(
+            score=self.game_score,
+            lifes=self.game_lifes,
+            level=self.game_level,
+            screen=self.screen,
         )
-        self.screen.onkey(self.handle_user_shooting, "space")
+        self.world.attach(self.renderer)
+        self.timestep = FixedTimestep(SIMULATION_STEP, FRAME_RATE)
+        self.controls = Controls(speed=self.world.difficulty.user_speed)
+        self.controls.bind(self.screen)
         self.screen.onkey(self.stop, "q")
-        self.high_score_path = (
-            Path(__file__).parent / Path("..", "data", "highscore.json")
-        ).resolve()
+        self.screen.onkey(self.dump_profile, "p")
+        self.screen.onkey(self.toggle_overlay, "o")
+        data_dir = (
+            Path(data_dir)
+            if data_dir is not None
+            else Path(__file__).parent / Path("..", "data")
+        )
+        self.high_score_path = (data_dir / "highscore.json").resolve()
         self.high_score_path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile_path = self.high_score_path.parent / "profile.json"
+        self.seed = seed
+        self.scores = ScoreDatabase(self.high_score_path.with_name("scores.sqlite3"))
+        self.import_scores()
 
-    # INITIALIZATION
-    def initialize_invaders(self, top_row_y: numeric = 300, num_rows: int = 6) -> None:
-        """Create instances of type Invaders. Fill screen with "enimies".
-        <top_row_y> coresponds to the y coordinate of the top row. Number of rows is
-        defined by parameter <num_rows>. <num_rows> must be a positiv integer.
+    # SIMULATION
+    def step(self) -> None:
+        """Run a single fixed time step of the game rules. The held keys are sampled
+        and commands pushed since the last step are applied first.
 
         Keyword arguments:
         argument -- description
-            top_row_y (numeric): Y coordinate for highes row is bots
-            num_rows (int): number of rows
         Return: return_description
             None
         """
 
-        if num_rows < 0:
-            raise ValueError("Parameter num_rows must be a positive integer.")
-        START_X = Screen.LEFT_LIMIT_FOR_OBJECTS
-        END_X = int(Screen.WIDTH / 4)
-        self.invaders_movement_direction = InvadersMovementDirection.RIGHT
-        self.invaders = [
-            [Invader(x, top_row_y - i * 40) for i in range(num_rows)]
-            for x in range(START_X, END_X, 40)
-        ]
-
-    def initialize_fortresses(self, y: numeric, amount: int = 4) -> None:
-        """Create instances of type Fortress building a secure shelter for user.
-        Parameter <y> set a coordinate at which <amount> of instances will be
-        positioned. <amount> must be positive integer.
-
-        Keyword arguments:
-        argument -- description
-            y (numeric): coordinate to place fortresses
-            amount (int): amount of fortresses.
-        Return: return_description
-            None
-        """
-
-        if amount < 0:
-            raise ValueError(
-                f"Parameter must be greater or equal null. Given: {amount}."
-            )
-        distance = int(Screen.WIDTH / (amount + 1))
-        self.fortresses = [
-            Fortress(x, y)
-            for x in range(
-                int(Screen.LEFT_LIMIT_FOR_OBJECTS) + distance,
-                int(Screen.RIGHT_LIMIT_FOR_OBJECTS),
-                distance,
-            )
-        ]
-
-    def initialize_fortressesV2(self, y: numeric, amount: int = 4) -> None:
-        """Create instances of type Fortress building a secure shelter for user.
-        Parameter <y> set a coordinate at which <amount> of instances will be
-        positioned. <amount> must be positive integer.
-
-        Keyword arguments:
-        argument -- description
-            y (numeric): coordinate to place fortresses
-            amount (int): amount of fortresses.
-        Return: return_description
-            None
-        """
-
-        if amount < 0:
-            raise ValueError(
-                f"Parameter must be greater or equal null. Given: {amount}."
-            )
-        distance = int(Screen.WIDTH / (amount + 1))
-        self.fortresses = []
-        for x in range(
-            int(Screen.LEFT_LIMIT_FOR_OBJECTS) + distance,
-            int(Screen.RIGHT_LIMIT_FOR_OBJECTS),
-            distance,
-        ):
-            self.fortresses.append(Fortress(x - Fortress.radius, y))
-            self.fortresses.append(Fortress(x + Fortress.radius, y))
-
-    def mark_all_bullets_for_removal(self) -> None:
-        """Remove all bullets on the screen.
-        Destroy all bullets and mark them for removal.
-        Method is thread safe.
-
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            None
-        """
-
-        if len(self.bullets) > 0:
-            logger.debug("Reset list of bullets")
-            [self.tasks_main.put(bullet.destroy) for bullet in self.bullets]
-            self.garbage.update(self.bullets)
-
-    # MOVEMENTS
-    def move_invaders(self, sidestep: numeric = 15, forward_step: numeric = 30) -> None:
-        """Handle movement of invaders on the screen.
-        Paramers define length of each movement for all objects. Invaders move from
-        left to right until the screen boarder. Then they step towards the user and
-        change movement direction.
-
-        Method has a colddown.
-
-        Keyword arguments:
-        argument -- description
-            sidestep (numeric): length of the sidestep
-            forward_step (numeric): length of the forward step
-        Return: return_description
-            None
-        """
-
-        if (
-            perf_counter() - self.cooldown_invaders_last_move
-            < self.cooldown_invaders_movement
-        ):
-            return
-        self.cooldown_invaders_last_move = perf_counter()
-        direction = self.invaders_movement_direction
-        x_is_found = False
-        x = None
-        for row in self.invaders[:: direction * -1]:
-            for i in row:
-                if i is not None:
-                    x = i.xcor()
-                    x_is_found = True
-                if x_is_found:
-                    break
-            if x_is_found:
-                break
-        if x is None:
-            logger.debug("Missing invaders.")
-            logger.debug("Asume a level up...")
-            self.game_level_up = True
-            return
-        if (
-            Screen.LEFT_LIMIT_FOR_OBJECTS
-            < x + sidestep * direction
-            < Screen.RIGHT_LIMIT_FOR_OBJECTS
-        ):
-            [
-                [
-                    item.teleport(item.xcor() + sidestep * direction, item.ycor())
-                    for item in column
-                    if item is not None
-                ]
-                for column in self.invaders
-            ]
-        else:
-            self.invaders_movement_direction *= -1
-            [
-                [
-                    item.teleport(item.xcor(), item.ycor() - forward_step)
-                    for item in column
-                    if item is not None
-                ]
-                for column in self.invaders
-            ]
-
-    def move_bullets(self) -> None:
-        """Handle movements of the bullets on the screen.
-        Step length for all bullets is set to 1.
-
-        Method has a colddown.
-
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            None
-        """
-
-        if (
-            perf_counter() - self.cooldown_bullet_last_move
-            < self.cooldown_bullet_movement
-        ):
-            return
-        self.cooldown_bullet_last_move = perf_counter()
-        [bullet.move(1) for bullet in self.bullets]
+        timer = self.profiler if self.profiler.enabled else None
+        self.controls.sample(self.world, self.timestep.step)
+        self.world.step(self.timestep.step, timer)
+        if self.recorder is not None:
+            self.recorder.observe(self.world)
 
     # SHOOTING
-    def handle_invaders_shooting(self) -> None:
-        """Make invaders to shoot automaticaly.
-        Find random invader in the top row and let it shoot. Shoots have a cooldown.
-        Method is thread safe.
-
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            None
-        """
-
-        if (
-            perf_counter() - self.cooldown_invaders_last_shoot
-            < self.cooldown_invaders_shoot
-        ):
-            return
-        column = randint(0, len(self.invaders) - 1)
-        for invader in self.invaders[column][::-1]:
-            if invader is not None:
-                rlock.acquire()
-                self.bullets.append(invader.shoot())
-                rlock.release()
-                self.cooldown_invaders_last_shoot = perf_counter()
-                return
-
-    def handle_user_shooting(self, time_interval: numeric = 0.5) -> None:
-        """Handle user's shooting process thread safe.
-
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            None
-        """
-
-        if perf_counter() - self.cooldown_user_last_shoot > time_interval:
-            rlock.acquire()
-            self.bullets.append(self.user.shoot())
-            rlock.release()
-            self.cooldown_user_last_shoot = perf_counter()
-
-    # CHECKS
-    def handle_bullets_collisions(self, bullets_destroy_bullets: bool = False) -> None:
-        """Handle bullet's collisions.
-        If a distance between object and bullet is closer then radius of both objects,
-        then application assumes a collision. Bullets and invaders disappear, user's and
-        fortresses life points reduses. Parameter <bullets_destroy_bullets> configurates
-        behaviour of the bullets when they are close to each other.
+    def handle_user_shooting(self) -> None:
+        """Request a shot of the user. It is fired in the next step the cooldown
+        allows.
 
         Keyword arguments:
         argument -- description
-            bullets_destroy_bullets (bool): flag
         Return: return_description
             None
         """
 
-        for bullet in self.bullets:
-            if bullet in self.garbage:
-                continue
-            if (self.user.xcor() - bullet.xcor()) ** 2 + (
-                self.user.ycor() - bullet.ycor()
-            ) ** 2 <= (
-                self.user.radius + bullet.radius
-            ) ** 2 and self.user.heading() != bullet.heading():
-                logger.debug("Bullet hit user (%s, %s)", bullet.xcor(), bullet.ycor())
-                self.tasks_main.put(self.game_lifes.reduce_)
-                self.tasks_main.put(self.game_lifes.update)
-                self.tasks.put(self.mark_all_bullets_for_removal)
-            for fortress in self.fortresses:
-                if (fortress.xcor() - bullet.xcor()) ** 2 + (
-                    fortress.ycor() - bullet.ycor()
-                ) ** 2 <= (fortress.radius + bullet.radius) ** 2:
-                    logger.debug(
-                        "Bullet hit fortress (%s, %s)", bullet.xcor(), bullet.ycor()
-                    )
-                    self.tasks_main.put(fortress.change_color)
-                    self.tasks_main.put(bullet.destroy)
-                    self.tasks.put(fortress.hit)
-                    self.garbage.add(bullet)
-                    if fortress.lifes <= 0:
-                        self.tasks_main.put(fortress.destroy)
-                        self.garbage.add(fortress)
-            for col in self.invaders:
-                for invader in col:
-                    if (
-                        invader is not None
-                        and (invader.xcor() - bullet.xcor()) ** 2
-                        + (invader.ycor() - bullet.ycor()) ** 2
-                        <= (invader.radius + bullet.radius) ** 2
-                        and invader.heading() != bullet.heading()
-                    ):
-                        logger.debug(
-                            "Bullet hit invader (%s, %s)", bullet.xcor(), bullet.ycor()
-                        )
-                        self.tasks_main.put(invader.destroy)
-                        self.tasks_main.put(bullet.destroy)
-                        self.tasks_main.put(self.game_score.update)
-                        self.tasks.put((lambda: self.game_score.increase(1)))
-                        self.garbage.add(bullet)
-                        self.garbage.add(invader)
-            if bullets_destroy_bullets:
-                for other_bullet in self.bullets:
-                    if (other_bullet.xcor() - bullet.xcor()) ** 2 + (
-                        other_bullet.ycor() - bullet.ycor()
-                    ) ** 2 <= (
-                        other_bullet.radius + bullet.radius
-                    ) ** 2 and other_bullet.heading() != bullet.heading():
-                        logger.debug(
-                            "Bullet hit bullet (%s, %s)", bullet.xcor(), bullet.ycor()
-                        )
-                        self.tasks_main.put(other_bullet.destroy)
-                        self.tasks_main.put(bullet.destroy)
-                        self.garbage.add(bullet)
-                        self.garbage.add(other_bullet)
-            if bullet.ycor() < -Screen.HEIGHT / 2 or bullet.ycor() > Screen.HEIGHT / 2:
-                self.tasks_main.put(bullet.destroy)
-                self.garbage.add(bullet)
-
-    def check_lifes_left(
-        self,
-    ) -> bool:
-        """Method checks that user have enough life points to continue game.
+        self.controls.press_fire()
+        self.controls.release_fire()
 
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            Returns True when user have more then 0 life points otherwise False.
-        """
-
-        if self.game_lifes.value <= 0:
-            logger.info("User lost all life points")
-            return False
-        return True
-
-    def check_invaders_pass(self, y_cor: numeric = -280) -> bool:
-        """Methode checks if invaders pass certain y coordinate and win. Coordinate is
-        defined by parameter <y_cor>.
+    def show_game_over_label(self) -> None:
+        """Show "GAME OVER" laber on the screen
 
         Keyword arguments:
         argument -- description
-            y_cor (numeric): cordinate that invaders must pass to win the game
-        Return: return_description
-            Returns True when first invader passed the <y_cor> otherwise False.
-        """
-
-        for column in self.invaders:
-            for row in column:
-                if row is not None:
-                    if row.ycor() <= y_cor:
-                        return True
-        return False
-
-    # UPDATE GAME STATE
-    def reduce_cooldown(
-        self,
-        bullet_movement: float = 0.001,
-        inverders_movement: float = 0.03,
-        user_shoot: float = 0.009,
-    ) -> None:
-        """Change cooldown values so the game seems to run faster.
-
-        Arguments:
-        argument -- description
-            bullet_movement (float): amount to reduce cooldown for bullet movement
-            inverders_movement (float): amount to reduce cooldown for invaders movement
-            user_shoot (float): amount to reduce cooldown for user shooting
         Return: return_description
             None
         """
 
-        self.cooldown_bullet_movement += (
-            -bullet_movement if bullet_movement > 0 else bullet_movement
-        )
-        self.cooldown_invaders_movement += (
-            -inverders_movement if inverders_movement > 0 else inverders_movement
-        )
-        self.cooldown_user_shoot += -user_shoot if user_shoot > 0 else user_shoot
+        self.renderer.mark_dirty(GameOverLabel())
 
-    def handle_level_up(self) -> None:
-        """Orcastrate tasks that are neccessary to start next game level.
+    def stop(self) -> None:
+        """Stop all threads and quit application.
 
         Keyword arguments:
         argument -- description
@@ -455,18 +150,11 @@ class App:
             None
         """
 
-        if self.game_level_up:
-            self.game_level_up = False
-            logger.debug("Updating level")
-            self.tasks.put(self.mark_all_bullets_for_removal)
-            self.tasks.put((lambda: self.game_level.increase(1)))
-            self.tasks_main.put(self.game_level.update)
-            self.tasks_main.put(self.initialize_invaders)
-            self.tasks.put(self.reduce_cooldown)
-            logger.debug("Updated level")
+        logger.info("Stopping game...")
+        self.run = False
 
-    def show_game_over_label(self) -> None:
-        """Show "GAME OVER" laber on the screen
+    def stop_worker(self) -> None:
+        """Let the background thread finish its waiting tasks and exit.
 
         Keyword arguments:
         argument -- description
@@ -474,49 +162,25 @@ class App:
             None
         """
 
-        GameOverLabel()
-
-    def collect_garbage(self) -> None:
-        """Remove objects from screen which are marked as garbage.
-
-        Implementd objects are: fortresses, bullets, invaders.
-        Method is thread safe.
+        if self.worker is not None:
+            self.worker.stop(timeout=5)
+            self.worker = None
 
-        Keyword arguments:
-        argument -- description
-        Return: return_description
-            None
-        """
-        for item_to_remove in self.garbage:
-            if isinstance(item_to_remove, Invader):
-                for col in self.invaders:
-                    if item_to_remove in col:
-                        rlock.acquire()
-                        col[col.index(item_to_remove)] = None
-                        rlock.release()
-            else:
-                types_ = ("bullets", "fortresses")
-                for type_ in types_:
-                    if item_to_remove in getattr(self, type_):
-                        rlock.acquire()
-                        getattr(self, type_).remove(item_to_remove)
-                        rlock.release()
-
-        rlock.acquire()
-        self.garbage.clear()
-        rlock.release()
-
-    def stop(self) -> None:
-        """Stop all threads and quit application.
+    def run_in_background(self, task: Callable[[], None]) -> None:
+        """Queue bookkeeping work for the background thread. Without a running
+        thread the task is called at once.
 
         Keyword arguments:
         argument -- description
+            task (Callable[[], None]): work to do
         Return: return_description
             None
         """
 
-        logger.info("Stopping game...")
-        self.run = False
+        if self.worker is not None and self.worker.is_alive():
+            self.tasks.put(task, priority=TaskPriority.BOOKKEEPING)
+        else:
+            task()
 
     def start(self) -> None:
         """Start application.
@@ -533,13 +197,18 @@ class App:
         logger.debug("Starting game... is done.")
         self.run_additional_loop()
         self.run_mainloop()
-        logger.info("Saving high score...")
-        self.save_high_score()
-        logger.debug("Saving high score... is done.")
+        if self.recorder is not None:
+            self.recorder.close(self.world)
+            logger.info("Game recorded to %s", self.recorder.path)
+        self.dump_profile()
+        self.run_in_background(self.save_high_score)
+        self.stop_worker()
 
     def run_additional_loop(self) -> None:
         """Run additional loop for handling tasks in separate thread.
-        This method must be called before main loop is started.
+        The thread stores the profile and the result of the game, so disk writes
+        never stall a frame. This method must be called before main loop is
+        started.
 
         Keyword arguments:
         argument -- description
@@ -547,19 +216,23 @@ class App:
         """
 
         logger.info("Starting additional loop for tasks...")
-        th = threading.Thread(
-            target=(lambda: run_in_loop(lambda: perform_task_from(self.tasks), self)),
-            name="tasks",
-        )
-        th.start()
-        logger.info("Addition loop runs: %s", th.is_alive())
-        if th.is_alive():
+        timer = self.profiler if self.profiler.enabled else None
+        self.worker = TaskWorker(self.tasks, timer=timer)
+        self.worker.start()
+        logger.info("Addition loop runs: %s", self.worker.is_alive())
+        if self.worker.is_alive():
             logger.info("Starting additional loop for tasks... is done.")
         else:
             logger.error("Starting additional loop for tasks... failed.")
 
     def run_mainloop(self) -> None:
         """Run main loop of the application.
+        Every frame runs as many fixed simulation steps as real time has passed
+        and is rendered once if anything changed. Frame rate is limited to
+        FRAME_RATE.
+        Queued tasks are called before rendering within TASK_BUDGET seconds,
+        so their effects show up in the same frame. Rendering tasks like HUD
+        refreshes run before bookkeeping tasks like collecting overlay counters.
         Start additional loop before calling this method.
         For running application call method start().
 
@@ -570,28 +243,97 @@ class App:
         """
 
         logger.info("Start main thread...")
+        self.timestep.reset()
+        profiler = self.profiler
         while self.run:
-            self.handle_invaders_shooting()
-            self.move_invaders()
-            self.move_bullets()
-            self.handle_bullets_collisions()
-            self.handle_level_up()
-            self.tasks.put(self.collect_garbage)
-            perform_task_from(self.tasks_main)
-            if self.check_invaders_pass() or not self.check_lifes_left():
+            frame_start = perf_counter()
+            profiler.start_frame()
+            ticks = self.timestep.advance()
+            for _ in range(ticks):
+                self.step()
+            profiler.lap("simulation")
+            snapshot = self.world.publish()
+            profiler.lap("snapshot")
+            if drain_tasks_from(self.tasks_main, TASK_BUDGET):
+                self.renderer.mark_dirty(self.tasks_main)
+            profiler.lap("tasks_main")
+            if snapshot.game_over:
                 self.show_game_over_label()
                 self.stop()
-            self.screen.update()
-            sleep(0.001)
+            self.renderer.present(force=not self.run)
+            profiler.lap("present")
+            if self.overlay.sample(perf_counter() - frame_start, ticks):
+                self.tasks_main.put(
+                    lambda snapshot=snapshot: self.update_overlay(snapshot),
+                    priority=TaskPriority.BOOKKEEPING,
+                )
+            self.timestep.wait()
         logger.info("Main thread is stopping...")
 
+    def toggle_overlay(self) -> None:
+        self.overlay.toggle()
+        self.renderer.mark_dirty(self.overlay)
+
+    def update_overlay(self, snapshot: WorldSnapshot) -> None:
+        """Pass current counters to the performance overlay.
+
+        Keyword arguments:
+        argument -- description
+            snapshot (WorldSnapshot): last published state of the world
+        Return: return_description
+            None
+        """
+
+        self.overlay.show_counts(
+            {
+                "bullets": len(snapshot.bullets),
+                "invaders": len(snapshot.invaders),
+                "fortresses": len(snapshot.fortresses),
+                "hidden": self.renderer.reaper.stats(self.screen)["hidden"],
+                "tasks": self.tasks.depth(),
+                "tasks_main": self.tasks_main.depth(),
+            }
+        )
+        self.renderer.mark_dirty(self.overlay)
+
+    def dump_profile(self) -> None:
+        """Store rolling percentiles of the frame phases in the background, if
+        profiling is enabled.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if self.profiler.enabled:
+            self.run_in_background(lambda: self.profiler.dump(self.profile_path))
+
+    def import_scores(self) -> None:
+        """Move results of former score files into an empty score database.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if len(self.scores):
+            return
+        journal_path = self.high_score_path.with_name("scores.jsonl")
+        if journal_path.exists():
+            entries = ScoreJournal(journal_path).entries
+            scores = [(entry.date, entry.score) for entry in entries]
+        else:
+            scores = list(read_json(self.high_score_path).items())
+        if scores and self.scores.import_scores(scores):
+            logger.info("Imported %s former scores", len(scores))
+
     def load_high_score(self) -> None:
-        results = read_json(self.high_score_path)
-        max_score = None
-        with suppress(ValueError):
-            max_score = max(results.values())
-        self.game_high_score.value = max_score if max_score is not None else 0
-        self.tasks_main.put(self.game_high_score.update)
+        self.game_high_score.value = self.scores.high_score
+        self.tasks_main.put(
+            self.game_high_score.refresh, priority=TaskPriority.RENDERING
+        )
 
     def show_count_down(self) -> None:
         count_down = CountDownLabel()
@@ -607,6 +349,24 @@ class App:
             sleep(0.001)
 
     def save_high_score(self) -> None:
-        results = read_json(self.high_score_path)
-        new_results = add_score(results, self.game_score.value)
-        write_json(new_results, self.high_score_path)
+        """Store the result of the game. Called by the background thread after
+        the main loop has ended.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        logger.info("Saving high score...")
+        world = self.world
+        self.scores.add_run(
+            RunStats(
+                score=world.snapshot.score,
+                level=world.level,
+                shots=world.shots,
+                hits=world.hits,
+                duration=world.time,
+                seed=self.seed,
+            )
+        )
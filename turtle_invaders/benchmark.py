@@ -0,0 +1,250 @@
+from __future__ import annotations
+import argparse
+import json
+import logging
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+from turtle_invaders.commands import MoveUser, Shoot
+from turtle_invaders.constants import FRAME_RATE, SIMULATION_STEP
+from turtle_invaders.world import World
+
+
+logger = logging.getLogger(__name__)
+
+
+class Scenario:
+    """Named preset of a headless game.
+
+    <setup> prepares a new world once, <drive> is called before every tick and
+    may push commands like a player would.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        setup: Callable[[World], None] | None = None,
+        drive: Callable[[World], None] | None = None,
+        bullets_destroy_bullets: bool = True,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.drive = drive
+        self.bullets_destroy_bullets = bullets_destroy_bullets
+
+    def create_world(self, seed: int) -> World:
+        world = World(seed=seed, bullets_destroy_bullets=self.bullets_destroy_bullets)
+        if self.setup is not None:
+            self.setup(world)
+        return world
+
+
+class PhaseCosts:
+    """Sum of durations and counts of the phases of a world step."""
+
+    def __init__(self, clock: Callable[[], float] = perf_counter) -> None:
+        self.clock = clock
+        self.totals: defaultdict[str, float] = defaultdict(float)
+        self.counts: defaultdict[str, int] = defaultdict(int)
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.totals[phase] += seconds
+        self.counts[phase] += 1
+
+    def report(self) -> dict[str, dict[str, float]]:
+        total = sum(self.totals.values()) or 1.0
+        return {
+            phase: {
+                "seconds": seconds,
+                "mean_us": seconds / self.counts[phase] * 1e6,
+                "share": seconds / total,
+            }
+            for phase, seconds in self.totals.items()
+        }
+
+
+def fire_at_will(world: World) -> None:
+    """Shoot and run from side to side. The world shortens the moves to the speed
+    limit of the user.
+    """
+
+    world.commands.push(Shoot())
+    world.commands.push(MoveUser(15 if world.tick // FRAME_RATE % 2 else -15))
+
+
+def dense_bullets(world: World) -> None:
+    world.cooldown_user_shoot = 0.02
+    world.cooldown_invaders_shoot = 0.02
+
+
+def late_level(world: World) -> None:
+    for _ in range(10):
+        world.level_up = True
+        world.handle_level_up()
+    world.collect_garbage()
+
+
+def formation_near_floor(world: World) -> None:
+    bottom = world.formation.bottom
+    if bottom is not None:
+        world.formation.move(0, -200 - bottom.y)
+        for invader in world.formation:
+            world.index.update(invader)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("level_1", "start of the first level", drive=fire_at_will),
+        Scenario(
+            "dense_bullets",
+            "user and invaders shoot with a short cooldown",
+            setup=dense_bullets,
+            drive=fire_at_will,
+        ),
+        Scenario(
+            "bullets_pass_bullets",
+            "dense bullets which pass each other",
+            setup=dense_bullets,
+            drive=fire_at_will,
+            bullets_destroy_bullets=False,
+        ),
+        Scenario(
+            "late_level",
+            "level 10 with reduced cooldowns",
+            setup=late_level,
+            drive=fire_at_will,
+        ),
+        Scenario(
+            "formation_near_floor",
+            "formation right above the fortresses",
+            setup=formation_near_floor,
+            drive=fire_at_will,
+        ),
+    )
+}
+
+
+def run_ticks(
+    world: World,
+    scenario: Scenario,
+    ticks: int,
+    timer: PhaseCosts | None = None,
+    step: float = SIMULATION_STEP,
+) -> tuple[World, int]:
+    """Step a world of a scenario <ticks> times. A world whose game is over is
+    replaced by a new world of the scenario, seeded by the former one, so every
+    tick measures a running game.
+
+    Keyword arguments:
+    argument -- description
+        world (World): world created by the scenario
+        scenario (Scenario): scenario which drives the world
+        ticks (int): number of simulation steps
+        timer (PhaseCosts | None): receiver of phase durations
+        step (float): simulated seconds per tick
+    Return: return_description
+        tuple[World, int]: last world and number of played games
+    """
+
+    games = 1
+    for _ in range(ticks):
+        if world.game_over:
+            world = scenario.create_world(world.random.getrandbits(32))
+            games += 1
+        if scenario.drive is not None:
+            scenario.drive(world)
+        world.step(step, timer)
+    return world, games
+
+
+def run_scenario(
+    scenario: Scenario,
+    ticks: int = 5000,
+    seed: int = 0,
+    step: float = SIMULATION_STEP,
+) -> dict:
+    """Run a scenario three times from the same seed: for throughput, for the
+    costs of the phases and for the peak of allocated memory.
+
+    Keyword arguments:
+    argument -- description
+        scenario (Scenario): scenario to run
+        ticks (int): number of simulation steps per run
+        seed (int): seed of the world
+        step (float): simulated seconds per tick
+    Return: return_description
+        dict: results ready to be dumped as JSON
+    """
+
+    start = perf_counter()
+    world, games = run_ticks(scenario.create_world(seed), scenario, ticks, step=step)
+    seconds = perf_counter() - start
+
+    costs = PhaseCosts()
+    run_ticks(scenario.create_world(seed), scenario, ticks, costs, step)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    run_ticks(scenario.create_world(seed), scenario, ticks, step=step)
+    _, peak = tracemalloc.get_traced_memory()
+    if not tracing:
+        tracemalloc.stop()
+
+    return {
+        "scenario": scenario.name,
+        "description": scenario.description,
+        "seed": seed,
+        "ticks": ticks,
+        "step": step,
+        "seconds": seconds,
+        "ticks_per_second": ticks / seconds if seconds > 0 else None,
+        "phases": costs.report(),
+        "peak_memory_bytes": peak,
+        "games": games,
+        "final": {
+            "score": world.score,
+            "lifes": world.lifes,
+            "level": world.level,
+            "bullets": len(world.bullets),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the headless game.")
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)}; all by default"
+    )
+    parser.add_argument("--ticks", type=int, default=5000, help="ticks per run")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the world")
+    parser.add_argument(
+        "--step", type=float, default=SIMULATION_STEP, help="seconds per tick"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON to a file")
+    args = parser.parse_args()
+    names = args.scenarios or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    results = [
+        run_scenario(SCENARIOS[name], args.ticks, args.seed, args.step)
+        for name in names
+    ]
+    report = json.dumps({"results": results}, indent=4)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
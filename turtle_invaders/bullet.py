@@ -1,7 +1,10 @@
 import turtle as t
+import logging
 from turtle_invaders.types_ import numeric
 from turtle_invaders.constants import ObjectDirection
 
+logger = logging.getLogger(__name__)
+
 
 class Bullet(t.Turtle):
     def __init__(
@@ -17,5 +20,71 @@ class Bullet(t.Turtle):
     def move(self, step: numeric) -> None:
         self.forward(step)
 
+    def reset_to(
+        self, x: numeric, y: numeric, direction: ObjectDirection, color: str
+    ) -> None:
+        self.setheading(direction.value)
+        self.color(color)
+        self.teleport(x, y)
+        self.showturtle()
+
     def destroy(self) -> None:
         self.hideturtle()
+
+
+class BulletPool:
+    """Fixed capacity pool of hidden bullets ready to be reused.
+
+    Shooting takes a bullet from the pool instead of creating a new turtle and
+    canvas item. Released bullets are hidden and kept for the next shot as long
+    as the pool holds less than <capacity> bullets.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity < 0:
+            raise ValueError(f"Parameter capacity must be positive. Given: {capacity}")
+        self.capacity = capacity
+        self.free: list[Bullet] = []
+        self.created = 0
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def acquire(
+        self, x: numeric, y: numeric, direction: ObjectDirection, color: str
+    ) -> Bullet:
+        """Return a visible bullet at the given position.
+
+        Keyword arguments:
+        argument -- description
+            x (numeric): x coordinate
+            y (numeric): y coordinate
+            direction (ObjectDirection): direction of flight
+            color (str): color of the bullet
+        Return: return_description
+            Bullet: recycled or new bullet
+        """
+
+        if self.free:
+            bullet = self.free.pop()
+            bullet.reset_to(x, y, direction, color)
+            return bullet
+        self.created += 1
+        return Bullet(x, y, direction, color)
+
+    def release(self, bullet: Bullet) -> bool:
+        """Hide a bullet and keep it for reuse if the pool is not full.
+
+        Keyword arguments:
+        argument -- description
+            bullet (Bullet): bullet which is not used anymore
+        Return: return_description
+            bool: True when the bullet was taken back by the pool
+        """
+
+        bullet.destroy()
+        if len(self.free) >= self.capacity:
+            logger.debug("Bullet pool is full")
+            return False
+        self.free.append(bullet)
+        return True
@@ -0,0 +1,288 @@
+from __future__ import annotations
+import logging
+import math
+from collections.abc import Iterator, Sequence
+from typing import Protocol
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+from turtle_invaders.constants import Screen
+from turtle_invaders.types_ import numeric
+
+
+logger = logging.getLogger(__name__)
+HAS_NUMPY = np is not None
+
+
+class Collider(Protocol):
+    x: numeric
+    y: numeric
+    radius: numeric
+
+
+class Mover(Collider, Protocol):
+    last_x: numeric
+    last_y: numeric
+
+
+def time_of_impact(
+    x: numeric, y: numeric, dx: numeric, dy: numeric, reach: numeric
+) -> float | None:
+    """Return when a point moving from (<x>, <y>) by (<dx>, <dy>) first comes
+    within <reach> of the origin. Moving circles are tested with their relative
+    position and movement and the sum of their radii as <reach>.
+
+    Keyword arguments:
+    argument -- description
+        x (numeric): relative x coordinate at the start of the movement
+        y (numeric): relative y coordinate at the start of the movement
+        dx (numeric): relative movement along x axis
+        dy (numeric): relative movement along y axis
+        reach (numeric): distance of a contact
+    Return: return_description
+        float | None: fraction of the movement between 0 and 1, None without
+            contact
+    """
+
+    c = x * x + y * y - reach * reach
+    if c <= 0:
+        return 0.0
+    a = dx * dx + dy * dy
+    b = x * dx + y * dy
+    if a == 0 or b >= 0:
+        return None
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / a
+    return t if t <= 1 else None
+
+
+def overlapping_pairs(
+    first: Sequence[Mover], second: Sequence[Mover]
+) -> list[tuple[int, int]]:
+    """Find pairs of objects of two groups whose x extents along their last
+    movement overlap, with a sort and sweep over the extents. Objects of the
+    same group are never compared.
+
+    Keyword arguments:
+    argument -- description
+        first (Sequence[Mover]): objects, e.g. bullets flying north
+        second (Sequence[Mover]): objects, e.g. bullets flying south
+    Return: return_description
+        list[tuple[int, int]]: index of <first> and index of <second> of every
+            candidate pair
+    """
+
+    if len(first) == 0 or len(second) == 0:
+        return []
+    extents = sorted(
+        (
+            min(item.last_x, item.x) - item.radius,
+            group,
+            index,
+            max(item.last_x, item.x) + item.radius,
+        )
+        for group, items in enumerate((first, second))
+        for index, item in enumerate(items)
+    )
+    active: tuple[list[tuple[float, int]], ...] = ([], [])
+    pairs: list[tuple[int, int]] = []
+    for left, group, index, right in extents:
+        others = active[1 - group]
+        if others:
+            others[:] = [other for other in others if other[0] >= left]
+            for _, other in others:
+                pairs.append((index, other) if group == 0 else (other, index))
+        active[group].append((right, index))
+    return pairs
+
+
+class SpatialHash:
+    """Uniform grid over the screen used as broad-phase for collisions.
+
+    Objects are registered in the cell containing their centre and have to be
+    updated whenever they move. A query returns the objects of all cells a circle
+    can touch, so only those need an exact distance test. Cells keep insertion
+    order, which keeps collision handling deterministic.
+    """
+
+    def __init__(self, cell_size: int = 40) -> None:
+        if cell_size <= 0:
+            raise ValueError(
+                f"Parameter cell_size must be positive. Given: {cell_size}."
+            )
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], dict[Collider, None]] = {}
+        self.keys: dict[Collider, tuple[int, int]] = {}
+        self.max_radius: numeric = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, item: Collider) -> bool:
+        return item in self.keys
+
+    def key(self, x: numeric, y: numeric) -> tuple[int, int]:
+        return (
+            int((x + Screen.WIDTH / 2) // self.cell_size),
+            int((y + Screen.HEIGHT / 2) // self.cell_size),
+        )
+
+    def insert(self, item: Collider) -> None:
+        """Register an object in the cell of its current position.
+
+        Keyword arguments:
+        argument -- description
+            item (Collider): object with position and radius
+        Return: return_description
+            None
+        """
+
+        key = self.key(item.x, item.y)
+        self.keys[item] = key
+        self.cells.setdefault(key, {})[item] = None
+        if item.radius > self.max_radius:
+            self.max_radius = item.radius
+
+    def update(self, item: Collider) -> None:
+        """Move an already registered object to the cell of its current position.
+        Objects which are not registered are ignored.
+
+        Keyword arguments:
+        argument -- description
+            item (Collider): object with position and radius
+        Return: return_description
+            None
+        """
+
+        old_key = self.keys.get(item)
+        if old_key is None:
+            return
+        key = self.key(item.x, item.y)
+        if old_key == key:
+            return
+        self._discard(item, old_key)
+        self.keys[item] = key
+        self.cells.setdefault(key, {})[item] = None
+
+    def remove(self, item: Collider) -> None:
+        """Unregister an object. Unknown objects are ignored.
+
+        Keyword arguments:
+        argument -- description
+            item (Collider): object to remove
+        Return: return_description
+            None
+        """
+
+        key = self.keys.pop(item, None)
+        if key is not None:
+            self._discard(item, key)
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.keys.clear()
+
+    def query(self, x: numeric, y: numeric, radius: numeric) -> Iterator[Collider]:
+        """Yield objects which may overlap with a circle.
+
+        Keyword arguments:
+        argument -- description
+            x (numeric): x coordinate of the circle
+            y (numeric): y coordinate of the circle
+            radius (numeric): radius of the circle
+        Return: return_description
+            Iterator[Collider]: candidates for an exact collision test
+        """
+
+        reach = radius + self.max_radius
+        left, bottom = self.key(x - reach, y - reach)
+        right, top = self.key(x + reach, y + reach)
+        for column in range(left, right + 1):
+            for row in range(bottom, top + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    yield from tuple(cell)
+
+    def _discard(self, item: Collider, key: tuple[int, int]) -> None:
+        cell = self.cells[key]
+        del cell[item]
+        if not cell:
+            del self.cells[key]
+
+
+def pack(items: Sequence[Collider]) -> np.ndarray:
+    """Pack positions and radii of objects into a contiguous array.
+
+    Keyword arguments:
+    argument -- description
+        items (Sequence[Collider]): objects with position and radius
+    Return: return_description
+        np.ndarray: array of shape (len(items), 3) with columns x, y, radius
+    """
+
+    return np.array(
+        [(item.x, item.y, item.radius) for item in items], dtype=np.float64
+    ).reshape(-1, 3)
+
+
+def pack_paths(items: Sequence[Mover]) -> np.ndarray:
+    """Pack start and end positions and radii of moving objects into a contiguous
+    array.
+
+    Keyword arguments:
+    argument -- description
+        items (Sequence[Mover]): objects with last and current position and radius
+    Return: return_description
+        np.ndarray: array of shape (len(items), 5) with columns x0, y0, x1, y1,
+            radius
+    """
+
+    return np.array(
+        [(item.last_x, item.last_y, item.x, item.y, item.radius) for item in items],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+
+
+def find_impacts(
+    paths: np.ndarray, circles: np.ndarray
+) -> list[tuple[float, int, int]]:
+    """Find all pairs of moving and static circles which touch during the last
+    movement, with the same arithmetic as time_of_impact(). Both groups are
+    packed once by the caller, so one packing of the movers serves any number
+    of targets.
+
+    Keyword arguments:
+    argument -- description
+        paths (np.ndarray): moving circles packed by pack_paths(), e.g. bullets
+        circles (np.ndarray): static circles packed by pack(), e.g. invaders
+    Return: return_description
+        list[tuple[float, int, int]]: time of impact, index of <paths> and index
+            of <circles> of every contact, ordered by the indices
+    """
+
+    if len(paths) == 0 or len(circles) == 0:
+        return []
+    x = paths[:, 0, None] - circles[None, :, 0]
+    y = paths[:, 1, None] - circles[None, :, 1]
+    dx = (paths[:, 2] - paths[:, 0])[:, None]
+    dy = (paths[:, 3] - paths[:, 1])[:, None]
+    reach = paths[:, 4, None] + circles[None, :, 2]
+    c = x * x + y * y - reach * reach
+    qa = dx * dx + dy * dy
+    qb = x * dx + y * dy
+    discriminant = qb * qb - qa * c
+    moving = (c > 0) & (qa != 0) & (qb < 0) & (discriminant >= 0)
+    rows, columns = np.nonzero(moving | (c <= 0))
+    if len(rows) == 0:
+        return []
+    qa = np.broadcast_to(qa, c.shape)[rows, columns]
+    qb = qb[rows, columns]
+    root = np.sqrt(np.maximum(discriminant[rows, columns], 0))
+    t = np.where(c[rows, columns] <= 0, 0.0, (-qb - root) / np.where(qa, qa, 1))
+    hit = t <= 1
+    return list(zip(t[hit].tolist(), rows[hit].tolist(), columns[hit].tolist()))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Protocol
+
+from turtle_invaders.types_ import numeric
+
+if TYPE_CHECKING:
+    from turtle_invaders.world import World
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(Protocol):
+    def apply(self, world: World) -> None: ...
+
+
+class CommandRecorder(Protocol):
+    def record(self, tick: int, command: Command) -> None: ...
+
+
+class MoveUser:
+    def __init__(self, step: numeric) -> None:
+        self.step = step
+
+    def apply(self, world: World) -> None:
+        world.move_user(self.step)
+
+
+class Shoot:
+    def apply(self, world: World) -> None:
+        world.handle_user_shooting()
+
+
+class CommandBuffer:
+    """Commands waiting to be applied to the world by its stepping thread.
+
+    Any thread may push commands. The world is only changed by the thread which
+    steps it, when it applies the buffer at the beginning of a step, so neither
+    side needs a lock. Appending to and popping from a deque are atomic.
+    Applied commands are passed to <recorder> together with the tick of the world.
+    """
+
+    def __init__(self) -> None:
+        self.pending: deque[Command] = deque()
+        self.recorder: CommandRecorder | None = None
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def push(self, command: Command) -> None:
+        self.pending.append(command)
+
+    def apply(self, world: World) -> int:
+        """Apply all pushed commands in order.
+
+        Keyword arguments:
+        argument -- description
+            world (World): world to change
+        Return: return_description
+            int: number of applied commands
+        """
+
+        applied = 0
+        while self.pending:
+            command = self.pending.popleft()
+            if self.recorder is not None:
+                self.recorder.record(world.tick, command)
+            command.apply(world)
+            applied += 1
+        return applied
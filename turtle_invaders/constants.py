@@ -2,6 +2,9 @@ from enum import IntEnum
 from itertools import cycle
 
 COLORS = cycle(("blue", "white", "yellow", "red", "green"))
+FRAME_RATE = 60
+SIMULATION_STEP = 1 / FRAME_RATE
+TASK_BUDGET = 0.004
 
 
 class ObjectDirection(IntEnum):
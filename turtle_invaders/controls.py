@@ -0,0 +1,131 @@
+from __future__ import annotations
+import logging
+from typing import TYPE_CHECKING, Protocol
+
+from turtle_invaders.commands import MoveUser, Shoot
+from turtle_invaders.types_ import numeric
+
+if TYPE_CHECKING:
+    from turtle_invaders.world import World
+
+
+logger = logging.getLogger(__name__)
+LEFT = "Left"
+RIGHT = "Right"
+FIRE = "space"
+
+
+class KeyboardScreen(Protocol):
+    def onkeypress(self, fun, key=None) -> None: ...
+
+    def onkeyrelease(self, fun, key) -> None: ...
+
+
+class Controls:
+    """State of the held keys, sampled by the simulation once per tick.
+
+    Tk callbacks only set or clear flags, so they neither move nor redraw
+    anything. Every tick sample() turns the state into commands: while a
+    direction is held the user accelerates from zero to <speed> pixels per
+    second within <ramp> seconds, releasing or reversing stops at once. A press
+    of fire is buffered for <fire_buffer> seconds of game time, so a press during
+    the cooldown of the user shoots as soon as the cooldown is over. Holding
+    fire shoots whenever the cooldown allows.
+    """
+
+    def __init__(
+        self, speed: numeric = 300, ramp: numeric = 0.05, fire_buffer: numeric = 0.15
+    ) -> None:
+        self.speed = speed
+        self.ramp = ramp
+        self.fire_buffer = fire_buffer
+        self.left = False
+        self.right = False
+        self.fire = False
+        self.fire_requested = False
+        self.fire_requested_at: float | None = None
+        self.velocity: float = 0.0
+
+    def bind(self, screen: KeyboardScreen) -> None:
+        screen.onkeypress(self.press_left, LEFT)
+        screen.onkeyrelease(self.release_left, LEFT)
+        screen.onkeypress(self.press_right, RIGHT)
+        screen.onkeyrelease(self.release_right, RIGHT)
+        screen.onkeypress(self.press_fire, FIRE)
+        screen.onkeyrelease(self.release_fire, FIRE)
+
+    def press_left(self) -> None:
+        self.left = True
+
+    def release_left(self) -> None:
+        self.left = False
+
+    def press_right(self) -> None:
+        self.right = True
+
+    def release_right(self) -> None:
+        self.right = False
+
+    def press_fire(self) -> None:
+        self.fire = True
+        self.fire_requested = True
+
+    def release_fire(self) -> None:
+        self.fire = False
+
+    def hold(self, direction: int, fire: bool) -> None:
+        """Hold the keys of a direction and fire like a player would, for bots.
+
+        Keyword arguments:
+        argument -- description
+            direction (int): -1 for left, 1 for right, 0 for none
+            fire (bool): whether fire is held
+        Return: return_description
+            None
+        """
+
+        self.left = direction < 0
+        self.right = direction > 0
+        self.fire = fire
+
+    @property
+    def direction(self) -> int:
+        return int(self.right) - int(self.left)
+
+    def sample(self, world: World, dt: float) -> int:
+        """Push the commands of the current input state for the next step.
+
+        Keyword arguments:
+        argument -- description
+            world (World): world which is stepped next
+            dt (float): length of the step in seconds
+        Return: return_description
+            int: number of pushed commands
+        """
+
+        pushed = 0
+        direction = self.direction
+        if direction == 0:
+            self.velocity = 0.0
+        else:
+            speed = abs(self.velocity) if direction * self.velocity > 0 else 0.0
+            change = self.speed * dt / self.ramp if self.ramp > 0 else self.speed
+            self.velocity = direction * min(speed + change, self.speed)
+        if self.velocity:
+            world.commands.push(MoveUser(self.velocity * dt))
+            pushed += 1
+
+        if self.fire_requested:
+            self.fire_requested = False
+            self.fire_requested_at = world.time
+        expired = (
+            self.fire_requested_at is not None
+            and world.time - self.fire_requested_at > self.fire_buffer
+        )
+        if expired:
+            self.fire_requested_at = None
+        if (self.fire or self.fire_requested_at is not None) and world.can_user_shoot:
+            world.commands.push(Shoot())
+            self.fire_requested_at = None
+            pushed += 1
+        return pushed
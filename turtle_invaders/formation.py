@@ -0,0 +1,137 @@
+from __future__ import annotations
+import logging
+from collections.abc import Iterator
+from random import Random
+from typing import TYPE_CHECKING
+
+from turtle_invaders.constants import InvadersMovementDirection
+from turtle_invaders.types_ import numeric
+
+if TYPE_CHECKING:
+    from turtle_invaders.world import InvaderState
+
+
+logger = logging.getLogger(__name__)
+
+
+class Formation:
+    """Grid of invaders moving as one rigid body.
+
+    Invaders keep their position relative to the formation, so a movement only
+    changes the offset of the formation. Left and right extents, the lowest row
+    and the lowest alive invader of every column are maintained while invaders
+    are removed. Columns are lists of invaders ordered from top to bottom.
+    """
+
+    def __init__(self, columns: list[list[InvaderState | None]]) -> None:
+        self.x: numeric = 0
+        self.y: numeric = 0
+        self.columns = columns
+        self.lowest: list[int] = []
+        self.occupied: list[int] = []
+        for column_index, column in enumerate(columns):
+            lowest = -1
+            for row_index, invader in enumerate(column):
+                if invader is not None:
+                    invader.formation = self
+                    invader.slot = (column_index, row_index)
+                    lowest = row_index
+            self.lowest.append(lowest)
+            if lowest >= 0:
+                self.occupied.append(column_index)
+        self.bottom: InvaderState | None = None
+        self._update_bottom()
+
+    def __iter__(self) -> Iterator[InvaderState]:
+        for column in self.columns:
+            for invader in column:
+                if invader is not None:
+                    yield invader
+
+    @property
+    def empty(self) -> bool:
+        return len(self.occupied) == 0
+
+    def move(self, dx: numeric, dy: numeric) -> None:
+        """Move the whole formation.
+
+        Keyword arguments:
+        argument -- description
+            dx (numeric): step along x axis
+            dy (numeric): step along y axis
+        Return: return_description
+            None
+        """
+
+        self.x += dx
+        self.y += dy
+
+    def remove(self, invader: InvaderState) -> None:
+        """Free the slot of an invader and update extents and lowest invaders.
+        Invaders which are not part of the formation are ignored.
+
+        Keyword arguments:
+        argument -- description
+            invader (InvaderState): invader to remove
+        Return: return_description
+            None
+        """
+
+        if invader.formation is not self:
+            return
+        column_index, row_index = invader.slot
+        column = self.columns[column_index]
+        if column[row_index] is not invader:
+            return
+        column[row_index] = None
+        invader.formation = None
+        invader.x, invader.y = invader.x + self.x, invader.y + self.y
+        if self.lowest[column_index] != row_index:
+            return
+        lowest = row_index - 1
+        while lowest >= 0 and column[lowest] is None:
+            lowest -= 1
+        self.lowest[column_index] = lowest
+        if lowest < 0:
+            self.occupied.remove(column_index)
+        if self.bottom is invader:
+            self._update_bottom()
+
+    def edge(self, direction: InvadersMovementDirection) -> InvaderState | None:
+        """Return the lowest invader of the outermost column in <direction>.
+
+        Keyword arguments:
+        argument -- description
+            direction (InvadersMovementDirection): side of the formation
+        Return: return_description
+            InvaderState | None: invader or None if formation is empty
+        """
+
+        if self.empty:
+            return None
+        column_index = self.occupied[
+            -1 if direction == InvadersMovementDirection.RIGHT else 0
+        ]
+        return self.columns[column_index][self.lowest[column_index]]
+
+    def shooter(self, random: Random) -> InvaderState | None:
+        """Pick the lowest invader of a random non empty column.
+
+        Keyword arguments:
+        argument -- description
+            random (Random): random number generator
+        Return: return_description
+            InvaderState | None: invader or None if formation is empty
+        """
+
+        if self.empty:
+            return None
+        column_index = self.occupied[random.randint(0, len(self.occupied) - 1)]
+        return self.columns[column_index][self.lowest[column_index]]
+
+    def _update_bottom(self) -> None:
+        self.bottom = None
+        for column_index in self.occupied:
+            invader = self.columns[column_index][self.lowest[column_index]]
+            if self.bottom is None or invader.y < self.bottom.y:
+                self.bottom = invader
@@ -0,0 +1,81 @@
+import turtle as t
+import logging
+from contextlib import suppress
+
+
+logger = logging.getLogger(__name__)
+
+
+class Reaper:
+    """Detach destroyed turtles from their screen and canvas.
+
+    Hiding a turtle keeps it in the list of turtles the screen walks on every
+    update and keeps its canvas items alive. A reaped turtle is removed from that
+    list and all its canvas items are deleted, so it costs nothing per frame.
+    A reaped turtle must not be used anymore.
+    """
+
+    def __init__(self) -> None:
+        self.reaped = 0
+        self.detached: set[t.RawTurtle] = set()
+
+    def detach(self, turtle: t.RawTurtle) -> None:
+        """Stop redrawing a turtle on screen updates but keep its canvas items.
+        The turtle is drawn as it was, until it is reaped.
+
+        Keyword arguments:
+        argument -- description
+            turtle (RawTurtle): turtle drawn at least once
+        Return: return_description
+            None
+        """
+
+        with suppress(ValueError):
+            turtle.getscreen()._turtles.remove(turtle)
+            self.detached.add(turtle)
+
+    def reap(self, turtle: t.RawTurtle) -> None:
+        """Remove a turtle from its screen and delete its canvas items.
+
+        Keyword arguments:
+        argument -- description
+            turtle (RawTurtle): turtle which is not used anymore
+        Return: return_description
+            None
+        """
+
+        screen = turtle.getscreen()
+        turtle.hideturtle()
+        turtle.clearstamps()
+        for item in turtle.items:
+            screen._delete(item)
+        turtle.items = []
+        screen._delete(turtle.drawingLineItem)
+        image = turtle.turtle
+        items = image._item if image._type == "compound" else [image._item]
+        for item in items:
+            screen._delete(item)
+        if turtle in self.detached:
+            self.detached.remove(turtle)
+            self.reaped += 1
+        with suppress(ValueError):
+            screen._turtles.remove(turtle)
+            self.reaped += 1
+
+    def stats(self, screen: t.TurtleScreen) -> dict[str, int]:
+        """Count turtles which are still attached to a screen.
+
+        Keyword arguments:
+        argument -- description
+            screen (TurtleScreen): screen to inspect
+        Return: return_description
+            dict[str, int]: live, hidden, detached and reaped turtles
+        """
+
+        turtles = screen.turtles()
+        return {
+            "live": len(turtles),
+            "hidden": sum(1 for turtle in turtles if not turtle.isvisible()),
+            "detached": len(self.detached),
+            "reaped": self.reaped,
+        }
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import json
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+
+logger = logging.getLogger(__name__)
+
+
+def nearest_rank(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(round(q / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class RollingHistogram:
+    """Durations of the last <size> samples of a phase.
+
+    Samples are written into a ring buffer, so recording takes constant time and
+    memory. Percentiles are computed from a sorted copy only when requested.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        if size <= 0:
+            raise ValueError(f"Parameter size must be positive. Given: {size}")
+        self.samples: list[float] = []
+        self.size = size
+        self.position = 0
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        if len(self.samples) < self.size:
+            self.samples.append(seconds)
+        else:
+            self.samples[self.position] = seconds
+            self.position = (self.position + 1) % self.size
+        self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """Return the <q> percentile of the kept samples, nearest rank method.
+
+        Keyword arguments:
+        argument -- description
+            q (float): percentile between 0 and 100
+        Return: return_description
+            float: duration in seconds, 0 without samples
+        """
+
+        return nearest_rank(sorted(self.samples), q)
+
+    def summary(self) -> dict[str, float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"count": self.count}
+        return {
+            "count": self.count,
+            "p50_ms": nearest_rank(ordered, 50) * 1000,
+            "p95_ms": nearest_rank(ordered, 95) * 1000,
+            "p99_ms": nearest_rank(ordered, 99) * 1000,
+            "max_ms": ordered[-1] * 1000,
+        }
+
+
+class FrameProfiler:
+    """Rolling histograms of the phases of frames and of background tasks.
+
+    The main loop calls start_frame() and lap(<phase>) after every phase; a lap
+    records the time since the previous lap. Other code records durations with
+    record(). A disabled profiler ignores all calls.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        size: int = 1024,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.enabled = enabled
+        self.size = size
+        self.clock = clock
+        self.histograms: dict[str, RollingHistogram] = {}
+        self.last = clock()
+        self.lock = threading.Lock()
+
+    def start_frame(self) -> None:
+        if self.enabled:
+            self.last = self.clock()
+
+    def lap(self, phase: str) -> None:
+        if not self.enabled:
+            return
+        now = self.clock()
+        self.record(phase, now - self.last)
+        self.last = now
+
+    def record(self, phase: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(
+                    phase, RollingHistogram(self.size)
+                )
+        histogram.record(seconds)
+
+    def report(self) -> dict[str, dict[str, float]]:
+        with self.lock:
+            histograms = dict(self.histograms)
+        return {phase: histogram.summary() for phase, histogram in histograms.items()}
+
+    def dump(self, path: str | Path | None = None) -> None:
+        """Write the report as JSON to a file or to the log.
+
+        Keyword arguments:
+        argument -- description
+            path (str | Path | None): target file, log if None
+        Return: return_description
+            None
+        """
+
+        report = json.dumps(self.report(), indent=4)
+        if path is None:
+            logger.info("Frame profile:\n%s", report)
+            return
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(report)
+        logger.info("Frame profile is stored in %s", file_path)
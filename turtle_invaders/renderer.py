@@ -0,0 +1,221 @@
+from __future__ import annotations
+import turtle as t
+import logging
+from collections.abc import Callable
+from time import perf_counter
+
+from turtle_invaders.constants import FRAME_RATE
+from turtle_invaders.bullet import Bullet, BulletPool
+from turtle_invaders.formation import Formation
+from turtle_invaders.fortresses import Fortress
+from turtle_invaders.lifecycle import Reaper
+from turtle_invaders.scoreboard import HudText, Score, LifeScore, Level
+from turtle_invaders.spaceships import SpaceShip, Invader
+from turtle_invaders.world import (
+    BulletState,
+    FortressState,
+    InvaderState,
+    SpaceShipState,
+    WorldEvent,
+)
+from turtle_invaders.types_ import numeric
+
+
+logger = logging.getLogger(__name__)
+
+
+FORMATION_TAG = "formation"
+
+
+class TurtleRenderer:
+    """Observer of a World drawing its objects with turtles.
+
+    Every object of the world gets its own sprite. Sprites are created, moved and
+    destroyed as the world notifies about changes. Bullet sprites are recycled
+    through a pool, other destroyed sprites are detached from the screen by a
+    reaper. The renderer must be notified from the thread owning the turtle
+    screen.
+
+    Invader sprites are detached from the screen after they were drawn once and
+    grouped under the canvas tag FORMATION_TAG, so a step of the formation is a
+    single canvas move and the screen does not redraw them on every update.
+
+    Changed sprites and widgets are collected as dirty. present() updates the
+    screen only if something is dirty, at most <refresh_rate> times per second.
+    Dirty HUD widgets are refreshed once per present.
+    """
+
+    def __init__(
+        self,
+        score: Score | None = None,
+        lifes: LifeScore | None = None,
+        level: Level | None = None,
+        bullet_pool: BulletPool | None = None,
+        reaper: Reaper | None = None,
+        screen: t.TurtleScreen | None = None,
+        refresh_rate: float = FRAME_RATE,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.score = score
+        self.lifes = lifes
+        self.level = level
+        self.bullet_pool = bullet_pool if bullet_pool is not None else BulletPool()
+        self.reaper = reaper if reaper is not None else Reaper()
+        self.sprites: dict[object, t.Turtle] = {}
+        self.screen = screen
+        self.refresh_time = 1 / refresh_rate
+        self.clock = clock
+        self.last_present = clock() - self.refresh_time
+        self.dirty: set[object] = set()
+        self.presents = 0
+        self.formation: Formation | None = None
+        self.formation_offset: tuple[numeric, numeric] = (0, 0)
+        self.unfrozen: dict[InvaderState, Invader] = {}
+
+    def notify(self, event: WorldEvent, subject: object) -> None:
+        match event:
+            case WorldEvent.SPAWN:
+                self.spawn(subject)
+            case WorldEvent.MOVE:
+                sprite = self.sprites.get(subject)
+                if sprite is not None:
+                    sprite.teleport(subject.x, subject.y)
+                    self.dirty.add(sprite)
+            case WorldEvent.FORMATION:
+                self.move_formation(subject)
+            case WorldEvent.DESTROY:
+                sprite = self.sprites.pop(subject, None)
+                if sprite is None:
+                    return
+                self.unfrozen.pop(subject, None)
+                self.dirty.add(sprite)
+                if isinstance(sprite, Bullet) and self.bullet_pool.release(sprite):
+                    return
+                self.reaper.reap(sprite)
+            case WorldEvent.HIT:
+                self.sprites[subject].change_color()
+                self.dirty.add(self.sprites[subject])
+            case WorldEvent.SCORE if self.score is not None:
+                self.score.value = subject.score
+                self.score.update()
+                self.dirty.add(self.score)
+            case WorldEvent.LIFES if self.lifes is not None:
+                self.lifes.value = subject.lifes
+                self.lifes.update()
+                self.dirty.add(self.lifes)
+            case WorldEvent.LEVEL if self.level is not None:
+                self.level.value = subject.level
+                self.level.update()
+                self.dirty.add(self.level)
+
+    def move_formation(self, formation: Formation) -> None:
+        """Move all sprites of the formation by the last step of the formation.
+
+        Keyword arguments:
+        argument -- description
+            formation (Formation): moved formation
+        Return: return_description
+            None
+        """
+
+        if formation is not self.formation:
+            return
+        dx = formation.x - self.formation_offset[0]
+        dy = formation.y - self.formation_offset[1]
+        self.formation_offset = (formation.x, formation.y)
+        screen = self.get_screen()
+        screen.getcanvas().move(FORMATION_TAG, dx * screen.xscale, -dy * screen.yscale)
+        for invader, sprite in self.unfrozen.items():
+            sprite.teleport(invader.x, invader.y)
+        self.dirty.add(formation)
+
+    def freeze_formation(self) -> None:
+        """Detach drawn invader sprites from the screen and tag them.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if not self.unfrozen:
+            return
+        canvas = self.get_screen().getcanvas()
+        for sprite in self.unfrozen.values():
+            canvas.addtag_withtag(FORMATION_TAG, sprite.turtle._item)
+            self.reaper.detach(sprite)
+        self.unfrozen.clear()
+
+    def get_screen(self) -> t.TurtleScreen:
+        return self.screen if self.screen is not None else t.Screen()
+
+    def mark_dirty(self, item: object) -> None:
+        """Request a present for a change made outside of the world.
+
+        Keyword arguments:
+        argument -- description
+            item (object): changed sprite or widget
+        Return: return_description
+            None
+        """
+
+        self.dirty.add(item)
+
+    def present(self, force: bool = False) -> bool:
+        """Update the screen if anything is dirty and the refresh time has passed.
+
+        Keyword arguments:
+        argument -- description
+            force (bool): ignore the refresh rate
+        Return: return_description
+            bool: True when the screen was updated
+        """
+
+        if not self.dirty:
+            return False
+        now = self.clock()
+        # frames arrive with some jitter, tolerate a tenth of the refresh time
+        if not force and now - self.last_present < self.refresh_time * 0.9:
+            return False
+        for item in self.dirty:
+            if isinstance(item, HudText) and item.stale:
+                item.refresh()
+        self.get_screen().update()
+        self.freeze_formation()
+        self.dirty.clear()
+        self.last_present = now
+        self.presents += 1
+        return True
+
+    def spawn(self, subject: object) -> None:
+        """Create a sprite for a new object of the world.
+
+        Keyword arguments:
+        argument -- description
+            subject (object): object of the world
+        Return: return_description
+            None
+        """
+
+        match subject:
+            case SpaceShipState():
+                sprite = SpaceShip()
+                sprite.teleport(subject.x, subject.y)
+            case InvaderState():
+                sprite = Invader(subject.x, subject.y)
+                formation = subject.formation
+                if formation is not None and formation is not self.formation:
+                    self.formation = formation
+                    self.formation_offset = (formation.x, formation.y)
+                self.unfrozen[subject] = sprite
+            case BulletState():
+                sprite = self.bullet_pool.acquire(
+                    subject.x, subject.y, subject.heading, subject.color
+                )
+            case FortressState():
+                sprite = Fortress(subject.x, subject.y)
+            case _:
+                logger.warning("Unknown object to render: %s", subject)
+                return
+        self.sprites[subject] = sprite
+        self.dirty.add(sprite)
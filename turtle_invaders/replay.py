@@ -0,0 +1,243 @@
+from __future__ import annotations
+import argparse
+import copy
+import logging
+import struct
+import sys
+import zlib
+from array import array
+from collections import defaultdict
+from enum import IntEnum
+from pathlib import Path
+from time import perf_counter
+from typing import BinaryIO
+
+from turtle_invaders.commands import Command, MoveUser, Shoot
+from turtle_invaders.constants import SIMULATION_STEP
+from turtle_invaders.world import World
+
+
+logger = logging.getLogger(__name__)
+MAGIC = b"TIRP"
+VERSION = 3
+# Older recordings carry no comparable hashes and were played under former rules.
+MIN_VERSION = 3
+HEADER = struct.Struct("<4sBqd")
+RECORD = struct.Struct("<IBd")
+
+
+class RecordKind(IntEnum):
+    MOVE = 1
+    SHOOT = 2
+    HASH = 3
+    END = 4
+
+
+class ReplayError(ValueError):
+    pass
+
+
+class ReplayDivergenceError(RuntimeError):
+    def __init__(self, tick: int, expected: int, actual: int) -> None:
+        super().__init__(
+            f"Replay diverged at tick {tick}: expected hash {expected:#010x}, "
+            f"got {actual:#010x}"
+        )
+        self.tick = tick
+        self.expected = expected
+        self.actual = actual
+
+
+def state_hash(world: World) -> int:
+    """Return a 32 bit hash of the visible state of a world.
+    All numbers of the snapshot are hashed as little endian doubles, so equal
+    positions hash equally whether they are stored as int or float.
+
+    Keyword arguments:
+    argument -- description
+        world (World): hashed world
+    Return: return_description
+        int: crc32 of the snapshot
+    """
+
+    snapshot = world.take_snapshot()
+    values = array(
+        "d",
+        (
+            snapshot.tick,
+            snapshot.time,
+            snapshot.score,
+            snapshot.lifes,
+            snapshot.level,
+            snapshot.game_over,
+            *snapshot.user,
+        ),
+    )
+    for group in (snapshot.invaders, snapshot.bullets, snapshot.fortresses):
+        values.append(len(group))
+        for item in group:
+            values.extend(item)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return zlib.crc32(values.tobytes())
+
+
+class Recorder:
+    """Write the seed and all applied commands of a world to a binary file.
+
+    The file starts with a header of magic, version, seed and simulation step.
+    Every command is stored as a record of tick, kind and value. A hash of the
+    world state is stored every <hash_interval> ticks to detect divergence of
+    a replay. close() marks the tick the recording ended at.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        seed: int,
+        step: float = SIMULATION_STEP,
+        hash_interval: int = 1,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.hash_interval = hash_interval
+        self.file: BinaryIO = open(self.path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, step))
+
+    def attach(self, world: World) -> None:
+        world.commands.recorder = self
+
+    def record(self, tick: int, command: Command) -> None:
+        match command:
+            case MoveUser():
+                self.file.write(RECORD.pack(tick, RecordKind.MOVE, command.step))
+            case Shoot():
+                self.file.write(RECORD.pack(tick, RecordKind.SHOOT, 0))
+            case _:
+                logger.warning("Command %s can not be recorded", command)
+
+    def observe(self, world: World) -> None:
+        """Store the state hash of the world after a step.
+
+        Keyword arguments:
+        argument -- description
+            world (World): recorded world
+        Return: return_description
+            None
+        """
+
+        if self.hash_interval and world.tick % self.hash_interval == 0:
+            self.file.write(RECORD.pack(world.tick, RecordKind.HASH, state_hash(world)))
+
+    def close(self, world: World) -> None:
+        if self.file.closed:
+            return
+        self.file.write(RECORD.pack(world.tick, RecordKind.END, 0))
+        self.file.close()
+        world.commands.recorder = None
+
+
+class Replay:
+    """Headless replay of a recording as fast as the CPU allows.
+
+    The world is re-created from the recorded seed and stepped with the recorded
+    commands. Every <keyframe_interval> ticks a copy of the world is kept, so
+    seek() only needs to replay the ticks after the nearest keyframe.
+    """
+
+    def __init__(self, path: str | Path, keyframe_interval: int = 1000) -> None:
+        self.keyframe_interval = keyframe_interval
+        self.commands: defaultdict[int, list[Command]] = defaultdict(list)
+        self.hashes: dict[int, int] = {}
+        self.end: int | None = None
+        with open(path, "rb") as file:
+            self.read(file)
+        self.world = World(seed=self.seed)
+        self.keyframes: dict[int, World] = {0: copy.deepcopy(self.world)}
+
+    def read(self, file: BinaryIO) -> None:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ReplayError("Recording is too short.")
+        magic, self.version, self.seed, self.step = HEADER.unpack(header)
+        if magic != MAGIC or not 1 <= self.version <= VERSION:
+            raise ReplayError(f"Unknown recording format: {magic!r} v{self.version}")
+        if self.version < MIN_VERSION:
+            raise ReplayError(
+                f"Recording v{self.version} was played under former rules and cannot "
+                f"be replayed, v{MIN_VERSION} or newer is required."
+            )
+        data = file.read()
+        usable = len(data) - len(data) % RECORD.size
+        for tick, kind, value in RECORD.iter_unpack(data[:usable]):
+            match kind:
+                case RecordKind.MOVE:
+                    self.commands[tick].append(MoveUser(value))
+                case RecordKind.SHOOT:
+                    self.commands[tick].append(Shoot())
+                case RecordKind.HASH:
+                    self.hashes[tick] = int(value)
+                case RecordKind.END:
+                    self.end = tick
+        if self.end is None:
+            logger.warning("Recording was not closed, replaying recorded ticks.")
+            self.end = max((*self.commands, *self.hashes), default=0)
+
+    def run(self, until: int | None = None) -> int:
+        """Step the world up to tick <until>, the end of the recording by default.
+
+        Keyword arguments:
+        argument -- description
+            until (int | None): last tick to replay
+        Return: return_description
+            int: number of replayed ticks
+        """
+
+        until = self.end if until is None else until
+        world = self.world
+        start = world.tick
+        while world.tick < until:
+            for command in self.commands.get(world.tick + 1, ()):
+                world.commands.push(command)
+            world.step(self.step)
+            expected = self.hashes.get(world.tick)
+            if expected is not None:
+                actual = state_hash(world)
+                if actual != expected:
+                    raise ReplayDivergenceError(world.tick, expected, actual)
+            if world.tick % self.keyframe_interval == 0:
+                self.keyframes[world.tick] = copy.deepcopy(world)
+        return world.tick - start
+
+    def seek(self, tick: int) -> World:
+        """Restore the world as it was after tick <tick>.
+
+        Keyword arguments:
+        argument -- description
+            tick (int): tick to seek to
+        Return: return_description
+            World: replayed world
+        """
+
+        keyframe = max(key for key in self.keyframes if key <= tick)
+        self.world = copy.deepcopy(self.keyframes[keyframe])
+        self.run(tick)
+        return self.world
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded game headless.")
+    parser.add_argument("path", type=Path, help="recording to replay")
+    args = parser.parse_args()
+    replay = Replay(args.path)
+    start = perf_counter()
+    ticks = replay.run()
+    duration = perf_counter() - start
+    print(
+        f"Replayed {ticks} ticks in {duration:.3f} s "
+        f"({ticks / max(duration, 1e-9):.0f} ticks/s), score {replay.world.score}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,81 +1,198 @@
 import turtle as t
 import logging
+from collections import deque
+from collections.abc import Callable, Sequence
+from time import perf_counter
+from turtle_invaders.types_ import numeric
 
 logger = logging.getLogger(__name__)
 NORMAL_FONT = ("TIMES NEW ROMAN", 24, "bold")
 BIG_FONT = ("TIMES NEW ROMAN", 50, "bold")
 HUGE_FONT = ("TIMES NEW ROMAN", 60, "bold")
+SMALL_FONT = ("COURIER", 12, "normal")
+SPARKS = "▁▂▃▄▅▆▇█"
 
 
-class Score(t.Turtle):
-    def __init__(self) -> None:
+class HudText(t.Turtle):
+    """Text widget of the head-up display drawn as one persistent canvas item.
+
+    update() only requests a refresh, so several changes within a frame cost a
+    single refresh. refresh() replaces the text of the canvas item in place and
+    does nothing when the rendered text did not change.
+    """
+
+    font = NORMAL_FONT
+
+    def __init__(self, x: numeric, y: numeric, value: int = 0) -> None:
         super().__init__()
         self.penup()
         self.hideturtle()
         self.color("white")
-        self.teleport(-290, 350)
-        self.value = 0
-        self.update()
+        self.teleport(x, y)
+        self.value = value
+        self.item: int | None = None
+        self.text: str | None = None
+        self.stale = True
+        self.refresh()
+
+    def render(self) -> str:
+        return f"{self.value}"
 
     def update(self) -> None:
-        self.clear()
-        self.write(f"SCORE: <{self.value:04}>", font=NORMAL_FONT)
+        self.stale = True
+
+    def refresh(self) -> bool:
+        """Draw the current value if it changed since the last refresh.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            bool: True when the canvas item was changed
+        """
+
+        self.stale = False
+        text = self.render()
+        if text == self.text:
+            return False
+        self.text = text
+        if self.item is None:
+            self.write(text, font=self.font)
+            self.item = self.items[-1]
+        else:
+            self.getscreen().getcanvas().itemconfigure(self.item, text=text)
+        return True
+
+
+class Score(HudText):
+    def __init__(self) -> None:
+        super().__init__(-290, 350)
+
+    def render(self) -> str:
+        return f"SCORE: <{self.value:04}>"
 
     def increase(self, value: int) -> None:
         self.value += value
 
 
-class HighScore(t.Turtle):
+class HighScore(HudText):
     def __init__(self, value: int = 0) -> None:
-        super().__init__()
-        self.penup()
-        self.hideturtle()
-        self.color("white")
-        self.teleport(-40, 350)
-        self.value = value
-        self.update()
+        super().__init__(-40, 350, value)
 
-    def update(self) -> None:
-        self.clear()
-        self.write(f"HIGH SCORE: <{self.value:04}>", font=NORMAL_FONT)
+    def render(self) -> str:
+        return f"HIGH SCORE: <{self.value:04}>"
 
 
-class LifeScore(t.Turtle):
+class LifeScore(HudText):
     def __init__(self) -> None:
-        super().__init__()
-        self.penup()
-        self.hideturtle()
-        self.color("white")
-        self.teleport(-290, -390)
-        self.value = 3
-        self.update()
+        super().__init__(-290, -390, 3)
 
-    def update(self) -> None:
-        self.clear()
-        self.write(f"{'X'*self.value}", font=NORMAL_FONT)
+    def render(self) -> str:
+        return f"{'X'*self.value}"
 
     def reduce_(self) -> None:
         self.value -= 1
 
 
-class Level(t.Turtle):
+class Level(HudText):
     def __init__(self) -> None:
-        super().__init__()
-        self.penup()
-        self.hideturtle()
-        self.color("white")
-        self.teleport(135, -390)
-        self.value = 0
-        self.update()
+        super().__init__(135, -390)
 
-    def update(self) -> None:
-        self.clear()
-        self.write(f"LEVEL: {self.value:2}", font=NORMAL_FONT)
+    def render(self) -> str:
+        return f"LEVEL: {self.value:2}"
 
     def increase(self, value: int) -> None:
         self.value += value
 
 
+def sparkline(values: Sequence[float]) -> str:
+    """Draw values as a line of block characters scaled to the maximum.
+
+    Keyword arguments:
+    argument -- description
+        values (Sequence[float]): non negative values
+    Return: return_description
+        str: one character per value
+    """
+
+    top = max(values, default=0)
+    if top <= 0:
+        return SPARKS[0] * len(values)
+    last = len(SPARKS) - 1
+    return "".join(SPARKS[min(round(value / top * last), last)] for value in values)
+
+
+class PerformanceOverlay(HudText):
+    """Toggleable text with frame rate, tick rate, frame times and counters.
+
+    Every frame is sampled, but rates are computed and the text is refreshed only
+    every <interval> seconds, so the overlay costs almost nothing per frame.
+    """
+
+    font = SMALL_FONT
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        history: int = 32,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.interval = interval
+        self.clock = clock
+        self.visible = False
+        self.frame_times: deque[float] = deque(maxlen=history)
+        self.frames = 0
+        self.ticks = 0
+        self.started = clock()
+        self.fps = 0.0
+        self.tps = 0.0
+        self.counts: dict[str, int] = {}
+        super().__init__(-290, -240)
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        self.update()
+
+    def sample(self, frame_time: float, ticks: int) -> bool:
+        """Collect a frame and compute rates when the interval has passed.
+
+        Keyword arguments:
+        argument -- description
+            frame_time (float): time spent on the frame in seconds
+            ticks (int): simulation steps of the frame
+        Return: return_description
+            bool: True when the visible overlay is due for new counters
+        """
+
+        self.frames += 1
+        self.ticks += ticks
+        self.frame_times.append(frame_time)
+        now = self.clock()
+        elapsed = now - self.started
+        if elapsed < self.interval:
+            return False
+        self.fps = self.frames / elapsed
+        self.tps = self.ticks / elapsed
+        self.frames = 0
+        self.ticks = 0
+        self.started = now
+        return self.visible
+
+    def show_counts(self, counts: dict[str, int]) -> None:
+        self.counts = counts
+        self.update()
+
+    def render(self) -> str:
+        if not self.visible:
+            return ""
+        worst = max(self.frame_times, default=0) * 1000
+        lines = [
+            f"FPS {self.fps:5.1f}  TPS {self.tps:6.0f}",
+            f"{sparkline(self.frame_times)} max {worst:5.1f} ms",
+            *(f"{name:<10} {value:5}" for name, value in self.counts.items()),
+        ]
+        return "\n".join(lines)
+
+
 class GameOverLabel(t.Turtle):
     def __init__(self):
         super().__init__()
@@ -0,0 +1,218 @@
+from __future__ import annotations
+import datetime
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreEntry(NamedTuple):
+    score: int
+    id: int
+    date: str
+
+
+def now() -> str:
+    return datetime.datetime.now().isoformat()
+
+
+class RunStats(NamedTuple):
+    score: int
+    level: int
+    shots: int
+    hits: int
+    duration: float
+    seed: int | None = None
+
+
+class RunRecord(NamedTuple):
+    id: int
+    finished: str
+    score: int
+    level: int
+    shots: int
+    hits: int
+    duration: float
+    seed: int | None
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    finished TEXT NOT NULL,
+    day TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL DEFAULT 0,
+    shots INTEGER NOT NULL DEFAULT 0,
+    hits INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    seed INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_level ON runs (level, score DESC);
+"""
+
+
+class ScoreDatabase:
+    """Results of games in a SQLite database shared by all game processes.
+
+    The database runs in WAL mode, so readers never block the writer and every
+    result is inserted in its own short transaction; concurrent processes wait
+    up to <timeout> seconds for each other instead of overwriting results.
+    Queries for the best runs overall, per day and per level use indices.
+    The connection may be used from any thread.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 5.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        with self.lock:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    @property
+    def high_score(self) -> int:
+        with self.lock:
+            (score,) = self.connection.execute(
+                "SELECT COALESCE(MAX(score), 0) FROM runs"
+            ).fetchone()
+        return score
+
+    def add_run(self, run: RunStats, finished: str | None = None) -> int:
+        """Insert the result of a game.
+
+        Keyword arguments:
+        argument -- description
+            run (RunStats): result and statistics of the game
+            finished (str | None): ISO date of the end of the game, now by default
+        Return: return_description
+            int: id of the run
+        """
+
+        finished = finished if finished is not None else now()
+        with self.lock:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (finished, day, score, level, shots, hits, duration,"
+                " seed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (finished, finished[:10], *run),
+            )
+        return cursor.lastrowid
+
+    def import_scores(self, scores: Iterable[tuple[str, int]]) -> int:
+        """Insert scores of former score files if the database is still empty.
+
+        Keyword arguments:
+        argument -- description
+            scores (Iterable[tuple[str, int]]): pairs of ISO date and score
+        Return: return_description
+            int: number of imported scores
+        """
+
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                (count,) = self.connection.execute(
+                    "SELECT COUNT(*) FROM runs"
+                ).fetchone()
+                rows = [(date, date[:10], score) for date, score in scores]
+                if count:
+                    rows = []
+                self.connection.executemany(
+                    "INSERT INTO runs (finished, day, score) VALUES (?, ?, ?)", rows
+                )
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+        return len(rows)
+
+    def _fetch(self, sql: str, parameters: tuple) -> list[RunRecord]:
+        with self.lock:
+            rows = self.connection.execute(sql, parameters).fetchall()
+        return [RunRecord(*row) for row in rows]
+
+    def top(self, n: int = 10) -> list[RunRecord]:
+        return self._fetch(
+            "SELECT id, finished, score, level, shots, hits, duration, seed FROM runs"
+            " ORDER BY score DESC, id LIMIT ?",
+            (n,),
+        )
+
+    def top_of_day(self, day: str, n: int = 10) -> list[RunRecord]:
+        return self._fetch(
+            "SELECT id, finished, score, level, shots, hits, duration, seed FROM runs"
+            " WHERE day = ? ORDER BY score DESC, id LIMIT ?",
+            (day, n),
+        )
+
+    def top_of_level(self, level: int, n: int = 10) -> list[RunRecord]:
+        return self._fetch(
+            "SELECT id, finished, score, level, shots, hits, duration, seed FROM runs"
+            " WHERE level = ? ORDER BY score DESC, id LIMIT ?",
+            (level, n),
+        )
+
+
+class ScoreJournal:
+    """Reader of the former score journal, a file of one JSON line per result.
+
+    All entries are read in file order, so every former result is handed to the
+    score database when it is filled on the first start. Broken lines, like a
+    torn last line of an interrupted write, are skipped.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.entries: list[ScoreEntry] = []
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def high_score(self) -> int:
+        return max((entry.score for entry in self.entries), default=0)
+
+    def load(self) -> None:
+        """Read all entries of the journal.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        self.entries.clear()
+        try:
+            with open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        item = json.loads(line)
+                        entry = ScoreEntry(item["score"], item["id"], item["date"])
+                    except (ValueError, KeyError):
+                        logger.warning("Skipping broken journal line: %r", line)
+                        continue
+                    self.entries.append(entry)
+        except FileNotFoundError:
+            return
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import logging
+from collections.abc import Iterator
+from typing import Generic, NamedTuple, TypeVar
+
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class Handle(NamedTuple):
+    index: int
+    generation: int
+
+
+class StaleHandleError(KeyError):
+    pass
+
+
+class SlotArray(Generic[T]):
+    """Densely packed storage addressed by generational handles.
+
+    Items live in a dense list, so iteration only visits stored items. A handle
+    points to a slot which knows the position of its item in the dense list.
+    Removal swaps the last item into the freed position and puts the slot on a
+    free list, so insertion and removal take constant time. Every reuse of a
+    slot increases its generation, which makes old handles detectable as stale.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[T] = []
+        self.handles: list[Handle] = []
+        self.positions: list[int] = []
+        self.generations: list[int] = []
+        self.free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __contains__(self, handle: Handle) -> bool:
+        return (
+            0 <= handle.index < len(self.generations)
+            and self.generations[handle.index] == handle.generation
+        )
+
+    def insert(self, item: T) -> Handle:
+        """Store an item and return a handle to it.
+
+        Keyword arguments:
+        argument -- description
+            item (T): item to store
+        Return: return_description
+            Handle: handle to the item
+        """
+
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+            self.positions.append(-1)
+        handle = Handle(index, self.generations[index])
+        self.positions[index] = len(self.items)
+        self.items.append(item)
+        self.handles.append(handle)
+        return handle
+
+    def get(self, handle: Handle) -> T:
+        """Return the item of a handle.
+
+        Keyword arguments:
+        argument -- description
+            handle (Handle): handle returned by insert()
+        Return: return_description
+            T: stored item
+        """
+
+        if handle not in self:
+            raise StaleHandleError(handle)
+        return self.items[self.positions[handle.index]]
+
+    def remove(self, handle: Handle) -> T:
+        """Remove the item of a handle. The handle becomes stale.
+
+        Keyword arguments:
+        argument -- description
+            handle (Handle): handle returned by insert()
+        Return: return_description
+            T: removed item
+        """
+
+        if handle not in self:
+            raise StaleHandleError(handle)
+        position = self.positions[handle.index]
+        item = self.items[position]
+        last_item = self.items.pop()
+        last_handle = self.handles.pop()
+        if position < len(self.items):
+            self.items[position] = last_item
+            self.handles[position] = last_handle
+            self.positions[last_handle.index] = position
+        self.generations[handle.index] += 1
+        self.positions[handle.index] = -1
+        self.free.append(handle.index)
+        return item
+
+    def clear(self) -> None:
+        for handle in list(self.handles):
+            self.remove(handle)
@@ -1,35 +1,200 @@
 import json
 import logging
 import datetime
+import threading
 from contextlib import suppress
-from time import sleep
+from time import perf_counter, sleep
 from pathlib import Path
+from collections import deque
 from collections.abc import Callable
-from queue import Queue
+from enum import IntEnum
+from queue import Empty, Queue
 from typing import Protocol
 
 logger = logging.getLogger(__name__)
 
 
-class FlagProtocol(Protocol):
-    run: bool
+class FixedTimestep:
+    """Accumulator for a simulation stepped with a fixed time step.
 
+    Real elapsed time is collected in an accumulator and paid out in whole steps
+    of <step> seconds, so the simulation advances at the same speed regardless
+    of how fast frames are rendered. At most <max_steps> are run per frame; time
+    beyond that is dropped to let a slow machine catch up. Frames are limited to
+    <frame_rate> per second.
+    """
 
-def run_in_loop(fn: Callable[[], None], app: FlagProtocol) -> None:
-    """Call a function in a loop as long as attribute App.run is True
-    Used to run a addition thread.
+    def __init__(
+        self,
+        step: float,
+        frame_rate: float,
+        max_steps: int = 25,
+        clock: Callable[[], float] = perf_counter,
+        sleep_fn: Callable[[float], None] = sleep,
+    ) -> None:
+        if step <= 0 or frame_rate <= 0:
+            raise ValueError("Parameters step and frame_rate must be positive.")
+        self.step = step
+        self.frame_time = 1 / frame_rate
+        self.max_steps = max_steps
+        self.clock = clock
+        self.sleep = sleep_fn
+        self.accumulator = 0.0
+        self.last_time = clock()
+        self.next_frame = self.last_time
 
-    Keyword arguments:
-    argument -- description
-        fn (Callable): function
-        app (FlagProtocol): application
-    Return:
-        None
+    def reset(self) -> None:
+        self.accumulator = 0.0
+        self.last_time = self.clock()
+        self.next_frame = self.last_time
+
+    def advance(self) -> int:
+        """Collect time elapsed since the last call and return number of steps.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            int: number of simulation steps to run in this frame
+        """
+
+        now = self.clock()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+        # tolerate rounding errors of the accumulated float time
+        steps = int((self.accumulator + 1e-9) // self.step)
+        if steps > self.max_steps:
+            logger.debug("Dropping %s simulation steps", steps - self.max_steps)
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator = max(self.accumulator - steps * self.step, 0.0)
+        return steps
+
+    def wait(self) -> None:
+        """Sleep until the next frame is due.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        self.next_frame += self.frame_time
+        delay = self.next_frame - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+        else:
+            self.next_frame = self.clock()
+
+
+class TaskPriority(IntEnum):
+    RENDERING = 0
+    BOOKKEEPING = 1
+
+
+class TaskQueue(Queue):
+    """Queue of callables with priority classes.
+
+    Tasks are returned by priority class first, then in insertion order. Tasks
+    put without a priority are treated as rendering tasks.
     """
-    while app.run:
-        fn()
-        sleep(0.001)
-    logger.info("Stop cyclic_execution with ExitException.")
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = {priority: deque() for priority in TaskPriority}
+
+    def _qsize(self) -> int:
+        return sum(len(tasks) for tasks in self.queue.values())
+
+    def _put(self, item: tuple[TaskPriority, Callable[[], None]]) -> None:
+        priority, task = item
+        self.queue[priority].append(task)
+
+    def _get(self) -> Callable[[], None]:
+        for tasks in self.queue.values():
+            if tasks:
+                return tasks.popleft()
+        raise IndexError("get from an empty TaskQueue")
+
+    def put(
+        self,
+        task: Callable[[], None],
+        block: bool = True,
+        timeout: float | None = None,
+        priority: TaskPriority = TaskPriority.RENDERING,
+    ) -> None:
+        super().put((priority, task), block, timeout)
+
+    def depth(self, priority: TaskPriority | None = None) -> int:
+        """Return the number of waiting tasks.
+
+        Keyword arguments:
+        argument -- description
+            priority (TaskPriority | None): count only this class if given
+        Return: return_description
+            int: backlog of the queue
+        """
+
+        with self.mutex:
+            if priority is None:
+                return self._qsize()
+            return len(self.queue[priority])
+
+
+class TaskTimer(Protocol):
+    def record(self, phase: str, seconds: float) -> None: ...
+
+
+class TaskWorker(threading.Thread):
+    """Thread calling tasks from a queue as soon as they arrive.
+
+    The thread blocks on the queue while it is empty, so it does not use any CPU
+    when idle. stop() queues a sentinel behind all waiting tasks; the thread
+    calls them and exits. The duration of every task is passed to <timer> under
+    the name of the thread.
+    """
+
+    STOP = object()
+
+    def __init__(
+        self, queue: TaskQueue, name: str = "tasks", timer: TaskTimer | None = None
+    ) -> None:
+        super().__init__(name=name, daemon=True)
+        self.queue = queue
+        self.timer = timer
+
+    def run(self) -> None:
+        while True:
+            task = self.queue.get()
+            try:
+                if task is self.STOP:
+                    logger.info("Stopping %s worker.", self.name)
+                    return
+                if self.timer is None:
+                    task()
+                else:
+                    start = perf_counter()
+                    task()
+                    self.timer.record(self.name, perf_counter() - start)
+            except Exception:
+                logger.exception("Task %s failed", task)
+            finally:
+                self.queue.task_done()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Let the thread finish waiting tasks and wait until it exits.
+
+        Keyword arguments:
+        argument -- description
+            timeout (float | None): maximum time to wait in seconds
+        Return: return_description
+            None
+        """
+
+        self.queue.put(self.STOP, priority=TaskPriority.BOOKKEEPING)
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+            if self.is_alive():
+                logger.error("Worker %s did not stop in time.", self.name)
 
 
 def perform_task_from(queue: Queue) -> None:
@@ -47,6 +212,38 @@ def perform_task_from(queue: Queue) -> None:
         queue.task_done()
 
 
+def drain_tasks_from(
+    queue: Queue,
+    budget: float | None = None,
+    clock: Callable[[], float] = perf_counter,
+) -> int:
+    """Call tasks from a queue until it is empty or the time budget is spent.
+    At least one task is called if the queue is not empty.
+
+    Keyword arguments:
+    argument -- description
+        queue (Queue): queue to get tasks
+        budget (float | None): time budget in seconds, None for no limit
+        clock (Callable): time source
+    Return: return_description
+        int: number of called tasks
+    """
+
+    deadline = None if budget is None else clock() + budget
+    done = 0
+    while True:
+        try:
+            task = queue.get_nowait()
+        except Empty:
+            break
+        task()
+        queue.task_done()
+        done += 1
+        if deadline is not None and clock() >= deadline:
+            break
+    return done
+
+
 def read_json(path: str | Path) -> dict[str, int]:
     """Read a json file.
 
@@ -0,0 +1,345 @@
+from __future__ import annotations
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import statistics
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from random import Random
+from typing import NamedTuple
+
+from turtle_invaders.constants import FRAME_RATE, SIMULATION_STEP
+from turtle_invaders.controls import Controls
+from turtle_invaders.profiler import nearest_rank
+from turtle_invaders.world import Difficulty, World
+
+
+logger = logging.getLogger(__name__)
+CACHE_VERSION = 3
+# Distance to the target below which the tracker stops moving.
+AIM = 5
+Bot = Callable[[World, Controls, Random], None]
+
+
+def camper(world: World, controls: Controls, random: Random) -> None:
+    controls.hold(0, True)
+
+
+def tracker(world: World, controls: Controls, random: Random) -> None:
+    """Move below the closest invader and shoot."""
+
+    user = world.user
+    target = min(
+        (invader.x for invader in world.formation),
+        key=lambda x: abs(x - user.x),
+        default=user.x,
+    )
+    direction = 0
+    if abs(target - user.x) >= AIM:
+        direction = 1 if target > user.x else -1
+    controls.hold(direction, True)
+
+
+def random_walker(world: World, controls: Controls, random: Random) -> None:
+    controls.hold(random.choice((-1, 0, 1)), random.random() < 0.5)
+
+
+BOTS: dict[str, Bot] = {
+    "camper": camper,
+    "tracker": tracker,
+    "random_walker": random_walker,
+}
+
+
+class Match(NamedTuple):
+    bot: str
+    difficulty: Difficulty
+    seed: int
+    max_ticks: int
+
+    def key(self) -> str:
+        """Return a hash of all parameters of the match, used as cache key.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            str: hex digest of the parameters
+        """
+
+        parameters = {
+            "version": CACHE_VERSION,
+            "bot": self.bot,
+            "difficulty": self.difficulty._asdict(),
+            "seed": self.seed,
+            "max_ticks": self.max_ticks,
+            "step": SIMULATION_STEP,
+        }
+        return hashlib.sha256(
+            json.dumps(parameters, sort_keys=True).encode()
+        ).hexdigest()
+
+
+class MatchResult(NamedTuple):
+    survival_time: float
+    level: int
+    score: int
+    shots: int
+    hits: int
+    ticks: int
+    game_over: bool
+
+
+def play(match: Match) -> MatchResult:
+    """Play a headless game with a bot until the game is over or <max_ticks>.
+    The bot holds keys of the same controls as a player of App.
+
+    Keyword arguments:
+    argument -- description
+        match (Match): bot, difficulty, seed and tick limit of the game
+    Return: return_description
+        MatchResult: statistics of the game
+    """
+
+    bot = BOTS[match.bot]
+    world = World(seed=match.seed, difficulty=match.difficulty)
+    controls = Controls(speed=match.difficulty.user_speed)
+    random = Random(match.seed)
+    while world.tick < match.max_ticks and not world.game_over:
+        bot(world, controls, random)
+        controls.sample(world, SIMULATION_STEP)
+        world.step(SIMULATION_STEP)
+    return MatchResult(
+        survival_time=world.time,
+        level=world.level,
+        score=world.score,
+        shots=world.shots,
+        hits=world.hits,
+        ticks=world.tick,
+        game_over=world.game_over,
+    )
+
+
+def grid(**values: Iterable) -> list[Difficulty]:
+    """Return the product of the given values of difficulty fields.
+
+    Fields which are not given keep their default.
+
+    Keyword arguments:
+    argument -- description
+        values (Iterable): values of a field of Difficulty, keyed by field name
+    Return: return_description
+        list[Difficulty]: one difficulty per combination
+    """
+
+    unknown = set(values) - set(Difficulty._fields)
+    if unknown:
+        raise ValueError(f"Unknown difficulty fields: {', '.join(sorted(unknown))}")
+    names = list(values)
+    return [
+        Difficulty(**dict(zip(names, combination)))
+        for combination in itertools.product(*(values[name] for name in names))
+    ]
+
+
+class Tournament:
+    """Play matches in a process pool, caching every result on disk.
+
+    A result is stored in <cache_dir> as a JSON file named by the hash of the
+    parameters of its match, so running an extended grid again only plays the
+    matches which were not played yet. Files are written through a temporary file
+    and renamed, so an interrupted run never leaves a broken cache entry.
+    """
+
+    def __init__(
+        self, cache_dir: str | Path | None = None, workers: int | None = None
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.workers = workers
+        self.played = 0
+        self.cached = 0
+
+    def cache_path(self, match: Match) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{match.key()}.json"
+
+    def load(self, match: Match) -> MatchResult | None:
+        path = self.cache_path(match)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as f:
+                return MatchResult(**json.load(f)["result"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring broken cache entry %s", path)
+            return None
+
+    def store(self, match: Match, result: MatchResult) -> None:
+        path = self.cache_path(match)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "match": {**match._asdict(), "difficulty": match.difficulty._asdict()},
+            "result": result._asdict(),
+        }
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "w") as f:
+            json.dump(entry, f, indent=4)
+        os.replace(temporary, path)
+
+    def run(self, matches: Sequence[Match]) -> list[MatchResult]:
+        """Return the results of all matches in order, playing uncached ones.
+
+        Keyword arguments:
+        argument -- description
+            matches (Sequence[Match]): matches to play
+        Return: return_description
+            list[MatchResult]: results in the order of <matches>
+        """
+
+        results: list[MatchResult | None] = [self.load(match) for match in matches]
+        missing = [i for i, result in enumerate(results) if result is None]
+        self.cached += len(matches) - len(missing)
+        if missing:
+            logger.info("Playing %s matches, %s cached", len(missing), self.cached)
+            workers = self.workers or os.cpu_count() or 1
+            chunksize = max(len(missing) // (4 * workers), 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                played = executor.map(
+                    play, [matches[i] for i in missing], chunksize=chunksize
+                )
+                for i, result in zip(missing, played):
+                    self.store(matches[i], result)
+                    results[i] = result
+            self.played += len(missing)
+        return results  # type: ignore[return-value]
+
+
+def distribution(values: Sequence[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    return {
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p10": nearest_rank(ordered, 10),
+        "p90": nearest_rank(ordered, 90),
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def aggregate(results: Sequence[MatchResult]) -> dict:
+    """Summarize the results of the matches of one grid point.
+
+    Keyword arguments:
+    argument -- description
+        results (Sequence[MatchResult]): results of the matches
+    Return: return_description
+        dict: distributions of survival time, level, score and accuracy
+    """
+
+    return {
+        "matches": len(results),
+        "game_over": sum(result.game_over for result in results),
+        "survival_time": distribution([result.survival_time for result in results]),
+        "level": distribution([result.level for result in results]),
+        "score": distribution([result.score for result in results]),
+        "accuracy": distribution(
+            [result.hits / result.shots for result in results if result.shots]
+        ),
+    }
+
+
+def sweep(
+    difficulties: Iterable[Difficulty],
+    bots: Iterable[str],
+    seeds: Iterable[int],
+    max_ticks: int,
+    tournament: Tournament,
+) -> list[dict]:
+    """Play every bot with every seed at every difficulty and aggregate results
+    per pair of difficulty and bot.
+
+    Keyword arguments:
+    argument -- description
+        difficulties (Iterable[Difficulty]): grid points
+        bots (Iterable[str]): names of bots of BOTS
+        seeds (Iterable[int]): seeds of the worlds per grid point
+        max_ticks (int): tick limit of every game
+        tournament (Tournament): runner of the matches
+    Return: return_description
+        list[dict]: aggregated results ready to be dumped as JSON
+    """
+
+    matches = [
+        Match(bot, difficulty, seed, max_ticks)
+        for difficulty, bot, seed in itertools.product(difficulties, bots, seeds)
+    ]
+    grouped: defaultdict[tuple[Difficulty, str], list[MatchResult]] = defaultdict(
+        list
+    )
+    for match, result in zip(matches, tournament.run(matches)):
+        grouped[match.difficulty, match.bot].append(result)
+    return [
+        {"difficulty": difficulty._asdict(), "bot": bot, **aggregate(results)}
+        for (difficulty, bot), results in grouped.items()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Play headless games with bots over a grid of difficulties."
+    )
+    parser.add_argument(
+        "--bots", nargs="+", default=list(BOTS), help=f"any of {', '.join(BOTS)}"
+    )
+    parser.add_argument("--seeds", type=int, default=10, help="games per grid point")
+    parser.add_argument(
+        "--max-ticks", type=int, default=5 * 60 * FRAME_RATE, help="tick limit"
+    )
+    parser.add_argument("--workers", type=int, help="processes, CPU count by default")
+    parser.add_argument(
+        "--cache", type=Path, default=Path("data/tournament"), help="cache directory"
+    )
+    parser.add_argument("--output", type=Path, help="write JSON to a file")
+    defaults = Difficulty()
+    for field in Difficulty._fields:
+        default = getattr(defaults, field)
+        parser.add_argument(
+            f"--{field.replace('_', '-')}",
+            nargs="+",
+            type=type(default),
+            default=[default],
+            metavar="VALUE",
+        )
+    args = parser.parse_args()
+    unknown = set(args.bots) - set(BOTS)
+    if unknown:
+        parser.error(f"Unknown bots: {', '.join(sorted(unknown))}")
+    difficulties = grid(**{field: getattr(args, field) for field in Difficulty._fields})
+    tournament = Tournament(args.cache, args.workers)
+    results = sweep(
+        difficulties, args.bots, range(args.seeds), args.max_ticks, tournament
+    )
+    report = json.dumps(
+        {"played": tournament.played, "cached": tournament.cached, "results": results},
+        indent=4,
+    )
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
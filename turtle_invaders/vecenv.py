@@ -0,0 +1,231 @@
+from __future__ import annotations
+import logging
+import secrets
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+from turtle_invaders.constants import SIMULATION_STEP, ObjectDirection
+from turtle_invaders.controls import Controls
+from turtle_invaders.world import (
+    BulletState,
+    Difficulty,
+    FortressState,
+    InvaderState,
+    SpaceShipState,
+    World,
+    WorldEvent,
+)
+
+
+logger = logging.getLogger(__name__)
+# Actions as pairs of the held direction and whether fire is held.
+ACTIONS = (
+    (0, False),
+    (-1, False),
+    (1, False),
+    (0, True),
+    (-1, True),
+    (1, True),
+)
+
+
+class Observations(NamedTuple):
+    """Batched state of all environments, one row per environment."""
+
+    user: np.ndarray
+    formation: np.ndarray
+    invaders: np.ndarray
+    bullets: np.ndarray
+    bullet_count: np.ndarray
+    fortresses: np.ndarray
+    lifes: np.ndarray
+    level: np.ndarray
+
+
+class StateWriter:
+    """World observer keeping the row of one environment in the shared arrays.
+
+    Invader occupancy, fortress lifes and the position of the user change
+    rarely, so they are written when the world notifies about the change
+    instead of being gathered from all objects after every step.
+    """
+
+    def __init__(self, observations: Observations, row: int) -> None:
+        self.observations = observations
+        self.row = row
+
+    def notify(self, event: WorldEvent, subject: object) -> None:
+        match event, subject:
+            case WorldEvent.MOVE, SpaceShipState():
+                self.observations.user[self.row] = subject.x, subject.y
+            case WorldEvent.SPAWN | WorldEvent.DESTROY, InvaderState():
+                column, row = subject.slot
+                self.observations.invaders[self.row, column, row] = (
+                    event == WorldEvent.SPAWN
+                )
+            case WorldEvent.SPAWN | WorldEvent.HIT, FortressState():
+                self.observations.fortresses[self.row, subject.handle.index] = (
+                    subject.lifes
+                )
+            case WorldEvent.DESTROY, FortressState():
+                self.observations.fortresses[self.row, subject.handle.index] = 0
+
+
+class VecEnv:
+    """Gym-style environment stepping <n> independent games in lockstep.
+
+    The game rules stay in World and actions hold keys of the same Controls as
+    the keyboard, so every environment plays exactly the game of App, without any
+    turtle. Observations live in preallocated NumPy arrays
+    with one row per environment; rarely changing state is written by observers
+    and only the bullets and the formation offset are gathered after a step.
+    Actions index ACTIONS and are held for <frame_skip> ticks of every step.
+    Rewards are the gains of score, done environments are reset automatically.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        difficulty: Difficulty | None = None,
+        frame_skip: int = 4,
+        max_bullets: int = 32,
+        max_ticks: int | None = None,
+    ) -> None:
+        if np is None:
+            raise ModuleNotFoundError("VecEnv requires the numpy extra.")
+        if n <= 0:
+            raise ValueError(f"Parameter n must be positive. Given: {n}")
+        if frame_skip <= 0:
+            raise ValueError(
+                f"Parameter frame_skip must be positive. Given: {frame_skip}"
+            )
+        self.n = n
+        self.difficulty = difficulty if difficulty is not None else Difficulty()
+        self.frame_skip = frame_skip
+        self.max_bullets = max_bullets
+        self.max_ticks = max_ticks
+        probe = World(seed=0, difficulty=self.difficulty)
+        self.observations = Observations(
+            user=np.zeros((n, 2), dtype=np.float32),
+            formation=np.zeros((n, 2), dtype=np.float32),
+            invaders=np.zeros(
+                (n, len(probe.invaders), self.difficulty.invader_rows), dtype=bool
+            ),
+            bullets=np.zeros((n, max_bullets, 3), dtype=np.float32),
+            bullet_count=np.zeros(n, dtype=np.int32),
+            fortresses=np.zeros((n, len(probe.fortresses)), dtype=np.int16),
+            lifes=np.zeros(n, dtype=np.int16),
+            level=np.zeros(n, dtype=np.int16),
+        )
+        self.rewards = np.zeros(n, dtype=np.float32)
+        self.dones = np.zeros(n, dtype=bool)
+        self.scores = np.zeros(n, dtype=np.int64)
+        self.worlds: list[World] = []
+        self.controls: list[Controls] = []
+        self.seed = 0
+        self.episodes = 0
+
+    def reset(self, seed: int | None = None) -> Observations:
+        """Start new games in all environments.
+
+        Keyword arguments:
+        argument -- description
+            seed (int | None): seed of the first environment, the following
+                environments use the next seeds; random if None
+        Return: return_description
+            Observations: first observations, the arrays are reused by step()
+        """
+
+        self.seed = seed if seed is not None else secrets.randbits(32)
+        self.episodes = 0
+        self.worlds = [self.reset_one(row) for row in range(self.n)]
+        self.controls = [
+            Controls(speed=self.difficulty.user_speed) for _ in range(self.n)
+        ]
+        self.gather()
+        return self.observations
+
+    def reset_one(self, row: int) -> World:
+        world = World(
+            seed=self.seed + self.episodes * self.n + row, difficulty=self.difficulty
+        )
+        observations = self.observations
+        observations.invaders[row] = False
+        observations.fortresses[row] = 0
+        writer = StateWriter(observations, row)
+        writer.notify(WorldEvent.MOVE, world.user)
+        for invader in world.formation:
+            writer.notify(WorldEvent.SPAWN, invader)
+        for fortress in world.fortresses:
+            writer.notify(WorldEvent.SPAWN, fortress)
+        world.observers.append(writer)
+        self.scores[row] = 0
+        return world
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[Observations, np.ndarray, np.ndarray, list[dict]]:
+        """Apply one action per environment and advance all games.
+
+        Keyword arguments:
+        argument -- description
+            actions (np.ndarray): indices of ACTIONS of shape (n,)
+        Return: return_description
+            tuple[Observations, np.ndarray, np.ndarray, list[dict]]: observations,
+                rewards, done flags and infos; infos of done environments hold
+                the result of the finished game
+        """
+
+        if len(self.worlds) != self.n:
+            raise RuntimeError("Call reset() before step().")
+        infos: list[dict] = [{} for _ in range(self.n)]
+        for row, action in enumerate(actions):
+            world, controls = self.worlds[row], self.controls[row]
+            controls.hold(*ACTIONS[action])
+            for _ in range(self.frame_skip):
+                controls.sample(world, SIMULATION_STEP)
+                world.step(SIMULATION_STEP)
+                if world.game_over:
+                    break
+            self.rewards[row] = world.score - self.scores[row]
+            self.scores[row] = world.score
+            truncated = self.max_ticks is not None and world.tick >= self.max_ticks
+            self.dones[row] = world.game_over or truncated
+            if self.dones[row]:
+                infos[row] = {
+                    "score": world.score,
+                    "level": world.level,
+                    "ticks": world.tick,
+                    "truncated": truncated and not world.game_over,
+                }
+        if self.dones.any():
+            self.episodes += 1
+            for row in np.flatnonzero(self.dones).tolist():
+                self.worlds[row] = self.reset_one(row)
+                self.controls[row] = Controls(speed=self.difficulty.user_speed)
+        self.gather()
+        return self.observations, self.rewards, self.dones, infos
+
+    def gather(self) -> None:
+        observations = self.observations
+        observations.bullets.fill(0)
+        for row, world in enumerate(self.worlds):
+            formation = world.formation
+            observations.formation[row] = formation.x, formation.y
+            observations.lifes[row] = world.lifes
+            observations.level[row] = world.level
+            bullets: list[BulletState] = world.bullets.items[: self.max_bullets]
+            observations.bullet_count[row] = len(bullets)
+            if bullets:
+                observations.bullets[row, : len(bullets)] = [
+                    (
+                        bullet.x,
+                        bullet.y,
+                        1 if bullet.heading == ObjectDirection.NORTH else -1,
+                    )
+                    for bullet in bullets
+                ]
@@ -0,0 +1,984 @@
+from __future__ import annotations
+import logging
+from enum import Enum, IntEnum, auto
+from collections.abc import Callable
+from random import Random
+from typing import NamedTuple, Protocol
+
+from turtle_invaders.commands import CommandBuffer
+from turtle_invaders.collisions import (
+    HAS_NUMPY,
+    SpatialHash,
+    find_impacts,
+    overlapping_pairs,
+    pack,
+    pack_paths,
+    time_of_impact,
+)
+from turtle_invaders.constants import (
+    SIMULATION_STEP,
+    Screen,
+    InvadersMovementDirection,
+    ObjectDirection,
+)
+from turtle_invaders.formation import Formation
+from turtle_invaders.slots import Handle, SlotArray
+from turtle_invaders.types_ import numeric
+
+
+logger = logging.getLogger(__name__)
+
+
+class WorldEvent(Enum):
+    SPAWN = auto()
+    MOVE = auto()
+    FORMATION = auto()
+    DESTROY = auto()
+    HIT = auto()
+    SCORE = auto()
+    LIFES = auto()
+    LEVEL = auto()
+
+
+class WorldObserver(Protocol):
+    def notify(self, event: WorldEvent, subject: object) -> None: ...
+
+
+class PhaseTimer(Protocol):
+    clock: Callable[[], float]
+
+    def record(self, phase: str, seconds: float) -> None: ...
+
+
+class Body:
+    radius: numeric = 10
+
+    def __init__(
+        self,
+        x: numeric,
+        y: numeric,
+        heading: ObjectDirection = ObjectDirection.NORTH,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.heading = heading
+        self.alive = True
+        self.handle: Handle | None = None
+
+    def collides_with(self, other: Body) -> bool:
+        return (self.x - other.x) ** 2 + (self.y - other.y) ** 2 <= (
+            self.radius + other.radius
+        ) ** 2
+
+
+class SpaceShipState(Body):
+    def __init__(self, x: numeric = 0, y: numeric = -330) -> None:
+        super().__init__(x, y, ObjectDirection.NORTH)
+        self.color = "green"
+
+
+class InvaderState(Body):
+    """Invader with a position relative to its formation, if it has one."""
+
+    def __init__(self, x: numeric, y: numeric) -> None:
+        self.formation: Formation | None = None
+        self.slot = (0, 0)
+        super().__init__(x, y, ObjectDirection.SOUTH)
+        self.color = "blue"
+
+    @property
+    def x(self) -> numeric:
+        if self.formation is None:
+            return self.dx
+        return self.formation.x + self.dx
+
+    @x.setter
+    def x(self, value: numeric) -> None:
+        self.dx = value if self.formation is None else value - self.formation.x
+
+    @property
+    def y(self) -> numeric:
+        if self.formation is None:
+            return self.dy
+        return self.formation.y + self.dy
+
+    @y.setter
+    def y(self, value: numeric) -> None:
+        self.dy = value if self.formation is None else value - self.formation.y
+
+
+class BulletState(Body):
+    """Bullet remembering its position before its last move."""
+
+    radius = 3
+
+    def __init__(
+        self, x: numeric, y: numeric, heading: ObjectDirection, color: str
+    ) -> None:
+        super().__init__(x, y, heading)
+        self.color = color
+        self.last_x = x
+        self.last_y = y
+
+    def move(self, step: numeric) -> None:
+        self.last_x = self.x
+        self.last_y = self.y
+        self.y += step if self.heading == ObjectDirection.NORTH else -step
+
+
+class FortressState(Body):
+    def __init__(self, x: numeric, y: numeric) -> None:
+        super().__init__(x, y)
+        self.lifes = 10
+
+    def hit(self) -> None:
+        self.lifes -= 1
+
+
+class ContactKind(IntEnum):
+    """Kinds of objects a bullet can hit, simultaneous contacts in this order."""
+
+    USER = 0
+    FORTRESS = 1
+    INVADER = 2
+    BULLET = 3
+
+
+class Contact(NamedTuple):
+    """Contact of a bullet during its last move.
+
+    Contacts are ordered by <time>, the fraction of the move, then by the
+    position of the bullet in the bullets, the kind and the <rank> of the target.
+    """
+
+    time: float
+    order: int
+    kind: ContactKind
+    rank: tuple[int, ...]
+    bullet: BulletState
+    target: Body
+
+
+class WorldSnapshot(NamedTuple):
+    """Immutable copy of the visible state of a world."""
+
+    tick: int
+    time: float
+    score: int
+    lifes: int
+    level: int
+    game_over: bool
+    user: tuple[numeric, numeric]
+    invaders: tuple[tuple[numeric, numeric], ...]
+    bullets: tuple[tuple[numeric, numeric, ObjectDirection], ...]
+    fortresses: tuple[tuple[numeric, numeric, int], ...]
+
+
+class Difficulty(NamedTuple):
+    """Tuning knobs of the game rules. Defaults are the ones of the arcade game."""
+
+    cooldown_invaders_shoot: float = 2.0
+    cooldown_invaders_movement: float = 2.0
+    reduce_bullet_movement: float = 0.001
+    reduce_invaders_movement: float = 0.03
+    reduce_user_shoot: float = 0.009
+    invader_rows: int = 6
+    fortresses: int = 4
+    user_speed: float = 300.0
+
+
+class World:
+    """Game rules and state without any dependency on turtle or Tk.
+
+    Time is advanced explicitly, so the world can be stepped as fast as the CPU
+    allows. Observers are notified about every visible change and may render it.
+    A step of the formation is notified once for the whole formation.
+    With <vectorized> collisions are tested in batches with NumPy. With
+    <bullets_destroy_bullets>, the default, bullets flying towards each other destroy
+    each other.
+    Cooldowns and sizes of the game are taken from <difficulty>. The user moves at
+    most <difficulty.user_speed> pixels per second, whoever pushes the moves.
+
+    Only the thread stepping the world may change it. Other threads push commands
+    to <commands>, which are applied at the beginning of the next step, and read
+    the immutable <snapshot> published by publish().
+    """
+
+    def __init__(
+        self,
+        seed: int | None = None,
+        vectorized: bool = False,
+        bullets_destroy_bullets: bool = True,
+        difficulty: Difficulty | None = None,
+    ) -> None:
+        if vectorized and not HAS_NUMPY:
+            raise ModuleNotFoundError("Vectorized collisions require the numpy extra.")
+        self.random = Random(seed)
+        self.vectorized = vectorized
+        self.bullets_destroy_bullets = bullets_destroy_bullets
+        self.difficulty = difficulty if difficulty is not None else Difficulty()
+        self.time = 0.0
+        self.tick = 0
+        self.observers: list[WorldObserver] = []
+        self.score = 0
+        self.shots = 0
+        self.hits = 0
+        self.lifes = 3
+        self.level = 0
+        self.level_up = False
+        self.user = SpaceShipState()
+        self.user_travel = self.difficulty.user_speed * SIMULATION_STEP
+        self.formation = Formation([])
+        self.invaders_movement_direction = InvadersMovementDirection.RIGHT
+        self.bullets: SlotArray[BulletState] = SlotArray()
+        self.fortresses: SlotArray[FortressState] = SlotArray()
+        self.garbage: list[Body] = []
+        self.index = SpatialHash()
+        self.cooldown_user_shoot = 0.5
+        self.cooldown_user_last_shoot = self.time - 30
+        self.cooldown_invaders_shoot = self.difficulty.cooldown_invaders_shoot
+        self.cooldown_invaders_last_shoot = self.time
+        self.cooldown_invaders_movement = self.difficulty.cooldown_invaders_movement
+        self.cooldown_invaders_last_move = self.time
+        self.cooldown_bullet_movement = 0.005
+        self.commands = CommandBuffer()
+        self.initialize_invaders(num_rows=self.difficulty.invader_rows)
+        self.initialize_fortressesV2(-290, self.difficulty.fortresses)
+        self.snapshot = self.publish()
+
+    # OBSERVERS
+    def attach(self, observer: WorldObserver) -> None:
+        """Register an observer and replay the current state to it.
+
+        Keyword arguments:
+        argument -- description
+            observer (WorldObserver): object notified about changes
+        Return: return_description
+            None
+        """
+
+        self.observers.append(observer)
+        observer.notify(WorldEvent.SPAWN, self.user)
+        for item in (*self.formation, *self.fortresses, *self.bullets):
+            observer.notify(WorldEvent.SPAWN, item)
+        for event in (WorldEvent.SCORE, WorldEvent.LIFES, WorldEvent.LEVEL):
+            observer.notify(event, self)
+
+    def emit(self, event: WorldEvent, subject: object) -> None:
+        for observer in self.observers:
+            observer.notify(event, subject)
+
+    @property
+    def invaders(self) -> list[list[InvaderState | None]]:
+        return self.formation.columns
+
+    @invaders.setter
+    def invaders(self, columns: list[list[InvaderState | None]]) -> None:
+        """Replace the grid of invaders. Invaders of the former grid are destroyed,
+        the new ones are registered in the spatial index.
+
+        Keyword arguments:
+        argument -- description
+            columns (list[list[InvaderState | None]]): columns from top to bottom
+        Return: return_description
+            None
+        """
+
+        for invader in self.formation:
+            if invader.alive:
+                self.destroy(invader)
+        self.formation = Formation(columns)
+        for invader in self.formation:
+            self.index.insert(invader)
+            self.emit(WorldEvent.SPAWN, invader)
+
+    # INITIALIZATION
+    def initialize_invaders(self, top_row_y: numeric = 300, num_rows: int = 6) -> None:
+        """Create invaders and fill the screen with "enimies".
+        <top_row_y> coresponds to the y coordinate of the top row. Number of rows is
+        defined by parameter <num_rows>. <num_rows> must be a positiv integer.
+        Invaders left from a previous grid are destroyed.
+
+        Keyword arguments:
+        argument -- description
+            top_row_y (numeric): Y coordinate for highes row is bots
+            num_rows (int): number of rows
+        Return: return_description
+            None
+        """
+
+        if num_rows < 0:
+            raise ValueError("Parameter num_rows must be a positive integer.")
+        START_X = Screen.LEFT_LIMIT_FOR_OBJECTS
+        END_X = int(Screen.WIDTH / 4)
+        self.invaders_movement_direction = InvadersMovementDirection.RIGHT
+        self.invaders = [
+            [InvaderState(x, top_row_y - i * 40) for i in range(num_rows)]
+            for x in range(START_X, END_X, 40)
+        ]
+
+    def initialize_fortresses(self, y: numeric, amount: int = 4) -> None:
+        """Create fortresses building a secure shelter for user.
+        Parameter <y> set a coordinate at which <amount> of instances will be
+        positioned. <amount> must be positive integer.
+
+        Keyword arguments:
+        argument -- description
+            y (numeric): coordinate to place fortresses
+            amount (int): amount of fortresses.
+        Return: return_description
+            None
+        """
+
+        if amount < 0:
+            raise ValueError(
+                f"Parameter must be greater or equal null. Given: {amount}."
+            )
+        distance = int(Screen.WIDTH / (amount + 1))
+        self.clear_fortresses()
+        for x in range(
+            int(Screen.LEFT_LIMIT_FOR_OBJECTS) + distance,
+            int(Screen.RIGHT_LIMIT_FOR_OBJECTS),
+            distance,
+        ):
+            self.add_fortress(FortressState(x, y))
+
+    def initialize_fortressesV2(self, y: numeric, amount: int = 4) -> None:
+        """Create pairs of fortresses building a secure shelter for user.
+        Parameter <y> set a coordinate at which <amount> of pairs will be
+        positioned. <amount> must be positive integer.
+
+        Keyword arguments:
+        argument -- description
+            y (numeric): coordinate to place fortresses
+            amount (int): amount of fortresses.
+        Return: return_description
+            None
+        """
+
+        if amount < 0:
+            raise ValueError(
+                f"Parameter must be greater or equal null. Given: {amount}."
+            )
+        distance = int(Screen.WIDTH / (amount + 1))
+        self.clear_fortresses()
+        for x in range(
+            int(Screen.LEFT_LIMIT_FOR_OBJECTS) + distance,
+            int(Screen.RIGHT_LIMIT_FOR_OBJECTS),
+            distance,
+        ):
+            self.add_fortress(FortressState(x - FortressState.radius, y))
+            self.add_fortress(FortressState(x + FortressState.radius, y))
+
+    def add_fortress(self, fortress: FortressState) -> None:
+        fortress.handle = self.fortresses.insert(fortress)
+        self.index.insert(fortress)
+        self.emit(WorldEvent.SPAWN, fortress)
+
+    def clear_fortresses(self) -> None:
+        for fortress in self.fortresses:
+            if fortress.alive:
+                self.destroy(fortress)
+        self.collect_garbage()
+
+    # LIFECYCLE
+    def destroy(self, item: Body) -> None:
+        """Mark an object as dead and for removal. Dead objects are ignored.
+
+        Keyword arguments:
+        argument -- description
+            item (Body): object to destroy
+        Return: return_description
+            None
+        """
+
+        if not item.alive:
+            return
+        item.alive = False
+        self.garbage.append(item)
+        self.index.remove(item)
+        self.emit(WorldEvent.DESTROY, item)
+
+    def mark_all_bullets_for_removal(self) -> None:
+        """Destroy all bullets and mark them for removal.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if len(self.bullets) > 0:
+            logger.debug("Reset list of bullets")
+            for bullet in self.bullets:
+                if bullet.alive:
+                    self.destroy(bullet)
+
+    def collect_garbage(self) -> None:
+        """Remove objects which are marked as garbage.
+
+        Implementd objects are: fortresses, bullets, invaders. Bullets and
+        fortresses are removed through their handles, objects with stale handles
+        are skipped.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        for item_to_remove in self.garbage:
+            if isinstance(item_to_remove, InvaderState):
+                self.formation.remove(item_to_remove)
+                continue
+            slots = (
+                self.bullets
+                if isinstance(item_to_remove, BulletState)
+                else self.fortresses
+            )
+            handle = item_to_remove.handle
+            if handle is not None and handle in slots:
+                slots.remove(handle)
+                item_to_remove.handle = None
+        self.garbage.clear()
+
+    # TIME
+    def advance(self, dt: numeric) -> None:
+        """Move the world clock forward by <dt> seconds.
+
+        Keyword arguments:
+        argument -- description
+            dt (numeric): elapsed time in seconds
+        Return: return_description
+            None
+        """
+
+        self.time += dt
+
+    def step(
+        self, dt: numeric = SIMULATION_STEP, timer: PhaseTimer | None = None
+    ) -> None:
+        """Advance the clock by <dt> seconds, apply pushed commands and run all game
+        rules once. Steps are counted in <tick>. With a <timer> the duration of
+        every phase of the step is recorded.
+
+        Keyword arguments:
+        argument -- description
+            dt (numeric): elapsed time in seconds
+            timer (PhaseTimer | None): receiver of phase durations
+        Return: return_description
+            None
+        """
+
+        self.tick += 1
+        self.advance(dt)
+        self.user_travel = self.difficulty.user_speed * dt
+        if timer is None:
+            for _, phase in self.phases(dt):
+                phase()
+            return
+        clock = timer.clock
+        for name, phase in self.phases(dt):
+            start = clock()
+            phase()
+            timer.record(name, clock() - start)
+
+    def phases(self, dt: numeric) -> tuple[tuple[str, Callable[[], object]], ...]:
+        """Return named phases of a step in the order they run.
+
+        Keyword arguments:
+        argument -- description
+            dt (numeric): elapsed time in seconds
+        Return: return_description
+            tuple: pairs of phase name and callable
+        """
+
+        return (
+            ("apply_commands", lambda: self.commands.apply(self)),
+            ("handle_invaders_shooting", self.handle_invaders_shooting),
+            ("move_invaders", self.move_invaders),
+            ("move_bullets", lambda: self.move_bullets(dt)),
+            (
+                "handle_bullets_collisions",
+                lambda: self.handle_bullets_collisions(self.bullets_destroy_bullets),
+            ),
+            ("handle_level_up", self.handle_level_up),
+            ("collect_garbage", self.collect_garbage),
+        )
+
+    def publish(self) -> WorldSnapshot:
+        """Store an immutable copy of the current state in <snapshot>.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            WorldSnapshot: published snapshot
+        """
+
+        self.snapshot = self.take_snapshot()
+        return self.snapshot
+
+    def take_snapshot(self) -> WorldSnapshot:
+        return WorldSnapshot(
+            tick=self.tick,
+            time=self.time,
+            score=self.score,
+            lifes=self.lifes,
+            level=self.level,
+            game_over=self.game_over,
+            user=(self.user.x, self.user.y),
+            invaders=tuple((invader.x, invader.y) for invader in self.formation),
+            bullets=tuple(
+                (bullet.x, bullet.y, bullet.heading) for bullet in self.bullets
+            ),
+            fortresses=tuple(
+                (fortress.x, fortress.y, fortress.lifes) for fortress in self.fortresses
+            ),
+        )
+
+    # MOVEMENTS
+    def move_user(self, step: numeric) -> None:
+        """Move the user sideways by <step> if the target stays on the screen.
+        Steps are shortened to the distance left of <user_travel>, which every step
+        of the world sets to the distance the user may travel within the step.
+
+        Keyword arguments:
+        argument -- description
+            step (numeric): signed length of the step
+        Return: return_description
+            None
+        """
+
+        step = max(-self.user_travel, min(step, self.user_travel))
+        x = self.user.x + step
+        if step and Screen.LEFT_LIMIT_FOR_OBJECTS < x < Screen.RIGHT_LIMIT_FOR_OBJECTS:
+            self.user.x = x
+            self.user_travel -= abs(step)
+            self.emit(WorldEvent.MOVE, self.user)
+
+    def move_invaders(self, sidestep: numeric = 15, forward_step: numeric = 30) -> None:
+        """Handle movement of invaders.
+        Paramers define length of each movement for all objects. Invaders move from
+        left to right until the screen boarder. Then they step towards the user and
+        change movement direction.
+
+        Method has a colddown.
+
+        Keyword arguments:
+        argument -- description
+            sidestep (numeric): length of the sidestep
+            forward_step (numeric): length of the forward step
+        Return: return_description
+            None
+        """
+
+        if (
+            self.time - self.cooldown_invaders_last_move
+            < self.cooldown_invaders_movement
+        ):
+            return
+        self.cooldown_invaders_last_move = self.time
+        direction = self.invaders_movement_direction
+        edge = self.formation.edge(direction)
+        if edge is None:
+            logger.debug("Missing invaders.")
+            logger.debug("Asume a level up...")
+            self.level_up = True
+            return
+        if (
+            Screen.LEFT_LIMIT_FOR_OBJECTS
+            < edge.x + sidestep * direction
+            < Screen.RIGHT_LIMIT_FOR_OBJECTS
+        ):
+            self.formation.move(sidestep * direction, 0)
+        else:
+            self.invaders_movement_direction *= -1
+            self.formation.move(0, -forward_step)
+        for invader in self.formation:
+            self.index.update(invader)
+        self.emit(WorldEvent.FORMATION, self.formation)
+
+    def move_bullets(self, dt: numeric = SIMULATION_STEP) -> None:
+        """Handle movements of the bullets.
+        Bullets travel 1 px per <cooldown_bullet_movement> seconds, so the length
+        of the step depends only on the elapsed time <dt>.
+
+        Keyword arguments:
+        argument -- description
+            dt (numeric): elapsed time in seconds
+        Return: return_description
+            None
+        """
+
+        # cooldown shrinks with every level, limit the speed to 1 px per ms
+        step = dt / max(self.cooldown_bullet_movement, 0.001)
+        for bullet in self.bullets:
+            bullet.move(step)
+            self.emit(WorldEvent.MOVE, bullet)
+
+    # SHOOTING
+    def add_bullet(self, bullet: BulletState) -> None:
+        bullet.handle = self.bullets.insert(bullet)
+        self.emit(WorldEvent.SPAWN, bullet)
+
+    def handle_invaders_shooting(self) -> None:
+        """Make invaders to shoot automaticaly.
+        Find the lowest invader in a random non empty column and let it shoot.
+        Shoots have a cooldown.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if (
+            self.time - self.cooldown_invaders_last_shoot
+            < self.cooldown_invaders_shoot
+        ):
+            return
+        invader = self.formation.shooter(self.random)
+        if invader is None:
+            return
+        self.add_bullet(
+            BulletState(invader.x, invader.y, invader.heading, invader.color)
+        )
+        self.cooldown_invaders_last_shoot = self.time
+
+    @property
+    def can_user_shoot(self) -> bool:
+        return self.time - self.cooldown_user_last_shoot > self.cooldown_user_shoot
+
+    def handle_user_shooting(self, time_interval: numeric | None = None) -> None:
+        """Handle user's shooting process.
+
+        Keyword arguments:
+        argument -- description
+            time_interval (numeric | None): minimal time between two shots,
+                <cooldown_user_shoot> by default
+        Return: return_description
+            None
+        """
+
+        if time_interval is None:
+            time_interval = self.cooldown_user_shoot
+        if self.time - self.cooldown_user_last_shoot > time_interval:
+            user = self.user
+            self.add_bullet(BulletState(user.x, user.y, user.heading, user.color))
+            self.cooldown_user_last_shoot = self.time
+            self.shots += 1
+
+    # CHECKS
+    def handle_bullets_collisions(self, bullets_destroy_bullets: bool = True) -> None:
+        """Handle bullet's collisions.
+        Every bullet is swept along its last move, so a bullet hits everything its
+        path touches however long the step was. Contacts of all bullets are
+        resolved in the order they happened within the step. Bullets and invaders
+        disappear, user's and fortresses life points reduses. Parameter
+        <bullets_destroy_bullets> configurates behaviour of the bullets when they
+        are close to each other. Bullets leaving the screen are destroyed.
+
+        Keyword arguments:
+        argument -- description
+            bullets_destroy_bullets (bool): flag
+        Return: return_description
+            None
+        """
+
+        bullets = [bullet for bullet in self.bullets if bullet.alive]
+        if len(bullets) == 0:
+            return
+        if self.vectorized:
+            contacts = self.find_contacts_vectorized(bullets)
+        else:
+            contacts = self.find_contacts(bullets)
+        if bullets_destroy_bullets:
+            contacts.extend(self.find_bullet_contacts(bullets))
+        contacts.sort(key=lambda contact: contact[:4])
+        for contact in contacts:
+            if self.resolve_contact(contact):
+                return
+        for bullet in bullets:
+            if bullet.alive and not -Screen.HEIGHT / 2 <= bullet.y <= Screen.HEIGHT / 2:
+                self.destroy(bullet)
+
+    @staticmethod
+    def sweep(bullet: BulletState, target: Body) -> float | None:
+        """Return when a bullet touched a target during their last moves.
+
+        Keyword arguments:
+        argument -- description
+            bullet (BulletState): moving bullet
+            target (Body): static object or another bullet
+        Return: return_description
+            float | None: fraction of the move, None without contact
+        """
+
+        x, y = target.x, target.y
+        if isinstance(target, BulletState):
+            last_x, last_y = target.last_x, target.last_y
+        else:
+            last_x, last_y = x, y
+        return time_of_impact(
+            bullet.last_x - last_x,
+            bullet.last_y - last_y,
+            (bullet.x - bullet.last_x) - (x - last_x),
+            (bullet.y - bullet.last_y) - (y - last_y),
+            bullet.radius + target.radius,
+        )
+
+    def find_contacts(self, bullets: list[BulletState]) -> list[Contact]:
+        """Find contacts of bullets with the user, fortresses and invaders. Only
+        objects registered in the cells of the spatial index around the path of a
+        bullet are tested.
+
+        Keyword arguments:
+        argument -- description
+            bullets (list[BulletState]): alive bullets
+        Return: return_description
+            list[Contact]: unordered contacts
+        """
+
+        user = self.user
+        contacts: list[Contact] = []
+        for order, bullet in enumerate(bullets):
+            if bullet.heading != user.heading:
+                time = self.sweep(bullet, user)
+                if time is not None:
+                    contacts.append(
+                        Contact(time, order, ContactKind.USER, (0,), bullet, user)
+                    )
+            dx = bullet.x - bullet.last_x
+            dy = bullet.y - bullet.last_y
+            for item in self.index.query(
+                bullet.last_x + dx / 2,
+                bullet.last_y + dy / 2,
+                (abs(dx) + abs(dy)) / 2 + bullet.radius,
+            ):
+                match item:
+                    case FortressState():
+                        kind, rank = ContactKind.FORTRESS, (item.handle.index,)
+                    case InvaderState() if item.heading != bullet.heading:
+                        kind, rank = ContactKind.INVADER, item.slot
+                    case _:
+                        continue
+                time = self.sweep(bullet, item)
+                if time is not None:
+                    contacts.append(Contact(time, order, kind, rank, bullet, item))
+        return contacts
+
+    def find_contacts_vectorized(self, bullets: list[BulletState]) -> list[Contact]:
+        """Find the same contacts as find_contacts() with all sweeps done in one
+        batch. Bullets and targets are packed once per call. Requires NumPy.
+
+        Keyword arguments:
+        argument -- description
+            bullets (list[BulletState]): alive bullets
+        Return: return_description
+            list[Contact]: unordered contacts
+        """
+
+        user = self.user
+        fortresses = [fortress for fortress in self.fortresses if fortress.alive]
+        invaders = [invader for invader in self.formation if invader.alive]
+        targets: list[Body] = [user, *fortresses, *invaders]
+        first_invader = 1 + len(fortresses)
+        contacts: list[Contact] = []
+        for time, i, j in find_impacts(pack_paths(bullets), pack(targets)):
+            bullet, target = bullets[i], targets[j]
+            if j >= first_invader:
+                if target.heading != bullet.heading:
+                    contacts.append(
+                        Contact(
+                            time, i, ContactKind.INVADER, target.slot, bullet, target
+                        )
+                    )
+            elif j > 0:
+                contacts.append(
+                    Contact(
+                        time,
+                        i,
+                        ContactKind.FORTRESS,
+                        (target.handle.index,),
+                        bullet,
+                        target,
+                    )
+                )
+            elif bullet.heading != user.heading:
+                contacts.append(Contact(time, i, ContactKind.USER, (0,), bullet, user))
+        return contacts
+
+    def find_bullet_contacts(self, bullets: list[BulletState]) -> list[Contact]:
+        """Find contacts between bullets flying towards each other. Only pairs of
+        opposite bullets whose x extents overlap are swept.
+
+        Keyword arguments:
+        argument -- description
+            bullets (list[BulletState]): alive bullets
+        Return: return_description
+            list[Contact]: unordered contacts
+        """
+
+        north = [
+            order
+            for order, bullet in enumerate(bullets)
+            if bullet.heading == ObjectDirection.NORTH
+        ]
+        south = [
+            order
+            for order, bullet in enumerate(bullets)
+            if bullet.heading != ObjectDirection.NORTH
+        ]
+        contacts: list[Contact] = []
+        for i, j in overlapping_pairs(
+            [bullets[order] for order in north], [bullets[order] for order in south]
+        ):
+            first, second = sorted((north[i], south[j]))
+            time = self.sweep(bullets[first], bullets[second])
+            if time is not None:
+                contacts.append(
+                    Contact(
+                        time,
+                        first,
+                        ContactKind.BULLET,
+                        (second,),
+                        bullets[first],
+                        bullets[second],
+                    )
+                )
+        return contacts
+
+    def resolve_contact(self, contact: Contact) -> bool:
+        """Apply the effect of a contact unless bullet or target were destroyed by
+        an earlier contact.
+
+        Keyword arguments:
+        argument -- description
+            contact (Contact): contact to resolve
+        Return: return_description
+            bool: True when the user was hit and all bullets are removed
+        """
+
+        bullet, target = contact.bullet, contact.target
+        if not bullet.alive or not target.alive:
+            return False
+        match contact.kind:
+            case ContactKind.USER:
+                self.hit_user(bullet)
+                return True
+            case ContactKind.FORTRESS:
+                self.hit_fortress(target, bullet)
+            case ContactKind.INVADER:
+                self.hit_invader(target, bullet)
+            case ContactKind.BULLET:
+                self.hit_bullet(target, bullet)
+        return False
+
+    def hit_user(self, bullet: BulletState) -> None:
+        logger.debug("Bullet hit user (%s, %s)", bullet.x, bullet.y)
+        self.lifes -= 1
+        self.emit(WorldEvent.LIFES, self)
+        self.mark_all_bullets_for_removal()
+
+    def hit_fortress(self, fortress: FortressState, bullet: BulletState) -> None:
+        logger.debug("Bullet hit fortress (%s, %s)", bullet.x, bullet.y)
+        self.destroy(bullet)
+        fortress.hit()
+        self.emit(WorldEvent.HIT, fortress)
+        if fortress.lifes <= 0:
+            self.destroy(fortress)
+
+    def hit_invader(self, invader: InvaderState, bullet: BulletState) -> None:
+        logger.debug("Bullet hit invader (%s, %s)", bullet.x, bullet.y)
+        self.destroy(invader)
+        self.destroy(bullet)
+        self.hits += 1
+        self.score += 1
+        self.emit(WorldEvent.SCORE, self)
+
+    def hit_bullet(self, other_bullet: BulletState, bullet: BulletState) -> None:
+        logger.debug("Bullet hit bullet (%s, %s)", bullet.x, bullet.y)
+        self.destroy(other_bullet)
+        self.destroy(bullet)
+
+    def check_lifes_left(self) -> bool:
+        """Method checks that user have enough life points to continue game.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            Returns True when user have more then 0 life points otherwise False.
+        """
+
+        if self.lifes <= 0:
+            logger.info("User lost all life points")
+            return False
+        return True
+
+    def check_invaders_pass(self, y_cor: numeric = -280) -> bool:
+        """Methode checks if invaders pass certain y coordinate and win. Coordinate is
+        defined by parameter <y_cor>.
+
+        Keyword arguments:
+        argument -- description
+            y_cor (numeric): cordinate that invaders must pass to win the game
+        Return: return_description
+            Returns True when first invader passed the <y_cor> otherwise False.
+        """
+
+        bottom = self.formation.bottom
+        return bottom is not None and bottom.y <= y_cor
+
+    @property
+    def game_over(self) -> bool:
+        return self.check_invaders_pass() or not self.check_lifes_left()
+
+    # UPDATE GAME STATE
+    def reduce_cooldown(
+        self,
+        bullet_movement: float = 0.001,
+        inverders_movement: float = 0.03,
+        user_shoot: float = 0.009,
+    ) -> None:
+        """Change cooldown values so the game seems to run faster.
+
+        Arguments:
+        argument -- description
+            bullet_movement (float): amount to reduce cooldown for bullet movement
+            inverders_movement (float): amount to reduce cooldown for invaders movement
+            user_shoot (float): amount to reduce cooldown for user shooting
+        Return: return_description
+            None
+        """
+
+        self.cooldown_bullet_movement += (
+            -bullet_movement if bullet_movement > 0 else bullet_movement
+        )
+        self.cooldown_invaders_movement += (
+            -inverders_movement if inverders_movement > 0 else inverders_movement
+        )
+        self.cooldown_user_shoot += -user_shoot if user_shoot > 0 else user_shoot
+
+    def handle_level_up(self) -> None:
+        """Orcastrate tasks that are neccessary to start next game level.
+
+        Keyword arguments:
+        argument -- description
+        Return: return_description
+            None
+        """
+
+        if self.level_up:
+            self.level_up = False
+            logger.debug("Updating level")
+            self.mark_all_bullets_for_removal()
+            self.level += 1
+            self.emit(WorldEvent.LEVEL, self)
+            difficulty = self.difficulty
+            self.initialize_invaders(num_rows=difficulty.invader_rows)
+            self.reduce_cooldown(
+                difficulty.reduce_bullet_movement,
+                difficulty.reduce_invaders_movement,
+                difficulty.reduce_user_shoot,
+            )
+            logger.debug("Updated level")